@@ -0,0 +1,61 @@
+"""Measures the cold import cost of every tool exported by griptape.tools.
+
+Each import runs in a fresh interpreter so that modules cached by previous imports don't skew the results.
+
+    python benchmarks/import_time.py --repeat 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMER_SCRIPT = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def time_statement(statement: str, repeat: int) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER_SCRIPT.format(statement=statement)],
+            check=True,
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True
+        ).stdout
+
+        timings.append(float(output.strip().splitlines()[-1]))
+
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="number of fresh interpreters per measurement")
+    parser.add_argument("tools", nargs="*", help="tool class names to measure; defaults to all of them")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT_DIR)
+
+    from griptape.tools import __all__ as tool_names
+
+    package_time = time_statement("import griptape.tools", args.repeat)
+
+    print(f"{'import griptape.tools':<50}{package_time * 1000:>10.1f} ms")
+
+    for tool_name in args.tools or sorted(tool_names):
+        tool_time = time_statement(f"from griptape.tools import {tool_name}", args.repeat)
+
+        print(f"{'from griptape.tools import ' + tool_name:<50}{tool_time * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Measures indexing throughput and query latency of LocalIndexSearchDriver on a synthetic corpus.
+
+Runs entirely offline against a temporary index file.
+
+    python benchmarks/local_search.py --documents 20000 --queries 500
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=10_000, help="number of documents to index")
+    parser.add_argument("--words", type=int, default=300, help="number of words per document")
+    parser.add_argument("--vocabulary", type=int, default=50_000, help="number of distinct words in the corpus")
+    parser.add_argument("--queries", type=int, default=200, help="number of queries to time")
+    parser.add_argument("--results", type=int, default=10, help="number of results per query")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT_DIR)
+
+    from griptape.tools.web_search.drivers import LocalIndexSearchDriver
+
+    rng = random.Random(args.seed)
+    vocabulary = [f"w{i}" for i in range(args.vocabulary)]
+    # Zipf-like word frequencies so that postings lists have realistic lengths
+    weights = [1 / (i + 1) for i in range(args.vocabulary)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        driver = LocalIndexSearchDriver(path=os.path.join(temp_dir, "index.db"))
+        documents = (
+            {"url": f"https://example.com/{i}", "text": " ".join(rng.choices(vocabulary, weights, k=args.words))}
+            for i in range(args.documents)
+        )
+
+        start = time.perf_counter()
+        driver.add_documents(documents)
+        index_time = time.perf_counter() - start
+
+        queries = [" ".join(rng.choices(vocabulary, weights, k=rng.randint(1, 4))) for _ in range(args.queries)]
+        timings = []
+
+        for query in queries:
+            start = time.perf_counter()
+            driver.search(query, args.results)
+            timings.append(time.perf_counter() - start)
+
+        index_size = os.path.getsize(os.path.join(temp_dir, "index.db"))
+
+    timings.sort()
+
+    print(f"indexed {args.documents} documents in {index_time:.2f}s ({args.documents / index_time:.0f} docs/s)")
+    print(f"index size: {index_size / 1024 / 1024:.1f} MB")
+    print(f"query latency p50: {statistics.median(timings) * 1000:.2f} ms")
+    print(f"query latency p95: {timings[int(len(timings) * 0.95) - 1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
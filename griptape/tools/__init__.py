@@ -1,21 +1,52 @@
-from .calculator.tool import Calculator
-from .web_search.tool import WebSearch
-from .web_scraper.tool import WebScraper
-from .sql_client.tool import SqlClient
-from .email_client.tool import EmailClient
-from .rest_api_client.tool import RestApiClient
-from .file_manager.tool import FileManager
-from .vector_store_client.tool import VectorStoreClient
-from .date_time.tool import DateTime
-from .tool_output_processor.tool import ToolOutputProcessor
-from .base_aws_client import BaseAwsClient
-from .aws_iam_client.tool import AwsIamClient
-from .aws_s3_client.tool import AwsS3Client
-from .computer.tool import Computer
-from .proxycurl_client.tool import ProxycurlClient
-from .base_google_client import BaseGoogleClient
-from .google_gmail.tool import GoogleGmailClient
-from .google_cal.tool import GoogleCalendarClient
+from __future__ import annotations
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .calculator.tool import Calculator
+    from .web_search.tool import WebSearch
+    from .web_scraper.tool import WebScraper
+    from .sql_client.tool import SqlClient
+    from .email_client.tool import EmailClient
+    from .rest_api_client.tool import RestApiClient
+    from .file_manager.tool import FileManager
+    from .vector_store_client.tool import VectorStoreClient
+    from .date_time.tool import DateTime
+    from .tool_output_processor.tool import ToolOutputProcessor
+    from .base_aws_client import BaseAwsClient
+    from .aws_iam_client.tool import AwsIamClient
+    from .aws_s3_client.tool import AwsS3Client
+    from .computer.tool import Computer
+    from .proxycurl_client.tool import ProxycurlClient
+    from .base_google_client import BaseGoogleClient
+    from .google_gmail.tool import GoogleGmailClient
+    from .google_cal.tool import GoogleCalendarClient
+    from .tool_registry import ToolManifest, ToolRegistry
+
+# Tool modules are imported on first attribute access so that importing one tool doesn't pull in the
+# dependencies of every other tool (docker, boto3, etc.).
+_LAZY_IMPORTS = {
+    "Calculator": ".calculator.tool",
+    "WebSearch": ".web_search.tool",
+    "WebScraper": ".web_scraper.tool",
+    "SqlClient": ".sql_client.tool",
+    "EmailClient": ".email_client.tool",
+    "RestApiClient": ".rest_api_client.tool",
+    "FileManager": ".file_manager.tool",
+    "VectorStoreClient": ".vector_store_client.tool",
+    "DateTime": ".date_time.tool",
+    "ToolOutputProcessor": ".tool_output_processor.tool",
+    "BaseAwsClient": ".base_aws_client",
+    "AwsIamClient": ".aws_iam_client.tool",
+    "AwsS3Client": ".aws_s3_client.tool",
+    "Computer": ".computer.tool",
+    "ProxycurlClient": ".proxycurl_client.tool",
+    "BaseGoogleClient": ".base_google_client",
+    "GoogleGmailClient": ".google_gmail.tool",
+    "GoogleCalendarClient": ".google_cal.tool",
+    "ToolManifest": ".tool_registry",
+    "ToolRegistry": ".tool_registry"
+}
 
 __all__ = [
     "BaseAwsClient",
@@ -35,5 +66,25 @@ __all__ = [
     "DateTime",
     "ToolOutputProcessor",
     "Computer",
-    "ProxycurlClient"
+    "ProxycurlClient",
+    "ToolManifest",
+    "ToolRegistry"
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+
+    # cache the resolved attribute so that __getattr__ is only hit once per name
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
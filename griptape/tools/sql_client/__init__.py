@@ -0,0 +1,7 @@
+from .query_cache import QueryCache
+from .column_table_artifact import ColumnTableArtifact
+
+__all__ = [
+    "QueryCache",
+    "ColumnTableArtifact"
+]
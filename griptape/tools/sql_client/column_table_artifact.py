@@ -0,0 +1,138 @@
+from __future__ import annotations
+import csv
+import io
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence
+from attr import define, field
+from griptape.artifacts import TextArtifact
+
+if TYPE_CHECKING:
+    from griptape.drivers import BaseEmbeddingDriver
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+@define(frozen=True)
+class ColumnTableArtifact(TextArtifact):
+    """Table of query results stored column by column.
+
+    Integer and float columns without nulls are stored in typed arrays, other columns in lists, so a large result is a
+    handful of objects instead of one dict per row. `start` and `stop` make the artifact a view of a row range:
+    slicing shares the columns instead of copying them. CSV text is only rendered when it's needed: for `to_text()`,
+    token counts, embeddings, and serialization.
+    """
+    value: dict[str, Sequence] = field()
+    start: int = field(default=0, kw_only=True)
+    stop: Optional[int] = field(default=None, kw_only=True)
+    delimiter: str = field(default=",", kw_only=True)
+    _embedding: list[float] = field(factory=list, init=False)
+
+    @classmethod
+    def from_rows(cls, column_names: list[str], rows: Iterable[Sequence], **kwargs) -> ColumnTableArtifact:
+        columns = [[] for _ in column_names]
+
+        for row in rows:
+            for column, cell in zip(columns, row):
+                column.append(cell)
+
+        return cls({name: compact_column(column) for name, column in zip(column_names, columns)}, **kwargs)
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self.value.keys())
+
+    @property
+    def size(self) -> int:
+        """Approximate memory held by the columns in bytes, estimated without rendering the table."""
+        size = 0
+
+        for column in self.value.values():
+            if isinstance(column, array):
+                size += column.itemsize * len(column)
+            else:
+                size += sys.getsizeof(column) + sum(sys.getsizeof(cell) for cell in column)
+
+        return size
+
+    @property
+    def row_count(self) -> int:
+        return len(range(*self._bounds()))
+
+    @property
+    def embedding(self) -> Optional[list[float]]:
+        return None if len(self._embedding) == 0 else self._embedding
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | ColumnTableArtifact:
+        start, stop = self._bounds()
+
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("row slices can't have a step")
+
+            view_start, view_stop, _ = index.indices(stop - start)
+
+            return ColumnTableArtifact(
+                self.value,
+                start=start + view_start,
+                stop=start + max(view_start, view_stop),
+                delimiter=self.delimiter,
+                name=self.name
+            )
+        else:
+            row_index = range(start, stop)[index]
+
+            return {name: column[row_index] for name, column in self.value.items()}
+
+    def __add__(self, other: ColumnTableArtifact) -> ColumnTableArtifact:
+        if self.column_names != other.column_names:
+            raise ValueError("tables with different columns can't be concatenated")
+
+        return ColumnTableArtifact.from_rows(
+            self.column_names, [*self.iter_rows(), *other.iter_rows()], delimiter=self.delimiter, name=self.name
+        )
+
+    def iter_rows(self) -> Iterator[tuple]:
+        start, stop = self._bounds()
+
+        return zip(*(column[start:stop] for column in self.value.values()))
+
+    def generate_embedding(self, driver: BaseEmbeddingDriver) -> list[float]:
+        # the inherited method would embed the columns' dict representation, so the CSV text is embedded instead
+        self._embedding.clear()
+        self._embedding.extend(TextArtifact(self.to_text()).generate_embedding(driver))
+
+        return self.embedding
+
+    def token_count(self, tokenizer) -> int:
+        return tokenizer.token_count(self.to_text())
+
+    def to_text(self) -> str:
+        with io.StringIO() as csvfile:
+            writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL, delimiter=self.delimiter, lineterminator="\n")
+
+            writer.writerow(self.column_names)
+            writer.writerows(self.iter_rows())
+
+            return csvfile.getvalue().strip()
+
+    def to_dict(self) -> dict:
+        # serialized as CSV text, so that it can be loaded anywhere text artifacts can
+        return TextArtifact(self.to_text(), id=self.id, name=self.name).to_dict()
+
+    def _bounds(self) -> tuple[int, int]:
+        length = len(next(iter(self.value.values()), ()))
+        stop = length if self.stop is None else min(self.stop, length)
+
+        return min(self.start, stop), stop
+
+
+def compact_column(values: list) -> Sequence:
+    """Returns the values in a typed array if they're all 64-bit integers or all floats, otherwise as is."""
+    if values and all(type(v) is int and INT64_MIN <= v <= INT64_MAX for v in values):
+        return array("q", values)
+    elif values and all(type(v) is float for v in values):
+        return array("d", values)
+    else:
+        return values
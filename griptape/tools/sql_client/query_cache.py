@@ -0,0 +1,159 @@
+from __future__ import annotations
+import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from attr import define, field, Factory
+from griptape.artifacts import BaseArtifact
+from griptape.tools.sql_client.column_table_artifact import ColumnTableArtifact
+
+# string literals and quoted identifiers are kept verbatim, everything else is case and whitespace insensitive
+SQL_TOKEN_PATTERN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|\s+|[^\s'\"`]+|.")
+
+
+def normalize_sql(sql: str) -> str:
+    tokens = []
+
+    for token in SQL_TOKEN_PATTERN.findall(sql.strip().rstrip(";").strip()):
+        if token.isspace():
+            tokens.append(" ")
+        elif token[0] in "'\"`":
+            tokens.append(token)
+        else:
+            tokens.append(token.lower())
+
+    return "".join(tokens)
+
+
+@define
+class CachedResult:
+    artifacts: list[BaseArtifact] | BaseArtifact = field(kw_only=True)
+    table_names: list[str] = field(kw_only=True)
+    version: Optional[str] = field(default=None, kw_only=True)
+    size: int = field(default=0, kw_only=True)
+    stored_at: float = field(default=Factory(lambda: time.time()), kw_only=True)
+
+
+@define
+class QueryCache:
+    """Memory-bounded cache of SQL query results.
+
+    Results are keyed by normalized SQL and the names of the tables they're read from and expire after `ttl` seconds.
+    If `table_version_query` is set, it's run for each table before every lookup with `{table_name}` replaced by the
+    table name, and cached results are only served while the queries return the same values, for example
+    `SELECT MAX(updated_at) FROM {table_name}`. Results can also be dropped explicitly with `invalidate()`. The least
+    recently used results are evicted once the cache holds more than `max_bytes`.
+    """
+    ttl: Optional[float] = field(default=300, kw_only=True)
+    max_bytes: int = field(default=64 * 1024 * 1024, kw_only=True)
+    table_version_query: Optional[str] = field(default=None, kw_only=True)
+    _entries: OrderedDict[str, CachedResult] = field(factory=OrderedDict, init=False)
+    _size: int = field(default=0, init=False)
+    _counters: dict[str, int] = field(
+        default=Factory(lambda: {
+            "hits": 0,
+            "misses": 0,
+            "expirations": 0,
+            "version_changes": 0,
+            "evictions": 0,
+            "invalidations": 0
+        }),
+        init=False
+    )
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._size
+
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+
+        return stats
+
+    @staticmethod
+    def build_key(sql: str, table_names: list[str]) -> str:
+        return json.dumps([table_names, normalize_sql(sql)])
+
+    def get(self, key: str, version: Optional[str] = None) -> Optional[list[BaseArtifact] | BaseArtifact]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._counters["misses"] += 1
+
+                return None
+            elif self.ttl is not None and time.time() - entry.stored_at > self.ttl:
+                self._counters["expirations"] += 1
+            elif entry.version != version:
+                self._counters["version_changes"] += 1
+            else:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+
+                return entry.artifacts
+
+            self._counters["misses"] += 1
+
+            self._remove(key)
+
+            return None
+
+    def put(
+            self,
+            key: str,
+            table_names: list[str],
+            artifacts: list[BaseArtifact] | BaseArtifact,
+            version: Optional[str] = None
+    ) -> None:
+        size = self._estimate_size(artifacts)
+
+        # results that are larger than the cache would evict everything else
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = CachedResult(
+                artifacts=artifacts, table_names=table_names, version=version, size=size
+            )
+            self._size += size
+
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+                self._counters["evictions"] += 1
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """Drops the cached results that read from a table or, if no table is given, all cached results."""
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if table_name is None or table_name.lower() in (name.lower() for name in entry.table_names)
+            ]
+
+            for key in keys:
+                self._remove(key)
+
+            self._counters["invalidations"] += len(keys)
+
+    def _remove(self, key: str) -> None:
+        self._size -= self._entries.pop(key).size
+
+    def _estimate_size(self, artifacts: list[BaseArtifact] | BaseArtifact) -> int:
+        artifacts = artifacts if isinstance(artifacts, list) else [artifacts]
+
+        return sum(
+            # column tables would have to render all their rows as CSV to measure their text
+            (artifact.size if isinstance(artifact, ColumnTableArtifact) else len(artifact.to_text()))
+            + sys.getsizeof(artifact)
+            for artifact in artifacts
+        )
@@ -0,0 +1,177 @@
+from __future__ import annotations
+import json
+import logging
+import re
+from typing import TYPE_CHECKING, Optional
+from griptape.tools.sql_client.query_cache import normalize_sql
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+POSTGRES_COST_PATTERN = re.compile(r"cost=[\d.]+\.\.([\d.]+)")
+POSTGRES_ROWS_PATTERN = re.compile(r"\brows=(\d+)")
+LIMIT_PATTERN = re.compile(
+    r"\blimit\s+(\d+|\?|:\w+)(\s*(,|offset)\s*(\d+|\?|:\w+))?\s*$"
+    r"|\bfetch\s+(first|next)\b"
+    r"|^select\s+(distinct\s+)?top\b"
+)
+# like SQL_TOKEN_PATTERN in query_cache, but with comments as tokens of their own
+SQL_COMMENT_TOKEN_PATTERN = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|--[^\n]*|/\*.*?\*/|\s+|[^\s'\"`/-]+|.", re.DOTALL
+)
+SELECT_PATTERN = re.compile(r"^(?:\s|--[^\n]*|/\*.*?\*/)*select(?:\s+(?:distinct|all)\b)?", re.IGNORECASE | re.DOTALL)
+# engines that support LIMIT; Oracle and SQL Server are handled on their own
+LIMIT_DIALECTS = (
+    "sqlite", "postgresql", "redshift", "mysql", "mariadb", "snowflake", "duckdb", "bigquery", "trino", "presto",
+    "databricks", "hive", "clickhouse", "cockroachdb"
+)
+# full scans of tables without a rowid or statistics are assumed to read this many rows
+SQLITE_DEFAULT_TABLE_ROWS = 1000
+# each indexed lookup is assumed to read this many rows
+SQLITE_SEARCH_ROWS = 10
+
+
+def add_limit(query: str, limit: int, dialect: str) -> str:
+    """Returns the query with a row limit if it's a SELECT that doesn't already limit its result.
+
+    The limit is a LIMIT clause on most engines, FETCH FIRST on Oracle, and TOP on SQL Server, where queries that start
+    with WITH are left as they are. Queries on other engines are never changed.
+    """
+    code, statement = _strip_comments(query)
+    normalized_query = normalize_sql(code)
+    statement = re.sub(r"[\s;]+$", "", statement)
+
+    if dialect not in LIMIT_DIALECTS + ("oracle", "mssql") or not normalized_query.startswith(("select", "with")):
+        return query
+    elif LIMIT_PATTERN.search(normalized_query) or re.search(r"\bfor\s+(update|share)\b", normalized_query):
+        return query
+    elif dialect == "oracle":
+        return f"{statement} FETCH FIRST {limit} ROWS ONLY"
+    elif dialect == "mssql":
+        select = SELECT_PATTERN.match(statement)
+
+        return f"{statement[:select.end()]} TOP {limit}{statement[select.end():]}" if select else query
+    else:
+        return f"{statement} LIMIT {limit}"
+
+
+def _strip_comments(query: str) -> tuple[str, str]:
+    """Returns the query with its comments blanked out, and the query up to the end of its last token.
+
+    Trailing comments are cut off, so that a clause appended to the query isn't commented out, while comments inside
+    the query, such as optimizer hints, are kept.
+    """
+    code_tokens = []
+    position = 0
+    end = 0
+
+    for token in SQL_COMMENT_TOKEN_PATTERN.findall(query):
+        position += len(token)
+
+        if token.startswith(("--", "/*")):
+            code_tokens.append(" ")
+        else:
+            code_tokens.append(token)
+
+            if not token.isspace():
+                end = position
+
+    return "".join(code_tokens), query[:end]
+
+
+def estimate_cost(connection: Connection, query: str, dialect: str) -> Optional[float]:
+    """Returns the planner's cost estimate for a query or None if the engine isn't supported or EXPLAIN fails.
+
+    PostgreSQL and Redshift report the total cost of the plan's root node, MySQL and MariaDB the JSON plan's query cost.
+    SQLite has no cost model, so its estimate is the number of rows the plan reads: full scans multiply by the table's
+    row count and indexed lookups by a small constant, so nested scans from cross joins grow quickly.
+    """
+    from sqlalchemy import text
+
+    query = query.strip().rstrip(";")
+
+    try:
+        if dialect in ("postgresql", "redshift"):
+            plan = connection.execute(text(f"EXPLAIN {query}")).fetchone()
+            match = POSTGRES_COST_PATTERN.search(plan[0]) if plan else None
+
+            return float(match.group(1)) if match else None
+        elif dialect in ("mysql", "mariadb"):
+            plan = connection.execute(text(f"EXPLAIN FORMAT=JSON {query}")).fetchone()
+
+            return float(json.loads(plan[0])["query_block"]["cost_info"]["query_cost"]) if plan else None
+        elif dialect == "sqlite":
+            return _estimate_sqlite_cost(connection, query)
+        else:
+            return None
+    except Exception as e:
+        logging.debug(f"error estimating query cost: {e}")
+
+        return None
+
+
+def estimate_rows(connection: Connection, query: str, dialect: str) -> Optional[int]:
+    """Returns the planner's row estimate for a query or None if the engine isn't supported or EXPLAIN fails.
+
+    Only PostgreSQL and Redshift are supported: the rows of their plan's root node are the rows of the result.
+    """
+    from sqlalchemy import text
+
+    if dialect not in ("postgresql", "redshift"):
+        return None
+
+    try:
+        plan = connection.execute(text(f"EXPLAIN {query.strip().rstrip(';')}")).fetchone()
+        match = POSTGRES_ROWS_PATTERN.search(plan[0]) if plan else None
+
+        return int(match.group(1)) if match else None
+    except Exception as e:
+        logging.debug(f"error estimating query rows: {e}")
+
+        return None
+
+
+def _estimate_sqlite_cost(connection: Connection, query: str) -> float:
+    from sqlalchemy import text
+
+    table_names = {
+        name.lower() for name, in connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))
+    }
+    cost = 1.0
+
+    for row in connection.execute(text(f"EXPLAIN QUERY PLAN {query}")):
+        detail = row[-1]
+        scan = re.match(r"SCAN (?:TABLE )?(\w+)", detail)
+
+        if scan and "INDEX" not in detail:
+            table_name = _resolve_sqlite_alias(scan.group(1), query, table_names)
+
+            cost *= max(1, _sqlite_table_rows(connection, table_name) if table_name else SQLITE_DEFAULT_TABLE_ROWS)
+        elif scan or detail.startswith("SEARCH"):
+            cost *= SQLITE_SEARCH_ROWS
+
+    return cost
+
+
+def _resolve_sqlite_alias(name: str, query: str, table_names: set[str]) -> Optional[str]:
+    # query plans name tables by their alias
+    if name.lower() in table_names:
+        return name
+
+    for match in re.finditer(rf"\b(\w+)\s+(?:as\s+)?{re.escape(name)}\b", query, re.IGNORECASE):
+        if match.group(1).lower() in table_names:
+            return match.group(1)
+
+    return None
+
+
+def _sqlite_table_rows(connection: Connection, table_name: str) -> int:
+    from sqlalchemy import text
+
+    try:
+        # the largest rowid is read from the end of the table's b-tree, so it doesn't scan the table
+        rows = connection.execute(text(f'SELECT MAX(rowid) FROM "{table_name}"')).scalar()
+
+        return rows if rows is not None else 0
+    except Exception:
+        return SQLITE_DEFAULT_TABLE_ROWS
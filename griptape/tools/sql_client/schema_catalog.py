@@ -0,0 +1,112 @@
+from __future__ import annotations
+import threading
+from typing import TYPE_CHECKING, Optional
+from attr import define, field, Factory
+
+if TYPE_CHECKING:
+    from griptape.drivers import BaseSqlDriver
+
+SQLITE_COLUMNS_QUERY = """
+SELECT m.name, p.name, p.type
+FROM sqlite_master m JOIN pragma_table_info(m.name) p
+WHERE m.type IN ('table', 'view') AND LOWER(m.name) IN :table_names
+ORDER BY m.name, p.cid
+"""
+
+INFORMATION_SCHEMA_COLUMNS_QUERY = """
+SELECT table_name, column_name, data_type
+FROM information_schema.columns
+WHERE LOWER(table_name) IN :table_names{schema_filter}
+ORDER BY table_name, ordinal_position
+"""
+
+CURRENT_SCHEMA_FUNCTIONS = {
+    "postgresql": "current_schema()",
+    "redshift": "current_schema()",
+    "snowflake": "current_schema()",
+    "mysql": "DATABASE()",
+    "mariadb": "DATABASE()"
+}
+
+
+@define
+class SchemaCatalog:
+    """Loads and caches table schemas.
+
+    Schemas are loaded on first use, and all tables that aren't cached yet are loaded together with one catalog query:
+    `pragma_table_info` on SQLite and `information_schema.columns` everywhere else. Drivers without a SQLAlchemy engine
+    fall back to `get_table_schema()` for each table.
+    """
+    sql_driver: BaseSqlDriver = field(kw_only=True)
+    schema_name: Optional[str] = field(default=None, kw_only=True)
+    _columns: dict[str, Optional[list[tuple[str, str]]]] = field(factory=dict, init=False)
+    _schemas: dict[str, Optional[str]] = field(factory=dict, init=False)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    def get_schemas(self, table_names: list[str]) -> dict[str, Optional[str]]:
+        """Returns the schemas of the tables, or None for tables that don't exist."""
+        with self._lock:
+            missing_table_names = [name for name in dict.fromkeys(table_names) if name not in self._schemas]
+
+            if missing_table_names:
+                self._schemas.update(self._load_schemas(missing_table_names))
+
+            return {name: self._schemas[name] for name in table_names}
+
+    def get_columns(self, table_names: list[str]) -> dict[str, Optional[list[tuple[str, str]]]]:
+        """Returns the names and types of the tables' columns, or None for tables that don't exist.
+
+        Column types are only known for drivers with a SQLAlchemy engine.
+        """
+        self.get_schemas(table_names)
+
+        with self._lock:
+            return {name: self._columns.get(name) for name in table_names}
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._columns.clear()
+            self._schemas.clear()
+
+    def _load_schemas(self, table_names: list[str]) -> dict[str, Optional[str]]:
+        if not hasattr(self.sql_driver, "engine"):
+            return {
+                name: self.sql_driver.get_table_schema(name, schema=self.schema_name) for name in table_names
+            }
+
+        columns = self._load_columns(table_names)
+
+        self._columns.update(columns)
+
+        return {
+            name: f"{name}({', '.join(f'{c} {t}'.strip() for c, t in columns[name])})" if columns[name] else None
+            for name in table_names
+        }
+
+    def _load_columns(self, table_names: list[str]) -> dict[str, Optional[list[tuple[str, str]]]]:
+        from sqlalchemy import bindparam, text
+
+        engine = self.sql_driver.engine
+        params = {"table_names": [name.lower() for name in table_names]}
+
+        if engine.dialect.name == "sqlite":
+            query = SQLITE_COLUMNS_QUERY
+        elif self.schema_name:
+            query = INFORMATION_SCHEMA_COLUMNS_QUERY.format(schema_filter=" AND LOWER(table_schema) = :schema_name")
+            params["schema_name"] = self.schema_name.lower()
+        elif engine.dialect.name in CURRENT_SCHEMA_FUNCTIONS:
+            query = INFORMATION_SCHEMA_COLUMNS_QUERY.format(
+                schema_filter=f" AND table_schema = {CURRENT_SCHEMA_FUNCTIONS[engine.dialect.name]}"
+            )
+        else:
+            query = INFORMATION_SCHEMA_COLUMNS_QUERY.format(schema_filter="")
+
+        columns = {}
+
+        with engine.connect() as connection:
+            rows = connection.execute(text(query).bindparams(bindparam("table_names", expanding=True)), params)
+
+            for table_name, column_name, column_type in rows:
+                columns.setdefault(table_name.lower(), []).append((column_name, column_type or ""))
+
+        return {name: columns.get(name.lower()) for name in table_names}
@@ -0,0 +1,90 @@
+from __future__ import annotations
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+# SQLite calls the progress handler every this many virtual machine instructions
+SQLITE_PROGRESS_INSTRUCTIONS = 1000
+
+
+@contextmanager
+def statement_timeout(
+        connection: Connection,
+        timeout: Optional[float],
+        cancel: Callable[[Any], None]
+) -> Iterator[None]:
+    """Aborts the statements run on a connection within the block once `timeout` seconds have passed.
+
+    The engine's own statement timeout is used where there is one: `statement_timeout` on PostgreSQL and Redshift,
+    `max_execution_time` on MySQL and MariaDB, and a progress handler on SQLite. Other engines get a timer that calls
+    `cancel` with the DBAPI connection, and so does any engine whose timeout can't be set.
+    """
+    if not timeout:
+        yield
+        return
+
+    from sqlalchemy import text
+
+    dialect = connection.dialect.name
+    dbapi_connection = connection.connection.dbapi_connection
+    milliseconds = max(1, int(timeout * 1000))
+    reset_statement = None
+    timer = None
+
+    try:
+        if dialect == "postgresql":
+            # only lasts until the end of the transaction
+            connection.execute(text(f"SET LOCAL statement_timeout = {milliseconds}"))
+        elif dialect == "redshift":
+            connection.execute(text(f"SET statement_timeout TO {milliseconds}"))
+
+            reset_statement = "RESET statement_timeout"
+        elif dialect in ("mysql", "mariadb"):
+            variable = "max_statement_time" if dialect == "mariadb" else "max_execution_time"
+            value = timeout if dialect == "mariadb" else milliseconds
+
+            connection.execute(text(f"SET SESSION {variable} = {value}"))
+
+            reset_statement = f"SET SESSION {variable} = DEFAULT"
+        elif hasattr(dbapi_connection, "set_progress_handler"):
+            deadline = time.monotonic() + timeout
+
+            dbapi_connection.set_progress_handler(
+                lambda: int(time.monotonic() > deadline), SQLITE_PROGRESS_INSTRUCTIONS
+            )
+        else:
+            timer = _start_timer(timeout, cancel, dbapi_connection)
+    except Exception as e:
+        logging.warning(f"error setting statement timeout, falling back to cancelling the query: {e}")
+
+        timer = _start_timer(timeout, cancel, dbapi_connection)
+
+    try:
+        yield
+    finally:
+        if timer is not None:
+            timer.cancel()
+
+        if hasattr(dbapi_connection, "set_progress_handler"):
+            dbapi_connection.set_progress_handler(None, 0)
+
+        if reset_statement is not None:
+            try:
+                # session settings would otherwise stay on the pooled connection
+                connection.execute(text(reset_statement))
+            except Exception as e:
+                logging.warning(f"error resetting statement timeout: {e}")
+
+
+def _start_timer(timeout: float, cancel: Callable[[Any], None], dbapi_connection: Any) -> threading.Timer:
+    timer = threading.Timer(timeout, cancel, [dbapi_connection])
+    timer.daemon = True
+
+    timer.start()
+
+    return timer
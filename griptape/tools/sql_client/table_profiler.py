@@ -0,0 +1,209 @@
+from __future__ import annotations
+import re
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from griptape.tools.sql_client.column_table_artifact import ColumnTableArtifact
+from griptape.tools.sql_client.statement_timeout import statement_timeout
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine
+
+NUMERIC_TYPE_PATTERN = re.compile(r"int|real|floa|doub|num|dec|money", re.IGNORECASE)
+# types with MIN and MAX on every engine: numbers, strings, and dates and times, but not booleans, JSON, or arrays
+ORDERED_TYPE_PATTERN = re.compile(r"int|real|floa|doub|num|dec|money|char|text|string|date|time|year", re.IGNORECASE)
+# types that can't be compared for equality, which COUNT(DISTINCT) needs, on at least one engine
+UNCOMPARABLE_TYPE_PATTERN = re.compile(
+    r"^json$|xml|array|\[\]|user-defined|geometry|geography|point|polygon|tsvector", re.IGNORECASE
+)
+# block samples read about this many times more rows than the sample needs, so that they rarely come up short
+SAMPLE_OVERSAMPLING = 10
+# row filters keep about this many times more rows than the sample needs, so that the scan stops about halfway through
+# the table instead of always sampling from its first rows
+FILTER_OVERSAMPLING = 2
+# masks the sign bit off SQLite's RANDOM(), since ABS() raises an overflow error on the smallest integer
+INT63_MAX = 2 ** 63 - 1
+# functions that return a different random value for every row, for shuffling small tables
+RANDOM_FUNCTIONS = {
+    "sqlite": "RANDOM()",
+    "postgresql": "RANDOM()",
+    "redshift": "RANDOM()",
+    "snowflake": "RANDOM()",
+    "duckdb": "RANDOM()",
+    "mysql": "RAND()",
+    "mariadb": "RAND()",
+    "mssql": "NEWID()",
+    "oracle": "DBMS_RANDOM.VALUE"
+}
+
+
+def profile_table(
+        engine: Engine,
+        table_name: str,
+        columns: list[tuple[str, str]],
+        schema_name: Optional[str] = None,
+        sample_size: int = 5,
+        distinct_counts: bool = True,
+        timeout: Optional[float] = None,
+        cancel: Optional[Callable[[Any], None]] = None
+) -> str:
+    """Returns per-column statistics and a sample of a table as text.
+
+    Statistics are computed by the database with one aggregate query, with MIN, MAX, AVG, and COUNT(DISTINCT) only on
+    the column types that support them. The sample is a random sample drawn with the engine's own sampling, see
+    `_sample()`, so large tables are never sorted and only the summary and `sample_size` rows are transferred. Engines
+    without cheap sampling get the first rows of the table, which are labeled as such. Both queries are aborted after
+    `timeout` seconds, see `statement_timeout()`.
+    """
+    from sqlalchemy import text
+
+    dialect = engine.dialect.name
+    quote = engine.dialect.identifier_preparer.quote
+    table = f"{quote(schema_name)}.{quote(table_name)}" if schema_name else quote(table_name)
+    aggregates = ["COUNT(*)"]
+
+    for name, column_type in columns:
+        aggregates.extend(_column_aggregates(quote(name), column_type, dialect, distinct_counts))
+
+    with engine.begin() as connection:
+        with statement_timeout(connection, timeout, cancel or (lambda _: None)):
+            stats = connection.execute(text(f"SELECT {', '.join(aggregates)} FROM {table}")).fetchone()
+
+            if sample_size > 0:
+                sample_column_names, sample, random_sample = _sample(connection, table, dialect, sample_size, stats[0])
+            else:
+                sample = []
+
+    row_count = stats[0]
+    stats_rows = []
+
+    for i, (name, column_type) in enumerate(columns):
+        non_null, distinct, minimum, maximum, mean = stats[1 + i * 5:6 + i * 5]
+
+        stats_rows.append((
+            name,
+            column_type,
+            _format(1 - non_null / row_count) if row_count else "",
+            "" if distinct is None else distinct,
+            _format(minimum),
+            _format(maximum),
+            _format(mean)
+        ))
+
+    stats_table = ColumnTableArtifact.from_rows(
+        ["column", "type", "null_rate", "distinct", "min", "max", "mean"], stats_rows
+    )
+    lines = [f"table {table_name}: {row_count} rows", stats_table.to_text()]
+
+    if sample:
+        sample_table = ColumnTableArtifact.from_rows(sample_column_names, sample)
+
+        label = f"random sample of {len(sample)} rows:" if random_sample else f"first {len(sample)} rows:"
+
+        lines.extend([label, sample_table.to_text()])
+
+    return "\n".join(lines)
+
+
+def _column_aggregates(column: str, column_type: str, dialect: str, distinct_counts: bool) -> list[str]:
+    # SQLite compares values of any type
+    ordered = dialect == "sqlite" or ORDERED_TYPE_PATTERN.search(column_type)
+    comparable = dialect == "sqlite" or not UNCOMPARABLE_TYPE_PATTERN.search(column_type)
+
+    return [
+        f"COUNT({column})",
+        f"COUNT(DISTINCT {column})" if distinct_counts and comparable else "NULL",
+        f"MIN({column})" if ordered else "NULL",
+        f"MAX({column})" if ordered else "NULL",
+        f"AVG({column})" if NUMERIC_TYPE_PATTERN.search(column_type) else "NULL"
+    ]
+
+
+def _sample(
+        connection: Connection, table: str, dialect: str, sample_size: int, row_count: int
+) -> tuple[list[str], list[tuple], bool]:
+    """Returns the column names and rows of a sample of the table, and whether the sample is random.
+
+    Small tables are shuffled in full. Large tables are sampled natively: block samples on PostgreSQL, SQL Server, and
+    Oracle, fixed-size row samples on Snowflake, random rowids on SQLite, and a random row filter on MySQL and MariaDB.
+    A sample that comes up short falls back to a row filter where there is one and to the first rows of the table.
+    """
+    from sqlalchemy import text
+
+    fraction = sample_size * SAMPLE_OVERSAMPLING / row_count if row_count else 1
+    filter_fraction = min(1.0, sample_size * FILTER_OVERSAMPLING / row_count) if row_count else 1
+    queries = []
+
+    if fraction >= 1:
+        if dialect in RANDOM_FUNCTIONS:
+            # the table is at most sample_size * SAMPLE_OVERSAMPLING rows, so sorting it is cheap
+            shuffled_table = f"FROM {table} ORDER BY {RANDOM_FUNCTIONS[dialect]}"
+
+            queries.append((_first_rows(shuffled_table, sample_size, dialect), True))
+    elif dialect == "postgresql":
+        queries.extend([
+            (f"SELECT * FROM {table} TABLESAMPLE SYSTEM ({100 * fraction:.6f}) LIMIT {sample_size}", True),
+            (f"SELECT * FROM {table} WHERE RANDOM() < {filter_fraction:.6f} LIMIT {sample_size}", True)
+        ])
+    elif dialect == "mssql":
+        queries.append(
+            (f"SELECT TOP {sample_size} * FROM {table} TABLESAMPLE SYSTEM ({100 * fraction:.6f} PERCENT)", True)
+        )
+    elif dialect == "oracle":
+        queries.extend([
+            (f"SELECT * FROM {table} SAMPLE BLOCK ({100 * fraction:.6f}) FETCH FIRST {sample_size} ROWS ONLY", True),
+            (f"SELECT * FROM {table} SAMPLE ({100 * fraction:.6f}) FETCH FIRST {sample_size} ROWS ONLY", True)
+        ])
+    elif dialect == "snowflake":
+        queries.append((f"SELECT * FROM {table} SAMPLE ({sample_size} ROWS)", True))
+    elif dialect == "sqlite":
+        # rowids are drawn up to the largest one, which is read from the end of the table's b-tree, and looked up by
+        # the primary key; more rowids than needed are drawn, since deleted rows leave gaps
+        queries.extend([
+            (
+                f"SELECT * FROM {table} WHERE rowid IN ("
+                f"SELECT (RANDOM() & {INT63_MAX}) % (SELECT MAX(rowid) FROM {table}) + 1 "
+                f"FROM {table} LIMIT {sample_size * SAMPLE_OVERSAMPLING}"
+                f") LIMIT {sample_size}",
+                True
+            ),
+            (
+                f"SELECT * FROM {table} WHERE (RANDOM() & {INT63_MAX}) % 1000000 < {int(filter_fraction * 1_000_000)} "
+                f"LIMIT {sample_size}",
+                True
+            )
+        ])
+    elif dialect in ("mysql", "mariadb"):
+        queries.append((f"SELECT * FROM {table} WHERE RAND() < {filter_fraction:.6f} LIMIT {sample_size}", True))
+
+    queries.append((_first_rows(f"FROM {table}", sample_size, dialect), False))
+
+    for query, random_sample in queries:
+        result = connection.execute(text(query))
+        column_names = list(result.keys())
+        rows = [tuple(_format(cell) for cell in row) for row in result.fetchall()]
+
+        # a sample can come up short when the sampled blocks or rows happen to hold few rows
+        if len(rows) >= min(sample_size, row_count):
+            break
+
+    return column_names, rows, random_sample
+
+
+def _first_rows(source: str, row_count: int, dialect: str) -> str:
+    if dialect == "mssql":
+        return f"SELECT TOP {row_count} * {source}"
+    elif dialect == "oracle":
+        return f"SELECT * {source} FETCH FIRST {row_count} ROWS ONLY"
+    else:
+        return f"SELECT * {source} LIMIT {row_count}"
+
+
+def _format(value: Any) -> str:
+    if value is None:
+        return ""
+    elif isinstance(value, float):
+        return f"{value:.4g}"
+    else:
+        text = str(value)
+
+        # long text values would dominate the summary
+        return text if len(text) <= 40 else f"{text[:37]}..."
@@ -1,54 +1,556 @@
 from __future__ import annotations
-from typing import Optional
-from attr import define, field
-from griptape.artifacts import InfoArtifact, CsvRowArtifact
+import json
+import logging
+import threading
+import time
+from concurrent import futures
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import Any, Callable, ContextManager, Iterable, Iterator, Optional, Sequence
+from attr import define, field, Factory
+from griptape.artifacts import BaseArtifact, InfoArtifact, CsvRowArtifact, ErrorArtifact, TextArtifact
 from griptape.core import BaseTool
 from griptape.core.decorators import activity
 from griptape.loaders import SqlLoader
-from schema import Schema
+import schema
+from schema import Schema, Literal
+from griptape.tools.sql_client.column_table_artifact import ColumnTableArtifact
+from griptape.tools.sql_client.query_cache import QueryCache
+from griptape.tools.sql_client.query_planner import add_limit, estimate_cost, estimate_rows
+from griptape.tools.sql_client.schema_catalog import SchemaCatalog
+from griptape.tools.sql_client.statement_timeout import statement_timeout
+from griptape.tools.sql_client.table_profiler import profile_table
 
 
 @define
 class SqlClient(BaseTool):
     sql_loader: SqlLoader = field(kw_only=True)
     schema_name: Optional[str] = field(default=None, kw_only=True)
-    table_name: str = field(kw_only=True)
+    table_name: Optional[str] = field(default=None, kw_only=True)
+    table_names: Optional[list[str]] = field(default=None, kw_only=True)
     table_description: Optional[str] = field(default=None, kw_only=True)
     engine_name: Optional[str] = field(default=None, kw_only=True)
+    max_rows: Optional[int] = field(default=1000, kw_only=True)
+    max_bytes: Optional[int] = field(default=1024 * 1024, kw_only=True)
+    fetch_batch_size: int = field(default=500, kw_only=True)
+    query_cache: Optional[QueryCache] = field(default=None, kw_only=True)
+    max_query_cost: Optional[float] = field(default=None, kw_only=True)
+    auto_limit: bool = field(default=True, kw_only=True)
+    result_format: str = field(default="rows", kw_only=True)
+    max_concurrent_queries: int = field(default=4, kw_only=True)
+    queries_timeout: float = field(default=60, kw_only=True)
+    schema_catalog: SchemaCatalog = field(
+        default=Factory(
+            lambda self: SchemaCatalog(sql_driver=self.sql_loader.sql_driver, schema_name=self.schema_name),
+            takes_self=True
+        ),
+        kw_only=True
+    )
+    profile_sample_size: int = field(default=5, kw_only=True)
+    profile_distinct_counts: bool = field(default=True, kw_only=True)
+    query_timeout: Optional[float] = field(default=None, kw_only=True)
+    report_elapsed_time: bool = field(default=False, kw_only=True)
+    _table_schema: Optional[str] = field(default=None, init=False)
+
+    @table_names.validator
+    def validate_table_names(self, _, table_names: Optional[list[str]]) -> None:
+        if (self.table_name is None) == (table_names is None):
+            raise ValueError("either table_name or table_names has to be set")
+
+    @result_format.validator
+    def validate_result_format(self, _, result_format: str) -> None:
+        if result_format not in ("rows", "columns"):
+            raise ValueError("result_format has to be either 'rows' or 'columns'")
 
     @property
     def full_table_name(self) -> str:
-        return f"{self.schema_name}.{self.table_name}" if self.schema_name else self.table_name
+        return ", ".join(self._qualify(table_name) for table_name in self.table_names or [self.table_name])
 
     @property
     def schema_template_args(self) -> dict:
+        if self.table_names:
+            # schemas are loaded with get_table_schemas, so that only the tables a query needs are described
+            table_schema = None
+        elif self._table_schema is None:
+            table_schema = self._table_schema = self.sql_loader.sql_driver.get_table_schema(
+                self.table_name, schema=self.schema_name
+            )
+        else:
+            table_schema = self._table_schema
+
         return {
             "engine": self.engine_name,
             "table_name": self.full_table_name,
+            "multiple_tables": self.table_names is not None,
             "table_description": self.table_description,
-            "table_schema": self.sql_loader.sql_driver.get_table_schema(self.table_name, schema=self.schema_name)
+            "table_schema": table_schema
         }
 
     @activity(config={
         "description":
             "Can be used to execute{% if engine %} {{ engine }}{% endif %} SQL SELECT queries "
-            "in table {{ table_name }}. "
+            "in {% if multiple_tables %}tables{% else %}table{% endif %} {{ table_name }}. "
             "Make sure the `SELECT` statement contains enough columns to get an answer without knowing "
             "the original question. "
             "Be creative when you use `WHERE` statements: you can use wildcards, `LOWER()`, and other functions "
             "to get better results. "
             "You can use JOINs if more tables are available in other tools.\n"
-            "{{ table_name }} schema: {{ table_schema }}{% if table_description %}\n"
+            "{% if multiple_tables %}Load the schemas of the tables you need with get_table_schemas first."
+            "{% else %}{{ table_name }} schema: {{ table_schema }}{% endif %}{% if table_description %}\n"
             "{{ table_name }} description: {{ table_description }}{% endif %}",
         "schema": Schema({
-            "sql_query": str
+            "sql_query": str,
+            schema.Optional(
+                Literal("timeout", description="Seconds after which the query is cancelled")
+            ): schema.Or(int, float)
         })
     })
-    def execute_query(self, params: dict) -> list[CsvRowArtifact] | InfoArtifact:
+    def execute_query(self, params: dict) -> list[BaseArtifact] | InfoArtifact | ErrorArtifact:
         query = params["values"]["sql_query"]
-        rows = self.sql_loader.load(query)
 
-        if len(rows) > 0:
-            return rows
+        return self._execute(query, timeout=params["values"].get("timeout"))
+
+    @activity(config={
+        "description":
+            "Can be used to execute multiple independent{% if engine %} {{ engine }}{% endif %} SQL SELECT queries "
+            "in {% if multiple_tables %}tables{% else %}table{% endif %} {{ table_name }} at once. "
+            "Results are returned in the order of the queries."
+            "{% if not multiple_tables %} {{ table_name }} schema: {{ table_schema }}{% endif %}",
+        "schema": Schema({
+            "sql_queries": list[str]
+        })
+    })
+    def execute_queries(self, params: dict) -> list[BaseArtifact]:
+        queries = params["values"]["sql_queries"]
+
+        if self._has_thread_bound_connections():
+            # every thread would get its own empty database, so the queries run one after another on this thread
+            return self._execute_sequentially(queries)
+
+        # connections are only registered while their query runs, and registering and cancelling hold the lock, so
+        # a connection is never cancelled after it's been returned to the pool and checked out by another query
+        connections = {}
+        cancelled_queries = set()
+        connections_lock = threading.Lock()
+
+        @contextmanager
+        def bind_connection(i: int, dbapi_connection: Any) -> Iterator[None]:
+            with connections_lock:
+                if i in cancelled_queries:
+                    raise RuntimeError("query was cancelled before it started")
+
+                connections[i] = dbapi_connection
+
+            try:
+                yield
+            finally:
+                with connections_lock:
+                    del connections[i]
+
+        executor = futures.ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrent_queries, len(queries))))
+        query_futures = [
+            executor.submit(self._execute, query, bind_connection=partial(bind_connection, i))
+            for i, query in enumerate(queries)
+        ]
+        artifacts = []
+
+        futures.wait(query_futures, timeout=self.queries_timeout)
+
+        try:
+            for i, (query, future) in enumerate(zip(queries, query_futures)):
+                artifacts.append(InfoArtifact(f"query {i + 1}: {query}"))
+
+                if not future.done():
+                    future.cancel()
+
+                    with connections_lock:
+                        # queries that haven't connected yet stop when they do
+                        cancelled_queries.add(i)
+
+                        self._cancel_query(connections.get(i))
+
+                    artifacts.append(self._queries_timeout_error(i))
+                elif future.exception():
+                    artifacts.append(ErrorArtifact(f"query {i + 1} failed: {future.exception()}"))
+                else:
+                    result = future.result()
+
+                    artifacts.extend(result if isinstance(result, list) else [result])
+        finally:
+            # cancelled queries end with an error on their own threads
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return artifacts
+
+    def _execute_sequentially(self, queries: list[str]) -> list[BaseArtifact]:
+        """Runs the queries one after another on the calling thread, all of them within `queries_timeout` seconds."""
+        deadline = time.monotonic() + self.queries_timeout
+        artifacts = []
+
+        for i, query in enumerate(queries):
+            artifacts.append(InfoArtifact(f"query {i + 1}: {query}"))
+
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                artifacts.append(self._queries_timeout_error(i))
+
+                continue
+
+            try:
+                result = self._execute(query, timeout=remaining)
+            except Exception as e:
+                artifacts.append(ErrorArtifact(f"query {i + 1} failed: {e}"))
+
+                continue
+
+            if isinstance(result, ErrorArtifact) and time.monotonic() >= deadline:
+                artifacts.append(self._queries_timeout_error(i))
+            else:
+                artifacts.extend(result if isinstance(result, list) else [result])
+
+        return artifacts
+
+    def _has_thread_bound_connections(self) -> bool:
+        """Returns whether each thread gets a connection of its own, as with in-memory SQLite databases."""
+        from sqlalchemy.pool import SingletonThreadPool
+
+        engine = getattr(self.sql_loader.sql_driver, "engine", None)
+
+        if engine is None:
+            return False
+        elif isinstance(engine.pool, SingletonThreadPool):
+            return True
+        else:
+            return engine.dialect.name == "sqlite" and engine.url.database in (None, "", ":memory:")
+
+    def _queries_timeout_error(self, i: int) -> ErrorArtifact:
+        return ErrorArtifact(f"query {i + 1} cancelled: it didn't finish within {self.queries_timeout}s")
+
+    @activity(config={
+        "description":
+            "Can be used to load the schemas of tables "
+            "{% if multiple_tables %}from {{ table_name }}{% else %}{{ table_name }}{% endif %}",
+        "schema": Schema({
+            "table_names": list[str]
+        })
+    })
+    def get_table_schemas(self, params: dict) -> list[BaseArtifact]:
+        table_names = params["values"]["table_names"]
+        available_table_names = self._available_table_names()
+        requested_table_names = [available_table_names.get(name.lower()) for name in table_names]
+        schemas = self.schema_catalog.get_schemas([name for name in requested_table_names if name])
+        artifacts = []
+
+        for name, table_name in zip(table_names, requested_table_names):
+            if table_name is None:
+                artifacts.append(ErrorArtifact(f"{name}: table isn't available"))
+            elif schemas[table_name] is None:
+                artifacts.append(ErrorArtifact(f"{name}: table not found"))
+            else:
+                artifacts.append(TextArtifact(schemas[table_name], name=table_name))
+
+        return artifacts
+
+    @activity(config={
+        "description":
+            "Can be used to get an overview of "
+            "{% if multiple_tables %}a table from {{ table_name }}{% else %}table {{ table_name }}{% endif %}: "
+            "the row count, the null rate, distinct count, minimum, maximum, and mean of every column, "
+            "and a few example rows"
+            "{% if not multiple_tables %}. table_name defaults to {{ table_name }}{% endif %}",
+        "schema": Schema({
+            schema.Optional(
+                Literal("table_name", description="Name of the table to profile")
+            ): str
+        })
+    })
+    def profile_table(self, params: dict) -> TextArtifact | ErrorArtifact:
+        requested_name = params["values"].get("table_name") or self.table_name
+        table_name = self._available_table_names().get((requested_name or "").lower())
+        driver = self.sql_loader.sql_driver
+
+        if table_name is None:
+            return ErrorArtifact(f"{requested_name}: table isn't available")
+        elif not hasattr(driver, "engine"):
+            return ErrorArtifact("table profiles aren't supported by this SQL driver")
+
+        columns = self.schema_catalog.get_columns([table_name])[table_name]
+
+        if columns is None:
+            return ErrorArtifact(f"{requested_name}: table not found")
+
+        timeout = self._effective_timeout(None)
+        start = time.perf_counter()
+
+        try:
+            profile = profile_table(
+                driver.engine,
+                table_name,
+                columns,
+                schema_name=self.schema_name,
+                sample_size=self.profile_sample_size,
+                distinct_counts=self.profile_distinct_counts,
+                timeout=timeout,
+                cancel=self._cancel_query
+            )
+        except Exception:
+            if timeout and time.perf_counter() - start >= timeout:
+                return self._timeout_error(time.perf_counter() - start, timeout)
+
+            raise
+
+        return TextArtifact(profile, name=table_name)
+
+    def _available_table_names(self) -> dict[str, str]:
+        """Maps lowercase table names, with and without the schema, to the configured table names."""
+        table_names = self.table_names or [self.table_name]
+
+        return {
+            **{name.lower(): name for name in table_names},
+            **{self._qualify(name).lower(): name for name in table_names}
+        }
+
+    def _qualify(self, table_name: str) -> str:
+        return f"{self.schema_name}.{table_name}" if self.schema_name else table_name
+
+    def _execute(
+            self,
+            query: str,
+            bind_connection: Optional[Callable[[Any], ContextManager]] = None,
+            timeout: Optional[float] = None
+    ) -> list[BaseArtifact] | InfoArtifact | ErrorArtifact:
+        start = time.perf_counter()
+        timeout = self._effective_timeout(timeout)
+
+        if self.query_cache is None:
+            result = self._load_rows(query, bind_connection=bind_connection, timeout=timeout)
+        else:
+            table_names = self.table_names or [self.table_name]
+            key = QueryCache.build_key(query, [self._qualify(name) for name in table_names])
+            version = self._table_version(table_names)
+            result = self.query_cache.get(key, version)
+
+            if result is None:
+                result = self._load_rows(query, bind_connection=bind_connection, timeout=timeout)
+
+                if not isinstance(result, ErrorArtifact):
+                    self.query_cache.put(key, table_names, result, version)
+
+        elapsed = time.perf_counter() - start
+
+        logging.debug(f"query finished in {elapsed:.3f}s: {query}")
+
+        if self.report_elapsed_time and not isinstance(result, ErrorArtifact):
+            return (result if isinstance(result, list) else [result]) + [InfoArtifact(f"query took {elapsed:.3f}s")]
+        else:
+            return result
+
+    def _effective_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """Returns the shorter of the per-call and the per-tool timeout."""
+        timeouts = [t for t in (timeout, self.query_timeout) if t is not None and t > 0]
+
+        return min(timeouts) if timeouts else None
+
+    def _table_version(self, table_names: list[str]) -> Optional[str]:
+        """Returns the versions of the tables combined, with the version query run for each table on its own."""
+        if self.query_cache.table_version_query is None:
+            return None
+
+        versions = []
+
+        for table_name in table_names:
+            rows = self.sql_loader.sql_driver.execute_query(
+                self.query_cache.table_version_query.format(table_name=self._qualify(table_name))
+            )
+
+            versions.append(str(list(rows[0].cells.values())[0]) if rows else None)
+
+        return json.dumps(versions)
+
+    def _load_rows(
+            self,
+            query: str,
+            bind_connection: Optional[Callable[[Any], ContextManager]] = None,
+            timeout: Optional[float] = None
+    ) -> list[BaseArtifact] | InfoArtifact | ErrorArtifact:
+        """Loads rows until `max_rows` or `max_bytes` is reached and appends a notice if the result was cut short.
+
+        Queries that run longer than `timeout` seconds are cancelled and return an error. `bind_connection` is entered
+        with the DBAPI connection for as long as the query runs on it.
+        """
+        driver = self.sql_loader.sql_driver
+        start = time.perf_counter()
+        original_query = query
+
+        if hasattr(driver, "engine"):
+            dialect = driver.engine.dialect.name
+
+            if self.max_query_cost is not None:
+                # EXPLAIN runs on its own connection, so that a failed EXPLAIN can't abort the query's transaction
+                with driver.engine.connect() as connection:
+                    cost = estimate_cost(connection, query, dialect)
+
+                if cost is not None and cost > self.max_query_cost:
+                    return ErrorArtifact(
+                        f"query rejected: its estimated cost of {cost:.0f} exceeds the limit of "
+                        f"{self.max_query_cost:.0f}. Filter on indexed columns with WHERE, avoid cross joins, or "
+                        f"aggregate the data instead of selecting every row"
+                    )
+
+            if self.auto_limit and self.max_rows is not None:
+                # one row more than max_rows so that truncated results can still be told apart
+                query = add_limit(query, self.max_rows + 1, dialect)
+
+        if hasattr(driver, "engine") and self.sql_loader.embedding_driver is None:
+            from sqlalchemy import text
+
+            try:
+                with driver.engine.begin() as connection:
+                    dbapi_connection = connection.connection.dbapi_connection
+                    connection_scope = bind_connection(dbapi_connection) if bind_connection else nullcontext()
+
+                    with connection_scope, statement_timeout(connection, timeout, self._cancel_query):
+                        # server-side cursor, so that only the rows that are returned are transferred
+                        result = connection.execute(text(query).execution_options(stream_results=True))
+
+                        try:
+                            column_names = list(result.keys()) if result.returns_rows else []
+                            rows, truncated = self._cap_rows(self._iter_result(result))
+                            # the row count only covers the whole result if the automatic LIMIT wasn't added
+                            row_count = result.rowcount if query == original_query else -1
+                        finally:
+                            result.close()
+            except Exception:
+                # engines report timeouts with their own errors, so any error after the deadline is a timeout
+                if timeout and time.perf_counter() - start >= timeout:
+                    return self._timeout_error(time.perf_counter() - start, timeout)
+
+                raise
+
+            artifacts = self._rows_to_artifacts(column_names, rows)
+
+            if truncated:
+                total_count, estimated = self._total_row_count(original_query, len(rows), row_count)
+            else:
+                total_count, estimated = None, False
+        else:
+            if timeout:
+                # the loader can't be interrupted, so the query is abandoned on its thread instead
+                executor = futures.ThreadPoolExecutor(max_workers=1)
+
+                try:
+                    loaded_rows = executor.submit(self.sql_loader.load, query).result(timeout=timeout)
+                except futures.TimeoutError:
+                    return self._timeout_error(time.perf_counter() - start, timeout)
+                finally:
+                    executor.shutdown(wait=False)
+            else:
+                loaded_rows = self.sql_loader.load(query)
+            column_names = list(loaded_rows[0].value.keys()) if loaded_rows else []
+            rows, truncated = self._cap_rows([list(row.value.values()) for row in loaded_rows])
+            # the loader reads every row anyway
+            total_count, estimated = len(loaded_rows), False
+
+            if self.result_format == "rows":
+                # keeps the embeddings generated by the loader
+                artifacts = loaded_rows[:len(rows)]
+            else:
+                artifacts = self._rows_to_artifacts(column_names, rows)
+
+        if truncated:
+            return artifacts + [InfoArtifact(self._truncation_notice(len(rows), total_count, estimated))]
+        elif rows:
+            return artifacts
         else:
             return InfoArtifact("No results found")
+
+    def _rows_to_artifacts(
+            self, column_names: list[str], rows: list[Sequence]
+    ) -> list[CsvRowArtifact] | list[ColumnTableArtifact]:
+        if not rows:
+            return []
+        elif self.result_format == "columns":
+            return [ColumnTableArtifact.from_rows(column_names, rows)]
+        else:
+            return [CsvRowArtifact(dict(zip(column_names, row))) for row in rows]
+
+    def _iter_result(self, result) -> Iterator[Sequence]:
+        if not result.returns_rows:
+            return
+
+        while True:
+            batch = result.fetchmany(self.fetch_batch_size)
+
+            if not batch:
+                break
+
+            yield from batch
+
+    def _cap_rows(self, rows: Iterable[Sequence]) -> tuple[list[Sequence], bool]:
+        capped_rows = []
+        capped_bytes = 0
+
+        for row in rows:
+            # approximate size of the row as CSV: the cells plus a delimiter or line break after each one
+            size = sum(len(str(cell)) for cell in row) + len(row)
+
+            if self.max_rows is not None and len(capped_rows) >= self.max_rows:
+                return capped_rows, True
+            elif self.max_bytes is not None and capped_bytes + size > self.max_bytes:
+                return capped_rows, True
+
+            capped_rows.append(row)
+
+            capped_bytes += size
+
+        return capped_rows, False
+
+    def _cancel_query(self, dbapi_connection: Optional[Any]) -> None:
+        """Stops the statement running on a DBAPI connection if the driver supports it."""
+        try:
+            if hasattr(dbapi_connection, "interrupt"):
+                # sqlite3
+                dbapi_connection.interrupt()
+            elif hasattr(dbapi_connection, "cancel"):
+                # psycopg2, psycopg, and snowflake-connector
+                dbapi_connection.cancel()
+        except Exception as e:
+            logging.warning(f"error cancelling query: {e}")
+
+    def _timeout_error(self, elapsed: float, timeout: float) -> ErrorArtifact:
+        return ErrorArtifact(
+            f"query cancelled after {elapsed:.2f}s: it didn't finish within the timeout of {timeout:g}s; "
+            f"use WHERE, LIMIT, or aggregates to narrow the query"
+        )
+
+    def _total_row_count(self, query: str, returned_count: int, row_count: int) -> tuple[Optional[int], bool]:
+        """Returns the total row count of a truncated result if the database can report it cheaply, and whether it's
+        the planner's estimate.
+
+        Buffered cursors know the row count before the rows are fetched. Server-side cursors report -1 or the rows
+        fetched so far instead, so a row count is only trusted if it's larger than the rows that were fetched. The
+        estimate comes from EXPLAIN and is only available on PostgreSQL and Redshift.
+        """
+        if row_count > returned_count:
+            return row_count, False
+
+        engine = self.sql_loader.sql_driver.engine
+
+        with engine.connect() as connection:
+            estimate = estimate_rows(connection, query, engine.dialect.name)
+
+        return (estimate, True) if estimate is not None else (None, False)
+
+    def _truncation_notice(
+            self, returned_count: int, total_count: Optional[int] = None, estimated: bool = False
+    ) -> str:
+        if total_count is not None and total_count > returned_count:
+            total = f" of about {total_count}" if estimated else f" of {total_count}"
+        else:
+            total = ""
+
+        return (
+            f"result truncated to the first {returned_count}{total} rows to stay within the limit of "
+            f"{self.max_rows} rows and {self.max_bytes} bytes; use WHERE, LIMIT, or aggregates to narrow the query"
+        )
@@ -0,0 +1,205 @@
+from __future__ import annotations
+import ast
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Optional
+import yaml
+from attr import define, field, Factory, asdict
+
+if TYPE_CHECKING:
+    from griptape.core import BaseTool
+
+
+@define(frozen=True)
+class ToolManifest:
+    class_name: str = field(kw_only=True)
+    module_path: str = field(kw_only=True)
+    dir_path: str = field(kw_only=True)
+    name: str = field(kw_only=True)
+    description: str = field(kw_only=True)
+    contact_email: Optional[str] = field(default=None, kw_only=True)
+    legal_info_url: Optional[str] = field(default=None, kw_only=True)
+    requirements: list[str] = field(factory=list, kw_only=True)
+
+
+@define
+class ToolRegistry:
+    """Lists tools from their manifest files without importing tool modules.
+
+    Tool classes are only imported when they are requested with `load_tool_class()` or `create_tool()`. If
+    `cache_path` is set, parsed manifests are persisted to disk and reused for as long as the modification times of the
+    tool's manifest, requirements, and module files don't change.
+    """
+    CACHE_VERSION = 1
+    MANIFEST_FILE = "manifest.yml"
+    REQUIREMENTS_FILE = "requirements.txt"
+    TOOL_FILE = "tool.py"
+
+    packages: list[str] = field(default=Factory(lambda: ["griptape.tools"]), kw_only=True)
+    cache_path: Optional[str] = field(default=None, kw_only=True)
+    _manifests: Optional[dict[str, ToolManifest]] = field(default=None, init=False)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    @property
+    def manifests(self) -> dict[str, ToolManifest]:
+        with self._lock:
+            if self._manifests is None:
+                self._manifests = self._scan()
+
+            return self._manifests
+
+    def list_tools(self) -> list[ToolManifest]:
+        return list(self.manifests.values())
+
+    def get_manifest(self, class_name: str) -> ToolManifest:
+        manifest = self.manifests.get(class_name)
+
+        if manifest is None:
+            raise ValueError(f"tool {class_name} not found")
+
+        return manifest
+
+    def load_tool_class(self, class_name: str) -> type[BaseTool]:
+        manifest = self.get_manifest(class_name)
+
+        return getattr(importlib.import_module(manifest.module_path), manifest.class_name)
+
+    def create_tool(self, class_name: str, **kwargs) -> BaseTool:
+        return self.load_tool_class(class_name)(**kwargs)
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._manifests = None
+
+    def _scan(self) -> dict[str, ToolManifest]:
+        cache = self._load_cache()
+        new_cache = {}
+        manifests = {}
+
+        for package in self.packages:
+            for dir_path, module_path in self._find_tool_dirs(package):
+                mtimes = self._mtimes(dir_path)
+                cached = cache.get(dir_path)
+
+                if cached and cached["mtimes"] == mtimes:
+                    manifest = ToolManifest(**cached["manifest"])
+                else:
+                    try:
+                        manifest = self._parse_tool_dir(dir_path, module_path)
+                    except Exception as e:
+                        logging.warning(f"skipping tool in {dir_path}: {e}")
+
+                        continue
+
+                new_cache[dir_path] = {"mtimes": mtimes, "manifest": asdict(manifest)}
+
+                if manifest.class_name in manifests:
+                    logging.warning(f"duplicate tool {manifest.class_name} found in {dir_path}")
+                else:
+                    manifests[manifest.class_name] = manifest
+
+        if new_cache != cache:
+            self._save_cache(new_cache)
+
+        return manifests
+
+    def _find_tool_dirs(self, package: str) -> list[tuple[str, str]]:
+        # find_spec() imports the parent package but not its submodules, which is cheap for lazy packages
+        spec = importlib.util.find_spec(package)
+        tool_dirs = []
+
+        if spec is None or spec.submodule_search_locations is None:
+            raise ValueError(f"{package} is not a package")
+
+        for search_location in spec.submodule_search_locations:
+            for entry in sorted(os.listdir(search_location)):
+                dir_path = os.path.join(search_location, entry)
+
+                if all(
+                    os.path.isfile(os.path.join(dir_path, file_name))
+                    for file_name in [self.MANIFEST_FILE, self.TOOL_FILE]
+                ):
+                    tool_dirs.append((dir_path, f"{package}.{entry}.tool"))
+
+        return tool_dirs
+
+    def _parse_tool_dir(self, dir_path: str, module_path: str) -> ToolManifest:
+        with open(os.path.join(dir_path, self.MANIFEST_FILE), "r") as manifest_file:
+            manifest = yaml.safe_load(manifest_file)
+
+        requirements_path = os.path.join(dir_path, self.REQUIREMENTS_FILE)
+
+        if os.path.isfile(requirements_path):
+            with open(requirements_path, "r") as requirements_file:
+                requirements = [
+                    line.strip() for line in requirements_file
+                    if line.strip() and not line.strip().startswith("#")
+                ]
+        else:
+            requirements = []
+
+        return ToolManifest(
+            class_name=self._find_class_name(os.path.join(dir_path, self.TOOL_FILE)),
+            module_path=module_path,
+            dir_path=dir_path,
+            name=manifest["name"],
+            description=manifest["description"],
+            contact_email=manifest.get("contact_email"),
+            legal_info_url=manifest.get("legal_info_url"),
+            requirements=requirements
+        )
+
+    def _find_class_name(self, tool_path: str) -> str:
+        with open(tool_path, "r") as tool_file:
+            tree = ast.parse(tool_file.read(), filename=tool_path)
+
+        class_names = [
+            node.name for node in tree.body if isinstance(node, ast.ClassDef) and not node.name.startswith("_")
+        ]
+
+        if len(class_names) == 0:
+            raise ValueError(f"no tool class found in {tool_path}")
+
+        return class_names[0]
+
+    def _mtimes(self, dir_path: str) -> dict[str, float]:
+        return {
+            file_name: os.path.getmtime(os.path.join(dir_path, file_name))
+            for file_name in [self.MANIFEST_FILE, self.REQUIREMENTS_FILE, self.TOOL_FILE]
+            if os.path.isfile(os.path.join(dir_path, file_name))
+        }
+
+    def _load_cache(self) -> dict:
+        if self.cache_path is None or not os.path.isfile(self.cache_path):
+            return {}
+
+        try:
+            with open(self.cache_path, "r") as cache_file:
+                cache = json.load(cache_file)
+
+            return cache["tools"] if cache.get("version") == self.CACHE_VERSION else {}
+        except Exception as e:
+            logging.warning(f"ignoring invalid tool registry cache {self.cache_path}: {e}")
+
+            return {}
+
+    def _save_cache(self, tools: dict) -> None:
+        if self.cache_path is None:
+            return
+
+        try:
+            cache_dir = os.path.dirname(os.path.abspath(self.cache_path))
+            tmp_path = f"{self.cache_path}.tmp"
+
+            os.makedirs(cache_dir, exist_ok=True)
+
+            with open(tmp_path, "w") as cache_file:
+                json.dump({"version": self.CACHE_VERSION, "tools": tools}, cache_file)
+
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logging.warning(f"error writing tool registry cache {self.cache_path}: {e}")
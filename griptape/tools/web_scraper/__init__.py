@@ -0,0 +1,9 @@
+from .page_cache import PageCache
+from .near_duplicate_index import NearDuplicateIndex
+from .fingerprint_store import PageFingerprintStore
+
+__all__ = [
+    "PageCache",
+    "NearDuplicateIndex",
+    "PageFingerprintStore"
+]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+import gzip
+import os
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+from attr import define, field
+
+HTML_EXTENSIONS = (".html", ".htm", ".xhtml")
+
+
+@define(frozen=True)
+class ArchiveRecord:
+    url: str = field(kw_only=True)
+    content: bytes = field(kw_only=True)
+
+
+def iter_archive_records(path: str) -> Iterator[ArchiveRecord]:
+    """Yields HTML pages from a WARC file, a directory of WARC files, or a directory of HTML files.
+
+    Records are read one at a time, so archives of any size can be processed in constant memory.
+    """
+    if os.path.isdir(path):
+        for root, dir_names, file_names in os.walk(path):
+            dir_names.sort()
+
+            for file_name in sorted(file_names):
+                file_path = os.path.join(root, file_name)
+
+                if file_name.lower().endswith(HTML_EXTENSIONS):
+                    with open(file_path, "rb") as file:
+                        yield ArchiveRecord(url=Path(file_path).resolve().as_uri(), content=file.read())
+                elif is_warc_file(file_path):
+                    yield from iter_warc_records(file_path)
+    else:
+        yield from iter_warc_records(path)
+
+
+def is_warc_file(path: str) -> bool:
+    return path.lower().endswith((".warc", ".warc.gz"))
+
+
+def iter_warc_records(path: str) -> Iterator[ArchiveRecord]:
+    """Yields the HTML responses and resources stored in a WARC file, which can be gzip-compressed."""
+    with open(path, "rb") as raw_file:
+        compressed = raw_file.read(2) == b"\x1f\x8b"
+
+    # per-record gzip members are read transparently as one stream
+    with (gzip.open(path, "rb") if compressed else open(path, "rb")) as file:
+        while True:
+            headers = _read_warc_headers(file)
+
+            if headers is None:
+                break
+
+            block = file.read(int(headers.get("content-length", 0)))
+            record = _warc_record(headers, block)
+
+            if record is not None:
+                yield record
+
+
+def _read_warc_headers(file: BinaryIO) -> Optional[dict[str, str]]:
+    line = file.readline()
+
+    # records are separated by blank lines
+    while line in (b"\r\n", b"\n"):
+        line = file.readline()
+
+    if not line:
+        return None
+    elif not line.startswith(b"WARC/"):
+        raise ValueError(f"invalid WARC record header: {line[:32]!r}")
+
+    headers = {}
+
+    for line in iter(file.readline, b""):
+        if line in (b"\r\n", b"\n"):
+            break
+
+        name, _, value = line.decode("utf-8", errors="replace").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    return headers
+
+
+def _warc_record(headers: dict[str, str], block: bytes) -> Optional[ArchiveRecord]:
+    url = headers.get("warc-target-uri", "").strip("<>")
+    record_type = headers.get("warc-type")
+
+    if not url:
+        return None
+    elif record_type == "response" and headers.get("content-type", "").startswith("application/http"):
+        http_head, _, body = block.partition(b"\r\n\r\n")
+        status_line, *header_lines = http_head.decode("latin-1").split("\r\n")
+        status = status_line.split(" ")[1] if status_line.count(" ") >= 1 else ""
+        http_headers = {}
+
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            http_headers[name.strip().lower()] = value.strip().lower()
+
+        if status != "200" or not _is_html(http_headers.get("content-type")):
+            return None
+
+        try:
+            if "chunked" in http_headers.get("transfer-encoding", ""):
+                body = _dechunk(body)
+
+            if http_headers.get("content-encoding") in ("gzip", "x-gzip", "deflate"):
+                # wbits=47 accepts both gzip and zlib streams
+                body = zlib.decompress(body, 47)
+        except (ValueError, zlib.error):
+            return None
+
+        return ArchiveRecord(url=url, content=body)
+    elif record_type == "resource" and _is_html(headers.get("content-type")):
+        return ArchiveRecord(url=url, content=block)
+    else:
+        return None
+
+
+def _is_html(content_type: Optional[str]) -> bool:
+    # pages are often archived without a content type
+    return content_type is None or "html" in content_type.lower()
+
+
+def _dechunk(body: bytes) -> bytes:
+    content = bytearray()
+    position = 0
+
+    while position < len(body):
+        line_end = body.index(b"\r\n", position)
+        size = int(body[position:line_end].split(b";")[0], 16)
+
+        if size == 0:
+            break
+
+        content.extend(body[line_end + 2:line_end + 2 + size])
+
+        position = line_end + 2 + size + 2
+
+    return bytes(content)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from attr import define, field, Factory
+
+
+@define
+class PageFingerprintStore:
+    """Stores the paragraph hashes of the last visit to each URL.
+
+    Fingerprints are kept in a bounded in-memory LRU by default. If `path` is set, they are persisted in a SQLite
+    database instead so that they survive restarts and can be shared by multiple processes.
+    """
+    path: Optional[str] = field(default=None, kw_only=True)
+    max_urls: int = field(default=10_000, kw_only=True)
+    _fingerprints: OrderedDict[str, list[str]] = field(factory=OrderedDict, init=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    def get(self, url: str) -> Optional[list[str]]:
+        with self._lock:
+            if self.path is None:
+                fingerprint = self._fingerprints.get(url)
+
+                if fingerprint is not None:
+                    self._fingerprints.move_to_end(url)
+
+                return fingerprint
+            else:
+                row = self._get_connection().execute(
+                    "SELECT hashes FROM fingerprints WHERE url = ?", (url,)
+                ).fetchone()
+
+                return json.loads(row[0]) if row else None
+
+    def put(self, url: str, hashes: list[str]) -> None:
+        with self._lock:
+            if self.path is None:
+                self._fingerprints[url] = hashes
+                self._fingerprints.move_to_end(url)
+
+                while len(self._fingerprints) > self.max_urls:
+                    self._fingerprints.popitem(last=False)
+            else:
+                connection = self._get_connection()
+
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO fingerprints (url, hashes, updated_at) VALUES (?, ?, ?)",
+                        (url, json.dumps(hashes), time.time())
+                    )
+                    connection.execute(
+                        "DELETE FROM fingerprints WHERE url NOT IN "
+                        "(SELECT url FROM fingerprints ORDER BY updated_at DESC LIMIT ?)",
+                        (self.max_urls,)
+                    )
+
+    def delete(self, url: str) -> None:
+        with self._lock:
+            if self.path is None:
+                self._fingerprints.pop(url, None)
+            else:
+                connection = self._get_connection()
+
+                with connection:
+                    connection.execute("DELETE FROM fingerprints WHERE url = ?", (url,))
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS fingerprints (url TEXT PRIMARY KEY, hashes TEXT, updated_at REAL)"
+                )
+                self._connection.execute(
+                    "CREATE INDEX IF NOT EXISTS fingerprints_updated_at ON fingerprints (updated_at)"
+                )
+
+        return self._connection
@@ -0,0 +1,210 @@
+from __future__ import annotations
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from urllib.parse import urlparse
+from attr import define, field, Factory
+from griptape.artifacts import ErrorArtifact, InfoArtifact, TextArtifact
+
+if TYPE_CHECKING:
+    from griptape.memory.tool import TextToolMemory
+    from griptape.tools import WebScraper
+
+# Marks the end of a stage's input. Each worker consumes exactly one.
+_END = object()
+
+
+@define
+class StageStats:
+    name: str = field(kw_only=True)
+    items: int = field(default=0, kw_only=True)
+    busy_seconds: float = field(default=0, kw_only=True)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    def record(self, items: int, busy_seconds: float) -> None:
+        with self._lock:
+            self.items += items
+            self.busy_seconds += busy_seconds
+
+
+@define
+class IngestionPipeline:
+    """Loads web pages into a TextToolMemory namespace with overlapping fetch, extract, chunk, and upsert stages.
+
+    Stages are connected by queues holding at most `queue_size` items, so a slow stage blocks the stages before it
+    instead of letting pages pile up in memory. Fetching and extraction run on worker threads; extraction runs in the
+    scraper's process pool if it has one.
+    """
+    scraper: WebScraper = field(kw_only=True)
+    memory: TextToolMemory = field(kw_only=True)
+    namespace: str = field(kw_only=True)
+    fetch_workers: int = field(default=8, kw_only=True)
+    max_fetches_per_host: int = field(default=2, kw_only=True)
+    extract_workers: int = field(default=2, kw_only=True)
+    upsert_batch_size: int = field(default=32, kw_only=True)
+    queue_size: int = field(default=8, kw_only=True)
+    stats: dict[str, StageStats] = field(
+        default=Factory(lambda: {name: StageStats(name=name) for name in ["fetch", "extract", "chunk", "upsert"]}),
+        init=False
+    )
+    errors: list[ErrorArtifact] = field(factory=list, init=False)
+    elapsed_seconds: float = field(default=0, init=False)
+    _host_semaphores: dict[str, threading.BoundedSemaphore] = field(factory=dict, init=False)
+    _host_semaphores_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    def run(self, urls: list[str]) -> InfoArtifact:
+        start = time.perf_counter()
+        url_queue = queue.Queue()
+        page_queue = queue.Queue(maxsize=self.queue_size)
+        extraction_queue = queue.Queue(maxsize=self.queue_size)
+        chunk_queue = queue.Queue(maxsize=self.queue_size)
+
+        for url in urls:
+            url_queue.put(url)
+
+        stages = [
+            (self._fetch, self.fetch_workers, url_queue, page_queue),
+            (self._extract, self.extract_workers, page_queue, extraction_queue),
+            (self._chunk, 1, extraction_queue, chunk_queue),
+            (None, 1, chunk_queue, None)
+        ]
+        stage_threads = []
+
+        for func, workers, input_queue, output_queue in stages:
+            if func is None:
+                threads = [threading.Thread(target=self._upsert, args=(input_queue,), daemon=True)]
+            else:
+                threads = [
+                    threading.Thread(target=self._work, args=(func, input_queue, output_queue), daemon=True)
+                    for _ in range(workers)
+                ]
+
+            for thread in threads:
+                thread.start()
+
+            stage_threads.append(threads)
+
+        for _ in range(self.fetch_workers):
+            url_queue.put(_END)
+
+        # once every worker of a stage is done, the next stage gets one end marker per worker
+        for (_, _, _, output_queue), threads, (_, next_workers, _, _) in zip(stages, stage_threads, stages[1:]):
+            for thread in threads:
+                thread.join()
+
+            for _ in range(next_workers):
+                output_queue.put(_END)
+
+        for thread in stage_threads[-1]:
+            thread.join()
+
+        self.elapsed_seconds = time.perf_counter() - start
+
+        return InfoArtifact(self.report())
+
+    def report(self) -> str:
+        lines = [
+            f"ingested {self.stats['upsert'].items} chunks from {self.stats['chunk'].items} pages into namespace "
+            f"{self.namespace} in {self.elapsed_seconds:.2f}s with {len(self.errors)} errors"
+        ]
+
+        for stage in self.stats.values():
+            throughput = stage.items / self.elapsed_seconds if self.elapsed_seconds else 0
+
+            lines.append(
+                f"{stage.name}: {stage.items} items, {stage.busy_seconds:.2f}s busy, {throughput:.2f} items/s"
+            )
+
+        lines.extend(error.value for error in self.errors)
+
+        return "\n".join(lines)
+
+    def _work(self, func: Callable[[Any], Optional[Any]], input_queue: queue.Queue, output_queue: queue.Queue) -> None:
+        while True:
+            item = input_queue.get()
+
+            if item is _END:
+                break
+
+            try:
+                result = func(item)
+            except Exception as e:
+                logging.error(e)
+
+                self.errors.append(ErrorArtifact(f"error: {e}"))
+
+                result = None
+
+            if result is not None:
+                output_queue.put(result)
+
+    def _fetch(self, url: str) -> Optional[tuple[str, str | bytes]]:
+        host = urlparse(url).netloc.lower()
+
+        with self._host_semaphores_lock:
+            semaphore = self._host_semaphores.setdefault(host, threading.BoundedSemaphore(self.max_fetches_per_host))
+
+        with semaphore:
+            start = time.perf_counter()
+            page = self.scraper._fetch_page(url)
+
+        self.stats["fetch"].record(1, time.perf_counter() - start)
+
+        if page is None:
+            self.errors.append(ErrorArtifact(f"{url}: error: can't access URL", name=url))
+
+            return None
+        else:
+            return url, page
+
+    def _extract(self, item: tuple[str, str | bytes]) -> Optional[tuple[str, dict]]:
+        url, page = item
+        start = time.perf_counter()
+        extraction = self.scraper._parse_page(url, page)
+
+        self.stats["extract"].record(1, time.perf_counter() - start)
+
+        if isinstance(extraction, ErrorArtifact):
+            self.errors.append(ErrorArtifact(f"{url}: {extraction.value}", name=url))
+
+            return None
+        else:
+            return url, extraction
+
+    def _chunk(self, item: tuple[str, dict]) -> Optional[list[TextArtifact]]:
+        url, extraction = item
+        start = time.perf_counter()
+        content = self.scraper._page_content(url, extraction)
+
+        self.stats["chunk"].record(1, time.perf_counter() - start)
+
+        if isinstance(content, list):
+            return [TextArtifact(a.value, name=url) for a in content]
+        else:
+            return None
+
+    def _upsert(self, input_queue: queue.Queue) -> None:
+        batch = []
+
+        while True:
+            item = input_queue.get()
+
+            if item is not _END:
+                batch.extend(item)
+
+            if batch and (item is _END or len(batch) >= self.upsert_batch_size):
+                start = time.perf_counter()
+
+                try:
+                    self.memory.query_engine.upsert_text_artifacts(batch, self.namespace)
+
+                    self.stats["upsert"].record(len(batch), time.perf_counter() - start)
+                except Exception as e:
+                    self.errors.append(ErrorArtifact(f"error upserting {len(batch)} chunks: {e}"))
+
+                batch = []
+
+            if item is _END:
+                break
@@ -0,0 +1,123 @@
+from __future__ import annotations
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional
+from attr import define, field, Factory
+
+FINGERPRINT_BITS = 64
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """Returns a 64-bit SimHash fingerprint of the word shingles in `text`."""
+    words = re.findall(r"\w+", text.lower())
+    shingles = [" ".join(words[i:i + shingle_size]) for i in range(max(1, len(words) - shingle_size + 1))]
+    weights = [0] * FINGERPRINT_BITS
+
+    for shingle in shingles:
+        shingle_hash = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+
+        for i in range(FINGERPRINT_BITS):
+            weights[i] += 1 if shingle_hash >> i & 1 else -1
+
+    return sum(1 << i for i, weight in enumerate(weights) if weight > 0)
+
+
+@define
+class NearDuplicateIndex:
+    """Bounded in-process index of SimHash fingerprints used to detect near-duplicate text.
+
+    Two texts are near-duplicates if the fraction of matching fingerprint bits is at least `similarity_threshold`.
+    Fingerprints are split into `max_distance + 1` bands. Two fingerprints within `max_distance` bits of each other
+    always share a band, so candidates are found without scanning the whole index. The oldest fingerprints are evicted
+    once the index holds `max_entries`.
+    """
+    similarity_threshold: float = field(default=0.9, kw_only=True)
+    max_entries: int = field(default=10_000, kw_only=True)
+    min_words: int = field(default=20, kw_only=True)
+    max_distance: int = field(
+        default=Factory(
+            lambda self: math.floor((1 - self.similarity_threshold) * FINGERPRINT_BITS), takes_self=True
+        ),
+        init=False
+    )
+    _entries: OrderedDict[int, str] = field(factory=OrderedDict, init=False)
+    _bands: dict[tuple[int, int], set[int]] = field(factory=dict, init=False)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    @similarity_threshold.validator
+    def validate_similarity_threshold(self, _, similarity_threshold: float) -> None:
+        if not 0 < similarity_threshold <= 1:
+            raise ValueError("similarity_threshold has to be in the (0, 1] range")
+
+    def add(self, text: str, key: str) -> Optional[str]:
+        """Returns the key of a near-duplicate added under a different key or records the text and returns None.
+
+        Texts with fewer than `min_words` words are never treated as duplicates.
+        """
+        if len(re.findall(r"\w+", text)) < self.min_words:
+            return None
+
+        fingerprint = simhash(text)
+
+        with self._lock:
+            for candidate in self._candidates(fingerprint):
+                candidate_key = self._entries[candidate]
+
+                if candidate_key != key and bin(candidate ^ fingerprint).count("1") <= self.max_distance:
+                    return candidate_key
+
+            if fingerprint not in self._entries:
+                for band in self._band_keys(fingerprint):
+                    self._bands.setdefault(band, set()).add(fingerprint)
+
+            self._entries[fingerprint] = key
+            self._entries.move_to_end(fingerprint)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+            return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bands.clear()
+
+    def _candidates(self, fingerprint: int) -> set[int]:
+        band_keys = self._band_keys(fingerprint)
+
+        # with low thresholds there aren't enough bands for the pigeonhole argument, so every entry is a candidate
+        if len(band_keys) <= self.max_distance:
+            return set(self._entries)
+
+        candidates = set()
+
+        for band in band_keys:
+            candidates.update(self._bands.get(band, ()))
+
+        return candidates
+
+    def _remove(self, fingerprint: int) -> None:
+        del self._entries[fingerprint]
+
+        for band in self._band_keys(fingerprint):
+            fingerprints = self._bands.get(band)
+
+            if fingerprints is not None:
+                fingerprints.discard(fingerprint)
+
+                if not fingerprints:
+                    del self._bands[band]
+
+    def _band_keys(self, fingerprint: int) -> list[tuple[int, int]]:
+        band_count = self.max_distance + 1
+        band_size = math.ceil(FINGERPRINT_BITS / band_count)
+
+        return [
+            (i, fingerprint >> (i * band_size) & ((1 << band_size) - 1))
+            for i in range(band_count)
+            if i * band_size < FINGERPRINT_BITS
+        ]
@@ -0,0 +1,249 @@
+from __future__ import annotations
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+from attr import define, field, Factory
+from griptape.utils import str_to_hash
+
+
+@define
+class CachedPage:
+    url: str = field(kw_only=True)
+    content: bytes = field(kw_only=True)
+    etag: Optional[str] = field(default=None, kw_only=True)
+    last_modified: Optional[str] = field(default=None, kw_only=True)
+    fetched_at: float = field(default=Factory(lambda: time.time()), kw_only=True)
+
+
+@define
+class PageDownload:
+    status: int = field(kw_only=True)
+    content: bytes = field(default=b"", kw_only=True)
+    headers: dict[str, str] = field(factory=dict, kw_only=True)
+
+
+@define
+class PageCache:
+    """Two-tier cache for web pages.
+
+    Raw page content is persisted in `cache_dir` and revalidated with ETag and Last-Modified headers once it's older
+    than `page_ttl` seconds. The disk tier is disabled when `cache_dir` is None. Parsed extraction results are kept in
+    an in-memory LRU keyed by the page content, so that repeated activities on an unchanged page skip the parser
+    without ever bypassing `page_ttl` or revalidation.
+    """
+    cache_dir: Optional[str] = field(default=None, kw_only=True)
+    max_disk_bytes: int = field(default=256 * 1024 * 1024, kw_only=True)
+    page_ttl: float = field(default=300, kw_only=True)
+    max_extractions: int = field(default=128, kw_only=True)
+    extraction_ttl: float = field(default=3600, kw_only=True)
+    _extractions: OrderedDict[str, tuple[float, dict]] = field(factory=OrderedDict, init=False)
+    _disk_size: Optional[int] = field(default=None, init=False)
+    _counters: dict[str, int] = field(
+        default=Factory(lambda: {
+            "extraction_hits": 0,
+            "extraction_misses": 0,
+            "page_hits": 0,
+            "page_revalidations": 0,
+            "page_misses": 0
+        }),
+        init=False
+    )
+    _lock: threading.RLock = field(default=Factory(lambda: threading.RLock()), init=False)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def get_extraction(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._extractions.get(key)
+
+            if entry and time.time() - entry[0] <= self.extraction_ttl:
+                self._extractions.move_to_end(key)
+                self._counters["extraction_hits"] += 1
+
+                return entry[1]
+            else:
+                self._extractions.pop(key, None)
+                self._counters["extraction_misses"] += 1
+
+                return None
+
+    def put_extraction(self, key: str, extraction: dict) -> None:
+        with self._lock:
+            self._extractions[key] = (time.time(), extraction)
+            self._extractions.move_to_end(key)
+
+            while len(self._extractions) > self.max_extractions:
+                self._extractions.popitem(last=False)
+
+    def fetch_page(
+            self, url: str, download: Callable[[str, dict], Optional[PageDownload]], revalidate: bool = False
+    ) -> Optional[bytes]:
+        """Returns page content from disk if it's fresh, otherwise downloads or revalidates it with `download`.
+
+        With `revalidate`, pages are revalidated or downloaded even if they're fresh.
+        """
+        cached = self.get_page(url)
+
+        if cached and not revalidate and time.time() - cached.fetched_at <= self.page_ttl:
+            with self._lock:
+                self._counters["page_hits"] += 1
+
+            return cached.content
+
+        headers = {}
+
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        response = download(url, headers)
+
+        if response is None:
+            return None
+        elif response.status == 304 and cached:
+            with self._lock:
+                self._counters["page_revalidations"] += 1
+
+            cached.fetched_at = time.time()
+
+            self.put_page(cached)
+
+            return cached.content
+        elif response.status == 200:
+            with self._lock:
+                self._counters["page_misses"] += 1
+
+            headers = {k.lower(): v for k, v in response.headers.items()}
+
+            self.put_page(
+                CachedPage(
+                    url=url,
+                    content=response.content,
+                    etag=headers.get("etag"),
+                    last_modified=headers.get("last-modified")
+                )
+            )
+
+            return response.content
+        else:
+            return None
+
+    def get_page(self, url: str) -> Optional[CachedPage]:
+        if self.cache_dir is None:
+            return None
+
+        content_path, meta_path = self._page_paths(url)
+
+        try:
+            with self._lock:
+                with open(meta_path, "r") as meta_file:
+                    meta = json.load(meta_file)
+
+                with open(content_path, "rb") as content_file:
+                    content = content_file.read()
+
+                # mtime doubles as the last access time for LRU eviction
+                os.utime(content_path)
+
+            return CachedPage(
+                url=url,
+                content=content,
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+                fetched_at=meta["fetched_at"]
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"error reading cached page {url}: {e}")
+
+            return None
+
+    def put_page(self, page: CachedPage) -> None:
+        if self.cache_dir is None or len(page.content) > self.max_disk_bytes:
+            return
+
+        content_path, meta_path = self._page_paths(page.url)
+
+        try:
+            with self._lock:
+                os.makedirs(self.cache_dir, exist_ok=True)
+
+                disk_size = self._current_disk_size()
+                old_size = os.path.getsize(content_path) if os.path.exists(content_path) else 0
+
+                with open(content_path, "wb") as content_file:
+                    content_file.write(page.content)
+
+                with open(meta_path, "w") as meta_file:
+                    json.dump({
+                        "url": page.url,
+                        "etag": page.etag,
+                        "last_modified": page.last_modified,
+                        "fetched_at": page.fetched_at
+                    }, meta_file)
+
+                self._disk_size = disk_size + len(page.content) - old_size
+
+                self._evict_pages(keep_path=content_path)
+        except Exception as e:
+            logging.warning(f"error caching page {page.url}: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._extractions.clear()
+
+            if self.cache_dir and os.path.isdir(self.cache_dir):
+                for file_name in os.listdir(self.cache_dir):
+                    if file_name.endswith((".html", ".json")):
+                        os.remove(os.path.join(self.cache_dir, file_name))
+
+            self._disk_size = 0
+
+    def _page_paths(self, url: str) -> tuple[str, str]:
+        key = str_to_hash(url)
+
+        return os.path.join(self.cache_dir, f"{key}.html"), os.path.join(self.cache_dir, f"{key}.json")
+
+    def _current_disk_size(self) -> int:
+        if self._disk_size is None:
+            self._disk_size = sum(
+                os.path.getsize(os.path.join(self.cache_dir, f))
+                for f in os.listdir(self.cache_dir) if f.endswith(".html")
+            )
+
+        return self._disk_size
+
+    def _evict_pages(self, keep_path: str) -> None:
+        if self._disk_size <= self.max_disk_bytes:
+            return
+
+        pages = sorted(
+            (
+                os.path.join(self.cache_dir, f) for f in os.listdir(self.cache_dir)
+                if f.endswith(".html") and os.path.join(self.cache_dir, f) != keep_path
+            ),
+            key=os.path.getmtime
+        )
+
+        for content_path in pages:
+            if self._disk_size <= self.max_disk_bytes:
+                break
+
+            self._disk_size -= os.path.getsize(content_path)
+
+            os.remove(content_path)
+
+            meta_path = f"{content_path[:-len('.html')]}.json"
+
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
@@ -1,17 +1,64 @@
 from __future__ import annotations
+import hashlib
+import io
 import logging
 import json
-from attr import define, field
-from griptape.artifacts import BaseArtifact, TextArtifact, ErrorArtifact
+import multiprocessing
+import re
+import threading
+import time
+from concurrent import futures
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, TypeVar
+from urllib.parse import urlparse
+import schema
+from attr import define, field, Factory
+from griptape.artifacts import BaseArtifact, TextArtifact, ErrorArtifact, InfoArtifact
 from griptape.loaders import TextLoader
 from schema import Schema, Literal
 from griptape.core import BaseTool
 from griptape.core.decorators import activity
+from griptape.memory.tool import TextToolMemory
+from griptape.utils import str_to_hash
+from griptape.tools.web_scraper.archive_reader import ArchiveRecord, iter_archive_records
+from griptape.tools.web_scraper.fingerprint_store import PageFingerprintStore
+from griptape.tools.web_scraper.ingestion_pipeline import IngestionPipeline
+from griptape.tools.web_scraper.page_cache import PageCache, PageDownload
+from griptape.tools.web_scraper.near_duplicate_index import NearDuplicateIndex
+from griptape.tools.web_scraper.url_frontier import UrlFrontier, BloomFilter, normalize_url
+
+if TYPE_CHECKING:
+    from urllib3 import PoolManager
+
+T = TypeVar("T")
 
 
 @define
 class WebScraper(BaseTool):
     include_links: bool = field(default=True, kw_only=True)
+    max_concurrency: int = field(default=8, kw_only=True)
+    max_concurrency_per_host: int = field(default=2, kw_only=True)
+    page_cache: Optional[PageCache] = field(default=None, kw_only=True)
+    download_timeout: float = field(default=30, kw_only=True)
+    max_download_size: Optional[int] = field(default=20 * 1024 * 1024, kw_only=True)
+    streaming: bool = field(default=False, kw_only=True)
+    near_duplicate_index: Optional[NearDuplicateIndex] = field(default=None, kw_only=True)
+    fingerprint_store: PageFingerprintStore = field(default=Factory(lambda: PageFingerprintStore()), kw_only=True)
+    ingestion_extract_workers: int = field(default=2, kw_only=True)
+    ingestion_queue_size: int = field(default=8, kw_only=True)
+    archive_queue_size: int = field(default=32, kw_only=True)
+    crawl_max_depth: int = field(default=2, kw_only=True)
+    crawl_max_pages: int = field(default=20, kw_only=True)
+    crawl_same_host: bool = field(default=True, kw_only=True)
+    crawl_politeness_delay: float = field(default=1.0, kw_only=True)
+    crawl_seen_capacity: int = field(default=100_000, kw_only=True)
+    extraction_processes: Optional[int] = field(default=None, kw_only=True)
+    _http_pool: Optional[PoolManager] = field(default=None, init=False)
+    _http_pool_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+    _extraction_executor: Optional[futures.ProcessPoolExecutor] = field(default=None, init=False)
+    _extraction_executor_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
 
     @activity(config={
         "description": "Can be used to browse a web page and load its content",
@@ -22,14 +69,161 @@ class WebScraper(BaseTool):
             ): str
         })
     })
-    def get_content(self, params: dict) -> list[TextArtifact] | ErrorArtifact:
+    def get_content(self, params: dict) -> list[TextArtifact] | ErrorArtifact | InfoArtifact:
         url = params["values"]["url"]
-        page = self._load_page(url)
+
+        return self._load_content(url)
+
+    @activity(config={
+        "description": "Can be used to browse multiple web pages at once and load their content",
+        "schema": Schema({
+            Literal(
+                "urls",
+                description="List of valid HTTP URLs"
+            ): list[str]
+        })
+    })
+    def get_contents(self, params: dict) -> list[BaseArtifact]:
+        urls = params["values"]["urls"]
+        artifacts = []
+
+        for url, result in zip(urls, self.load_contents(urls)):
+            artifacts.extend(self._named_artifacts(url, result))
+
+        return artifacts
+
+    @activity(config={
+        "description": "Can be used to check a web page for changes and load only the content that is new or changed "
+                       "since the last time the page was loaded with this activity",
+        "schema": Schema({
+            Literal(
+                "url",
+                description="Valid HTTP URL"
+            ): str
+        })
+    })
+    def get_content_changes(self, params: dict) -> list[TextArtifact] | ErrorArtifact | InfoArtifact:
+        url = params["values"]["url"]
+        # a page is monitored precisely because it might have changed, so the cached page is revalidated with the
+        # server even if it's fresh, which also refreshes the page cache
+        page = self._parse_page(url, self._fetch_page(url, revalidate=True))
 
         if isinstance(page, ErrorArtifact):
             return page
+
+        paragraphs = [p.strip() for p in (page.get("text") or "").split("\n") if p.strip()]
+        hashes = [str_to_hash(p)[:16] for p in paragraphs]
+        previous_hashes = self.fingerprint_store.get(url)
+
+        self.fingerprint_store.put(url, hashes)
+
+        if previous_hashes is None:
+            return list(self._iter_page_chunks(url, page))
+
+        previous_hash_set = set(previous_hashes)
+        changed_paragraphs = [p for p, h in zip(paragraphs, hashes) if h not in previous_hash_set]
+        removed_count = len(previous_hash_set - set(hashes))
+
+        if changed_paragraphs:
+            return list(self._iter_page_chunks(url, {"text": "\n".join(changed_paragraphs)}))
+        elif removed_count > 0:
+            return InfoArtifact(f"no new content; {removed_count} paragraphs were removed since the last visit")
         else:
-            return TextLoader().text_to_artifacts(page.get("text"))
+            return InfoArtifact("page is unchanged since the last visit")
+
+    @activity(config={
+        "description": "Can be used to load the content of multiple web pages into memory",
+        "uses_default_memory": False,
+        "schema": Schema({
+            "memory_id": str,
+            "artifact_namespace": str,
+            Literal(
+                "urls",
+                description="List of valid HTTP URLs"
+            ): list[str]
+        })
+    })
+    def ingest(self, params: dict) -> InfoArtifact | ErrorArtifact:
+        values = params["values"]
+        memory = self.find_input_memory(values["memory_id"])
+
+        if isinstance(memory, TextToolMemory):
+            return IngestionPipeline(
+                scraper=self,
+                memory=memory,
+                namespace=values["artifact_namespace"],
+                fetch_workers=self.max_concurrency,
+                max_fetches_per_host=self.max_concurrency_per_host,
+                extract_workers=self.extraction_processes or self.ingestion_extract_workers,
+                queue_size=self.ingestion_queue_size
+            ).run(values["urls"])
+        else:
+            return ErrorArtifact("memory not found")
+
+    @activity(config={
+        "description": "Can be used to crawl a website starting from a web page and load the content of the pages "
+                       "it links to",
+        "schema": Schema({
+            Literal(
+                "url",
+                description="Valid HTTP URL to start crawling from"
+            ): str,
+            schema.Optional(
+                Literal(
+                    "max_depth",
+                    description="Optional maximum number of links to follow away from the starting page"
+                )
+            ): int,
+            schema.Optional(
+                Literal(
+                    "max_pages",
+                    description="Optional maximum number of pages to load"
+                )
+            ): int
+        })
+    })
+    def crawl(self, params: dict) -> list[BaseArtifact] | ErrorArtifact:
+        values = params["values"]
+        max_depth = min(values.get("max_depth", self.crawl_max_depth), self.crawl_max_depth)
+        max_pages = min(values.get("max_pages", self.crawl_max_pages), self.crawl_max_pages)
+        seed_url = normalize_url(values["url"])
+        artifacts = []
+        pages_loaded = 0
+
+        if seed_url is None:
+            return ErrorArtifact("error: invalid URL")
+
+        frontier = UrlFrontier(
+            politeness_delay=self.crawl_politeness_delay,
+            max_size=max_pages,
+            seen=BloomFilter(capacity=self.crawl_seen_capacity),
+            allowed_hosts={urlparse(seed_url).netloc} if self.crawl_same_host else None
+        )
+
+        frontier.add(seed_url, 0)
+
+        def load_page(url: str) -> dict | ErrorArtifact:
+            frontier.wait_for_host(url)
+
+            return self._load_page(url)
+
+        while len(frontier) > 0 and pages_loaded < max_pages:
+            batch = frontier.pop(min(self.max_concurrency, max_pages - pages_loaded))
+            pages = self._map_concurrently([url for url, _ in batch], load_page)
+
+            for (url, depth), page in zip(batch, pages):
+                pages_loaded += 1
+
+                if isinstance(page, ErrorArtifact):
+                    artifacts.extend(self._named_artifacts(url, page))
+                else:
+                    artifacts.extend(self._named_artifacts(url, self._page_content(url, page)))
+
+                    if depth < max_depth:
+                        for link in self._extract_links(page):
+                            frontier.add(link, depth + 1, base_url=url)
+
+        return artifacts
 
     @activity(config={
         "description": "Can be used to load a web page author",
@@ -49,32 +243,417 @@ class WebScraper(BaseTool):
         else:
             return TextArtifact(page.get("author"))
 
-    def _load_page(self, url: str) -> dict | ErrorArtifact:
-        import trafilatura
-        from trafilatura.settings import use_config
+    def load_contents(
+            self, urls: list[str], timeout: Optional[float] = None
+    ) -> list[list[TextArtifact] | ErrorArtifact | InfoArtifact]:
+        """Loads the content of web pages, in the order of the URLs.
+
+        Pages are downloaded with at most `max_concurrency` downloads at a time and `max_concurrency_per_host` per
+        host. Downloads that haven't finished `timeout` seconds after the call are stopped and their pages return an
+        error.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        return self._map_concurrently(urls, lambda url: self._load_content(url, deadline=deadline))
+
+    def close(self) -> None:
+        """Shuts down the extraction worker processes and closes pooled HTTP connections.
+
+        The scraper can still be used afterwards: both are recreated when they're needed again.
+        """
+        with self._extraction_executor_lock:
+            executor = self._extraction_executor
+            self._extraction_executor = None
 
-        config = use_config()
-        page = trafilatura.fetch_url(url, no_ssl=True)
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        with self._http_pool_lock:
+            if self._http_pool is not None:
+                self._http_pool.clear()
+
+    def __enter__(self) -> WebScraper:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def iter_content(self, url: str) -> Iterator[BaseArtifact]:
+        page = self._load_page(url)
+
+        duplicate_url = None if isinstance(page, ErrorArtifact) else self._find_duplicate_page(url, page)
+
+        if isinstance(page, ErrorArtifact):
+            yield page
+        elif duplicate_url:
+            yield self._duplicate_artifact(duplicate_url)
+        else:
+            yield from self._iter_page_chunks(url, page)
+
+    def iter_archive_content(self, path: str) -> Iterator[BaseArtifact]:
+        """Yields the content of pages stored in a WARC file or a directory of WARC or HTML files.
+
+        Pages are extracted and chunked on a worker pool with at most `archive_queue_size` records in flight and yielded
+        in archive order. Both run in the process pool if `extraction_processes` is set, so that they aren't held back
+        by the GIL.
+        """
+        records = iter_archive_records(path)
+        pending = deque()
+
+        with futures.ThreadPoolExecutor(max_workers=self.extraction_processes or self.max_concurrency) as executor:
+            try:
+                for record in records:
+                    pending.append((record.url, executor.submit(self._parse_archive_record, record)))
+
+                    if len(pending) >= self.archive_queue_size:
+                        yield from self._archive_artifacts(*pending.popleft())
+
+                while pending:
+                    yield from self._archive_artifacts(*pending.popleft())
+            finally:
+                # stop pending extractions if the consumer stops iterating early
+                for _, future in pending:
+                    future.cancel()
+
+    def _archive_artifacts(self, url: str, future: futures.Future) -> list[BaseArtifact]:
+        result = future.result()
+
+        if isinstance(result, ErrorArtifact):
+            return self._named_artifacts(url, result)
+        else:
+            page, chunks = result
+
+            return self._named_artifacts(url, self._page_content(url, page, [TextArtifact(c) for c in chunks]))
+
+    def _parse_archive_record(self, record: ArchiveRecord) -> tuple[dict, list[str]] | ErrorArtifact:
+        # unlike _parse_page, archived extractions are never cached since an archive is usually read only once
+        try:
+            result = self._run_extraction(extract_and_chunk_page, record.content, self.include_links)
+        except BrokenProcessPool:
+            return ErrorArtifact("error: web page extraction worker crashed")
+        except Exception as e:
+            return ErrorArtifact(f"error extracting web page content: {e}")
+
+        if result:
+            return json.loads(result[0]), result[1]
+        else:
+            return ErrorArtifact("error: can't load web page content")
+
+    def _map_concurrently(self, urls: list[str], func: Callable[[str], T | ErrorArtifact]) -> list[T | ErrorArtifact]:
+        host_semaphores = {}
+        host_semaphores_lock = threading.Lock()
+
+        def load(url: str) -> T | ErrorArtifact:
+            host = urlparse(url).netloc.lower()
+
+            with host_semaphores_lock:
+                semaphore = host_semaphores.setdefault(
+                    host, threading.BoundedSemaphore(self.max_concurrency_per_host)
+                )
 
-        # This disables signal, so that trafilatura can work on any thread:
-        # More info: https://trafilatura.readthedocs.io/en/latest/usage-python.html#disabling-signal
-        config.set("DEFAULT", "EXTRACTION_TIMEOUT", "0")
+            with semaphore:
+                try:
+                    return func(url)
+                except Exception as e:
+                    return ErrorArtifact(f"error: {e}")
 
-        # Disable error logging in trafilatura as it sometimes logs errors from lxml, even though
-        # the end result of page parsing is successful.
-        logging.getLogger("trafilatura").setLevel(logging.FATAL)
+        # Interleave URLs by host so that workers waiting on a busy host don't hold up the global pool.
+        urls_by_host = {}
 
+        for url in urls:
+            urls_by_host.setdefault(urlparse(url).netloc.lower(), []).append(url)
+
+        with futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures_by_url = {}
+
+            for host_urls in zip_longest(*urls_by_host.values()):
+                for url in host_urls:
+                    if url is not None and url not in futures_by_url:
+                        futures_by_url[url] = executor.submit(load, url)
+
+            return [futures_by_url[url].result() for url in urls]
+
+    def _named_artifacts(
+            self, url: str, result: list[TextArtifact] | ErrorArtifact | InfoArtifact
+    ) -> list[BaseArtifact]:
+        if isinstance(result, ErrorArtifact):
+            return [ErrorArtifact(f"{url}: {result.value}", name=url)]
+        elif isinstance(result, InfoArtifact):
+            return [InfoArtifact(f"{url}: {result.value}", name=url)]
+        else:
+            return [TextArtifact(a.value, name=url) for a in result]
+
+    def _extract_links(self, page: dict) -> list[str]:
+        # with include_links enabled trafilatura renders links as [anchor](target) in the extracted text
+        return re.findall(r"\[[^\]]*\]\(([^)\s]+)\)", page.get("text") or "")
+
+    def _load_content(
+            self, url: str, deadline: Optional[float] = None
+    ) -> list[TextArtifact] | ErrorArtifact | InfoArtifact:
+        page = self._load_page(url, deadline=deadline)
+
+        if isinstance(page, ErrorArtifact):
+            return page
+        else:
+            return self._page_content(url, page)
+
+    def _page_content(
+            self, url: str, page: dict, chunks: Optional[list[TextArtifact]] = None
+    ) -> list[TextArtifact] | InfoArtifact:
+        duplicate_url = self._find_duplicate_page(url, page)
+
+        if duplicate_url:
+            return self._duplicate_artifact(duplicate_url)
+        else:
+            return list(self._iter_page_chunks(url, page, chunks))
+
+    def _find_duplicate_page(self, url: str, page: dict) -> Optional[str]:
+        if self.near_duplicate_index:
+            return self.near_duplicate_index.add(page.get("text") or "", url)
+        else:
+            return None
+
+    def _duplicate_artifact(self, duplicate_url: str) -> InfoArtifact:
+        return InfoArtifact(f"content is a near-duplicate of {duplicate_url}, which was already loaded")
+
+    def _iter_page_chunks(
+            self, url: str, page: dict, chunks: Optional[list[TextArtifact]] = None
+    ) -> Iterator[TextArtifact]:
+        for chunk in self._iter_text_chunks(page) if chunks is None else chunks:
+            # chunks that repeat content already returned from other pages are skipped
+            if self.near_duplicate_index is None or self.near_duplicate_index.add(chunk.value, url) is None:
+                yield chunk
+
+    def _iter_text_chunks(self, page: dict) -> Iterator[TextArtifact]:
+        loader = TextLoader()
+
+        if self.streaming:
+            # Chunk the text a few paragraphs at a time instead of all at once. The last chunk of each block is
+            # carried over into the next block so that chunk boundaries don't depend on the block boundaries.
+            block_size = loader.max_tokens * 8
+            buffer = ""
+
+            for line in io.StringIO(page.get("text")):
+                buffer += line
+
+                if len(buffer) >= block_size:
+                    chunks = loader.text_to_artifacts(buffer)
+
+                    yield from chunks[:-1]
+
+                    buffer = self._carry_over_chunk(buffer, chunks[-1].value) if chunks else ""
+
+            if buffer:
+                yield from loader.text_to_artifacts(buffer)
+        else:
+            yield from loader.text_to_artifacts(page.get("text"))
+
+        if page.get("truncated"):
+            yield TextArtifact(f"[content truncated: page exceeds the {self.max_download_size} byte download limit]")
+
+    def _carry_over_chunk(self, block: str, chunk: str) -> str:
+        """Returns the last chunk of a block with the whitespace that ended the block.
+
+        Chunkers strip their chunks, so without it the next line would be glued onto the chunk's last word.
+        """
+        block_tail = block[len(block.rstrip()):]
+        chunk_tail = chunk[len(chunk.rstrip()):]
+
+        return chunk + block_tail[len(chunk_tail):]
+
+    def _load_page(self, url: str, deadline: Optional[float] = None) -> dict | ErrorArtifact:
+        page = self._fetch_page(url, deadline=deadline)
+
+        if page is None and deadline is not None and time.monotonic() >= deadline:
+            return ErrorArtifact("error: web page didn't load in time")
+        else:
+            return self._parse_page(url, page)
+
+    def _parse_page(self, url: str, page: Optional[str | bytes]) -> dict | ErrorArtifact:
         if page is None:
             return ErrorArtifact("error: can't access URL")
+
+        # extractions are keyed by the page content, so they're never served for a page that has since changed
+        extraction_key = self._extraction_key(page) if self.page_cache else None
+        extraction = self.page_cache.get_extraction(extraction_key) if self.page_cache else None
+
+        if extraction is None:
+            try:
+                content = self._extract_page(page)
+            except BrokenProcessPool:
+                return ErrorArtifact("error: web page extraction worker crashed")
+            except Exception as e:
+                return ErrorArtifact(f"error extracting web page content: {e}")
+
+            if not content:
+                return ErrorArtifact("error: can't load web page content")
+
+            extraction = json.loads(content)
+
+            if self.page_cache:
+                self.page_cache.put_extraction(extraction_key, extraction)
+
+        # downloads are cut off one byte past the limit so that oversized pages can be told apart
+        if self.max_download_size is not None and len(page) > self.max_download_size:
+            extraction = {**extraction, "truncated": True}
+
+        return extraction
+
+    def _extraction_key(self, page: str | bytes) -> str:
+        page_hash = str_to_hash(page) if isinstance(page, str) else hashlib.sha256(page).hexdigest()
+
+        return f"{self.include_links}:{page_hash}"
+
+    def _fetch_page(
+            self, url: str, deadline: Optional[float] = None, revalidate: bool = False
+    ) -> Optional[str | bytes]:
+        if self.page_cache:
+            return self.page_cache.fetch_page(
+                url,
+                lambda download_url, headers: self._download_page(download_url, headers, deadline=deadline),
+                revalidate=revalidate
+            )
         else:
-            content = trafilatura.extract(
-                    page,
-                    include_links=self.include_links,
-                    output_format="json",
-                    config=config
+            # pages are always downloaded with _download_page, so that download_timeout and deadlines apply to them
+            response = self._download_page(url, {}, deadline=deadline)
+
+            return response.content if response and response.status == 200 else None
+
+    def _download_page(self, url: str, headers: dict, deadline: Optional[float] = None) -> Optional[PageDownload]:
+        import urllib3
+        from trafilatura.downloads import DEFAULT_HEADERS
+
+        http_pool = self._get_http_pool()
+
+        if deadline is None:
+            request_options = {}
+        elif deadline <= time.monotonic():
+            return None
+        else:
+            # the deadline leaves no time for retries, and no single read may outlast it
+            request_options = {
+                "timeout": urllib3.Timeout(total=min(self.download_timeout, deadline - time.monotonic())),
+                "retries": urllib3.Retry(total=None, connect=0, read=0, redirect=2)
+            }
+
+        try:
+            response = http_pool.request(
+                "GET", url, headers={**DEFAULT_HEADERS, **headers}, preload_content=False, **request_options
+            )
+            content = bytearray()
+            truncated = False
+            timed_out = False
+
+            try:
+                for data in response.stream(64 * 1024):
+                    content.extend(data)
+
+                    if self.max_download_size is not None and len(content) > self.max_download_size:
+                        truncated = True
+
+                        del content[self.max_download_size + 1:]
+
+                        break
+                    elif deadline is not None and time.monotonic() > deadline:
+                        timed_out = True
+
+                        break
+            finally:
+                if truncated or timed_out:
+                    # the rest of the body is never read, so the connection can't be reused
+                    response.close()
+                else:
+                    response.release_conn()
+
+            if timed_out:
+                logging.debug(f"error downloading {url}: the download didn't finish in time")
+
+                return None
+
+            return PageDownload(status=response.status, content=bytes(content), headers=dict(response.headers))
+        except Exception as e:
+            logging.debug(f"error downloading {url}: {e}")
+
+            return None
+
+    def _get_http_pool(self) -> PoolManager:
+        import urllib3
+
+        with self._http_pool_lock:
+            # downloads run on several threads, and all of them have to share a single pool
+            if self._http_pool is None:
+                self._http_pool = urllib3.PoolManager(
+                    cert_reqs="CERT_NONE",
+                    retries=urllib3.Retry(total=2, redirect=2),
+                    timeout=self.download_timeout
                 )
 
-            if content:
-                return json.loads(content)
-            else:
-                return ErrorArtifact("error: can't load web page content")
+            return self._http_pool
+
+    def _extract_page(self, page: str | bytes) -> Optional[str]:
+        return self._run_extraction(extract_page, page, self.include_links)
+
+    def _run_extraction(self, func: Callable[..., T], *args) -> T:
+        if self.extraction_processes:
+            executor = self._get_extraction_executor()
+
+            try:
+                # only the page content crosses the process boundary; the tool itself is never pickled
+                return executor.submit(func, *args).result()
+            except BrokenProcessPool:
+                self._reset_extraction_executor(executor)
+
+                raise
+        else:
+            return func(*args)
+
+    def _get_extraction_executor(self) -> futures.ProcessPoolExecutor:
+        with self._extraction_executor_lock:
+            if self._extraction_executor is None:
+                # spawn avoids forking the threads of the calling process
+                self._extraction_executor = futures.ProcessPoolExecutor(
+                    max_workers=self.extraction_processes,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+
+            return self._extraction_executor
+
+    def _reset_extraction_executor(self, broken_executor: futures.ProcessPoolExecutor) -> None:
+        with self._extraction_executor_lock:
+            # another thread might have already replaced the broken pool
+            if self._extraction_executor is broken_executor:
+                self._extraction_executor = None
+
+        broken_executor.shutdown(wait=False)
+
+
+def extract_page(page: str | bytes, include_links: bool) -> Optional[str]:
+    import trafilatura
+    from trafilatura.settings import use_config
+
+    config = use_config()
+
+    # This disables signal, so that trafilatura can work on any thread:
+    # More info: https://trafilatura.readthedocs.io/en/latest/usage-python.html#disabling-signal
+    config.set("DEFAULT", "EXTRACTION_TIMEOUT", "0")
+
+    # Disable error logging in trafilatura as it sometimes logs errors from lxml, even though
+    # the end result of page parsing is successful.
+    logging.getLogger("trafilatura").setLevel(logging.FATAL)
+
+    return trafilatura.extract(
+        page,
+        include_links=include_links,
+        output_format="json",
+        config=config
+    )
+
+
+def extract_and_chunk_page(page: str | bytes, include_links: bool) -> Optional[tuple[str, list[str]]]:
+    """Returns the extracted page and its text chunks, so that both can run in an extraction worker process."""
+    content = extract_page(page, include_links)
+
+    if content:
+        return content, [chunk.value for chunk in TextLoader().text_to_artifacts(json.loads(content).get("text"))]
+    else:
+        return None
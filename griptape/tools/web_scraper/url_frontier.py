@@ -0,0 +1,139 @@
+from __future__ import annotations
+import hashlib
+import math
+import posixpath
+import threading
+import time
+from collections import deque
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, urljoin, parse_qsl, urlencode
+from attr import define, field, Factory
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str, base_url: Optional[str] = None) -> Optional[str]:
+    """Returns a canonical form of an HTTP URL or None if the URL can't be crawled.
+
+    Relative URLs are resolved against `base_url`. The scheme and host are lowercased, default ports, fragments, and
+    `utm_*` tracking parameters are dropped, dot segments are resolved, and query parameters are sorted.
+    """
+    try:
+        parts = urlsplit(urljoin(base_url, url.strip()) if base_url else url.strip())
+        scheme = parts.scheme.lower()
+
+        if scheme not in DEFAULT_PORTS or not parts.hostname:
+            return None
+
+        host = parts.hostname.lower()
+        port = parts.port
+    except ValueError:
+        return None
+
+    netloc = host if port is None or port == DEFAULT_PORTS[scheme] else f"{host}:{port}"
+    path = posixpath.normpath(parts.path) if parts.path else "/"
+
+    # normpath strips trailing slashes and keeps a leading double slash, neither of which are path changes in URLs
+    if parts.path.endswith("/") and not path.endswith("/"):
+        path += "/"
+
+    if path.startswith("//"):
+        path = "/" + path.lstrip("/")
+
+    query = urlencode(
+        sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not k.startswith("utm_"))
+    )
+
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+@define
+class BloomFilter:
+    """Memory-bounded set membership with a configurable false positive rate and no false negatives."""
+    capacity: int = field(default=100_000, kw_only=True)
+    error_rate: float = field(default=0.001, kw_only=True)
+    bit_count: int = field(
+        default=Factory(
+            lambda self: math.ceil(-self.capacity * math.log(self.error_rate) / math.log(2) ** 2), takes_self=True
+        ),
+        init=False
+    )
+    hash_count: int = field(
+        default=Factory(lambda self: max(1, round(self.bit_count / self.capacity * math.log(2))), takes_self=True),
+        init=False
+    )
+    _bits: bytearray = field(
+        default=Factory(lambda self: bytearray((self.bit_count + 7) // 8), takes_self=True),
+        init=False
+    )
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[i // 8] & (1 << (i % 8)) for i in self._bit_indexes(item))
+
+    def add(self, item: str) -> bool:
+        """Adds an item and returns True if it wasn't in the filter before."""
+        added = False
+
+        with self._lock:
+            for i in self._bit_indexes(item):
+                if not self._bits[i // 8] & (1 << (i % 8)):
+                    self._bits[i // 8] |= 1 << (i % 8)
+
+                    added = True
+
+        return added
+
+    def _bit_indexes(self, item: str) -> list[int]:
+        # double hashing: k indexes from two independent 64-bit hashes
+        digest = hashlib.sha256(item.encode()).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+
+        return [(h1 + i * h2) % self.bit_count for i in range(self.hash_count)]
+
+
+@define
+class UrlFrontier:
+    """Breadth-first queue of URLs to crawl with a Bloom filter seen-set and per-host politeness delays."""
+    politeness_delay: float = field(default=1.0, kw_only=True)
+    max_size: int = field(default=10_000, kw_only=True)
+    seen: BloomFilter = field(default=Factory(lambda: BloomFilter()), kw_only=True)
+    allowed_hosts: Optional[set[str]] = field(default=None, kw_only=True)
+    _queue: deque[tuple[str, int]] = field(factory=deque, init=False)
+    _next_request_times: dict[str, float] = field(factory=dict, init=False)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def add(self, url: str, depth: int, base_url: Optional[str] = None) -> Optional[str]:
+        """Normalizes and enqueues a URL. Returns the normalized URL or None if it was invalid, seen, or dropped."""
+        normalized_url = normalize_url(url, base_url)
+
+        if normalized_url is None or len(self._queue) >= self.max_size:
+            return None
+        elif self.allowed_hosts is not None and urlsplit(normalized_url).netloc not in self.allowed_hosts:
+            return None
+        elif not self.seen.add(normalized_url):
+            return None
+
+        self._queue.append((normalized_url, depth))
+
+        return normalized_url
+
+    def pop(self, count: int) -> list[tuple[str, int]]:
+        return [self._queue.popleft() for _ in range(min(count, len(self._queue)))]
+
+    def wait_for_host(self, url: str) -> None:
+        """Blocks until `politeness_delay` seconds have passed since the last request to the URL's host."""
+        host = urlsplit(url).netloc
+
+        with self._lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_times.get(host, now))
+
+            self._next_request_times[host] = request_time + self.politeness_delay
+
+        if request_time > now:
+            time.sleep(request_time - now)
@@ -0,0 +1,9 @@
+from .search_cache import SearchCache
+from .drivers import BaseSearchDriver, GoogleSearchDriver, LocalIndexSearchDriver
+
+__all__ = [
+    "SearchCache",
+    "BaseSearchDriver",
+    "GoogleSearchDriver",
+    "LocalIndexSearchDriver"
+]
@@ -0,0 +1,9 @@
+from .base_search_driver import BaseSearchDriver
+from .google_search_driver import GoogleSearchDriver
+from .local_index_search_driver import LocalIndexSearchDriver
+
+__all__ = [
+    "BaseSearchDriver",
+    "GoogleSearchDriver",
+    "LocalIndexSearchDriver"
+]
@@ -0,0 +1,23 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from attr import define
+
+
+@define
+class BaseSearchDriver(ABC):
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        ...
+
+    @abstractmethod
+    def search(self, query: str, results_count: int) -> tuple[list[dict], list[str]]:
+        """Returns up to `results_count` results in rank order and the errors of any partial failures.
+
+        Results are dicts with `url`, `title`, and `description` keys. Raises if no results could be loaded at all.
+        """
+        ...
+
+    def cache_key_parameters(self) -> list[str | int]:
+        """Returns the driver settings that change search results, so that cached results aren't shared across them."""
+        return [self.name]
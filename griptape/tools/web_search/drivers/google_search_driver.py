@@ -0,0 +1,113 @@
+from __future__ import annotations
+import math
+import threading
+from concurrent import futures
+from typing import TYPE_CHECKING, Optional
+from attr import define, field, Factory
+from griptape.tools.web_search.drivers.base_search_driver import BaseSearchDriver
+
+if TYPE_CHECKING:
+    from requests import Session
+
+
+@define
+class GoogleSearchDriver(BaseSearchDriver):
+    API_URL = "https://www.googleapis.com/customsearch/v1"
+    # the Custom Search API returns at most 10 results per request and 100 results per query
+    PAGE_SIZE = 10
+    MAX_RESULTS = 100
+
+    api_key: str = field(kw_only=True)
+    search_id: str = field(kw_only=True)
+    lang: str = field(default="lang_en", kw_only=True)
+    country: str = field(default="us", kw_only=True)
+    _session: Optional[Session] = field(default=None, init=False)
+    _session_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    @property
+    def name(self) -> str:
+        return "Google"
+
+    def cache_key_parameters(self) -> list[str | int]:
+        return [self.name, self.search_id, self.lang, self.country]
+
+    def search(self, query: str, results_count: int) -> tuple[list[dict], list[str]]:
+        """Requests result pages concurrently and deduplicates results by URL."""
+        results_count = min(results_count, self.MAX_RESULTS)
+        page_starts = [1 + i * self.PAGE_SIZE for i in range(math.ceil(results_count / self.PAGE_SIZE))]
+
+        if len(page_starts) == 1:
+            pages = [self._search_page(query, 1, results_count)]
+        else:
+            with futures.ThreadPoolExecutor(max_workers=len(page_starts)) as executor:
+                pages = [
+                    executor.submit(self._search_page, query, start, self.PAGE_SIZE)
+                    for start in page_starts
+                ]
+
+                pages = [self._page_result(start, page) for start, page in zip(page_starts, pages)]
+
+        results = {}
+        errors = []
+
+        for page in pages:
+            if isinstance(page, str):
+                errors.append(page)
+            else:
+                for result in page:
+                    results.setdefault(result["url"], result)
+
+        return list(results.values())[:results_count], errors
+
+    def _page_result(self, start: int, future: futures.Future) -> list[dict] | str:
+        try:
+            return future.result()
+        except Exception as e:
+            return f"results {start}-{start + self.PAGE_SIZE - 1}: {e}"
+
+    def _search_page(self, query: str, start: int, num: int) -> list[dict]:
+        response = self._get_session().get(
+            self.API_URL,
+            params={
+                "key": self.api_key,
+                "cx": self.search_id,
+                "q": query,
+                "start": start,
+                "lr": self.lang,
+                "num": num,
+                "gl": self.country,
+                # partial response: skip pagemap, metatags, images, and the request metadata
+                "fields": "items(link,title,snippet)"
+            },
+            # Google APIs only compress responses for user agents that ask for it
+            headers={"Accept-Encoding": "gzip", "User-Agent": "griptape (gzip)"}
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+
+            # pages past the last result have no items
+            links = [{
+                "url": r["link"],
+                "title": r["title"],
+                "description": r["snippet"],
+            } for r in data.get("items", [])]
+
+            return links
+        else:
+            raise Exception(f"Google Search API returned an error with status code "
+                            f"{response.status_code} and reason '{response.reason}'")
+
+    def _get_session(self) -> Session:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        with self._session_lock:
+            if self._session is None:
+                # concurrent page requests share one keep-alive connection pool
+                adapter = HTTPAdapter(pool_maxsize=math.ceil(self.MAX_RESULTS / self.PAGE_SIZE))
+                self._session = requests.Session()
+
+                self._session.mount("https://", adapter)
+
+            return self._session
@@ -0,0 +1,161 @@
+from __future__ import annotations
+import heapq
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter
+from typing import Iterable, Optional
+from attr import define, field, Factory
+from griptape.tools.web_search.drivers.base_search_driver import BaseSearchDriver
+
+
+def tokenize(text: str) -> list[str]:
+    return re.findall(r"\w+", text.casefold())
+
+
+@define
+class LocalIndexSearchDriver(BaseSearchDriver):
+    """Searches an on-disk inverted index of local documents ranked with BM25.
+
+    The index is a SQLite file with a postings table keyed by term, so a query only reads the postings of its own
+    terms. Documents are added with `add_documents()` and identified by URL; re-adding a URL replaces the document.
+    """
+    path: str = field(kw_only=True)
+    k1: float = field(default=1.2, kw_only=True)
+    b: float = field(default=0.75, kw_only=True)
+    description_length: int = field(default=200, kw_only=True)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _corpus_stats: Optional[tuple[int, float]] = field(default=None, init=False)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    @property
+    def name(self) -> str:
+        return "local index"
+
+    def cache_key_parameters(self) -> list[str | int]:
+        return [self.name, self.path]
+
+    def add_documents(self, documents: Iterable[dict]) -> int:
+        """Indexes dicts with `url`, `text`, and optional `title` and `description` keys and returns their count."""
+        count = 0
+
+        with self._lock:
+            connection = self._get_connection()
+
+            with connection:
+                for document in documents:
+                    text = document.get("text") or ""
+                    title = document.get("title") or ""
+                    term_counts = Counter(tokenize(f"{title}\n{text}"))
+
+                    self._delete_document(connection, document["url"])
+
+                    doc_id = connection.execute(
+                        "INSERT INTO documents (url, title, description, length) VALUES (?, ?, ?, ?)",
+                        (
+                            document["url"],
+                            title,
+                            document.get("description") or text[:self.description_length],
+                            sum(term_counts.values())
+                        )
+                    ).lastrowid
+
+                    connection.executemany(
+                        "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                        ((term, doc_id, tf) for term, tf in term_counts.items())
+                    )
+
+                    count += 1
+
+            self._corpus_stats = None
+
+        return count
+
+    def remove_document(self, url: str) -> None:
+        with self._lock:
+            connection = self._get_connection()
+
+            with connection:
+                self._delete_document(connection, url)
+
+            self._corpus_stats = None
+
+    def search(self, query: str, results_count: int) -> tuple[list[dict], list[str]]:
+        terms = list(dict.fromkeys(tokenize(query)))
+
+        if not terms:
+            return [], []
+
+        with self._lock:
+            connection = self._get_connection()
+            document_count, average_length = self._get_corpus_stats(connection)
+            rows = connection.execute(
+                f"SELECT p.term, p.doc_id, p.tf, d.length FROM postings p JOIN documents d ON d.id = p.doc_id "
+                f"WHERE p.term IN ({', '.join('?' * len(terms))})",
+                terms
+            ).fetchall()
+
+            document_frequencies = Counter(term for term, _, _, _ in rows)
+            scores = {}
+
+            for term, doc_id, tf, length in rows:
+                df = document_frequencies[term]
+                idf = math.log((document_count - df + 0.5) / (df + 0.5) + 1)
+                norm = tf + self.k1 * (1 - self.b + self.b * length / average_length)
+
+                scores[doc_id] = scores.get(doc_id, 0) + idf * tf * (self.k1 + 1) / norm
+
+            top = heapq.nlargest(results_count, scores.items(), key=lambda item: (item[1], -item[0]))
+            documents = {
+                doc_id: (url, title, description)
+                for doc_id, url, title, description in connection.execute(
+                    f"SELECT id, url, title, description FROM documents "
+                    f"WHERE id IN ({', '.join('?' * len(top))})",
+                    [doc_id for doc_id, _ in top]
+                )
+            }
+
+        return [
+            {
+                "url": documents[doc_id][0],
+                "title": documents[doc_id][1],
+                "description": documents[doc_id][2]
+            }
+            for doc_id, _ in top
+        ], []
+
+    def _delete_document(self, connection: sqlite3.Connection, url: str) -> None:
+        row = connection.execute("SELECT id FROM documents WHERE url = ?", (url,)).fetchone()
+
+        if row:
+            connection.execute("DELETE FROM postings WHERE doc_id = ?", row)
+            connection.execute("DELETE FROM documents WHERE id = ?", row)
+
+    def _get_corpus_stats(self, connection: sqlite3.Connection) -> tuple[int, float]:
+        if self._corpus_stats is None:
+            document_count, average_length = connection.execute(
+                "SELECT COUNT(*), AVG(length) FROM documents"
+            ).fetchone()
+
+            self._corpus_stats = (document_count, average_length or 1.0)
+
+        return self._corpus_stats
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS documents "
+                    "(id INTEGER PRIMARY KEY, url TEXT UNIQUE, title TEXT, description TEXT, length INTEGER)"
+                )
+                # clustered by term so that a query reads only the postings of its own terms
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS postings "
+                    "(term TEXT, doc_id INTEGER, tf INTEGER, PRIMARY KEY (term, doc_id)) WITHOUT ROWID"
+                )
+                self._connection.execute("CREATE INDEX IF NOT EXISTS postings_doc_id ON postings (doc_id)")
+
+        return self._connection
@@ -0,0 +1,224 @@
+from __future__ import annotations
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Optional
+from attr import define, field, Factory
+
+SearchResults = tuple[list[dict], list[str]]
+
+
+def normalize_query(query: str) -> str:
+    """Returns a canonical form of a search query that ignores case, whitespace, and surrounding punctuation.
+
+    Punctuation inside words is kept so that operators like `site:foo.com`, `-term`, and quoted phrases still work.
+    """
+    words = (word.strip(",.;!?()[]{}'") for word in unicodedata.normalize("NFKC", query).casefold().split())
+
+    return " ".join(word for word in words if word)
+
+
+@define
+class BaseSearchCacheBackend(ABC):
+    max_entries: int = field(default=10_000, kw_only=True)
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[tuple[float, list[dict]]]:
+        """Returns the time the results were stored at and the results."""
+        ...
+
+    @abstractmethod
+    def put(self, key: str, stored_at: float, results: list[dict]) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+@define
+class MemorySearchCacheBackend(BaseSearchCacheBackend):
+    _entries: OrderedDict[str, tuple[float, list[dict]]] = field(factory=OrderedDict, init=False)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    def get(self, key: str) -> Optional[tuple[float, list[dict]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def put(self, key: str, stored_at: float, results: list[dict]) -> None:
+        with self._lock:
+            self._entries[key] = (stored_at, results)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@define
+class SqliteSearchCacheBackend(BaseSearchCacheBackend):
+    """Persists search results in a SQLite file that can be shared by multiple processes on the same host."""
+    path: str = field(kw_only=True)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    def get(self, key: str) -> Optional[tuple[float, list[dict]]]:
+        with self._lock:
+            row = self._get_connection().execute(
+                "SELECT stored_at, results FROM search_results WHERE key = ?", (key,)
+            ).fetchone()
+
+            return (row[0], json.loads(row[1])) if row else None
+
+    def put(self, key: str, stored_at: float, results: list[dict]) -> None:
+        with self._lock:
+            connection = self._get_connection()
+
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO search_results (key, stored_at, results) VALUES (?, ?, ?)",
+                    (key, stored_at, json.dumps(results))
+                )
+                connection.execute(
+                    "DELETE FROM search_results WHERE key NOT IN "
+                    "(SELECT key FROM search_results ORDER BY stored_at DESC LIMIT ?)",
+                    (self.max_entries,)
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._get_connection()
+
+            with connection:
+                connection.execute("DELETE FROM search_results")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS search_results (key TEXT PRIMARY KEY, stored_at REAL, results TEXT)"
+                )
+                self._connection.execute(
+                    "CREATE INDEX IF NOT EXISTS search_results_stored_at ON search_results (stored_at)"
+                )
+
+        return self._connection
+
+
+@define
+class SearchCache:
+    """Caches search results with stale-while-revalidate semantics.
+
+    Results younger than `ttl` seconds are served as is. Results younger than `stale_ttl` seconds are served
+    immediately and refreshed in the background. Older results are treated as missing. Incomplete results are never
+    cached.
+    """
+    backend: BaseSearchCacheBackend = field(default=Factory(lambda: MemorySearchCacheBackend()), kw_only=True)
+    ttl: float = field(default=3600, kw_only=True)
+    stale_ttl: float = field(default=24 * 3600, kw_only=True)
+    _refreshing: set[str] = field(factory=set, init=False)
+    _counters: dict[str, int] = field(
+        default=Factory(lambda: {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0
+        }),
+        init=False
+    )
+    _lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
+
+    @property
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            stats = dict(self._counters)
+
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+
+        return stats
+
+    @staticmethod
+    def build_key(query: str, *parameters: str | int) -> str:
+        return json.dumps([normalize_query(query), *parameters])
+
+    def get_or_search(self, key: str, search: Callable[[], SearchResults]) -> SearchResults:
+        try:
+            entry = self.backend.get(key)
+        except Exception as e:
+            logging.warning(f"error reading search cache: {e}")
+
+            entry = None
+
+        age = time.time() - entry[0] if entry else None
+
+        if age is not None and age <= self.ttl:
+            self._count("hits")
+
+            return entry[1], []
+        elif age is not None and age <= self.stale_ttl:
+            self._count("stale_hits")
+            self._refresh_in_background(key, search)
+
+            return entry[1], []
+        else:
+            self._count("misses")
+
+            return self._search(key, search)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def _search(self, key: str, search: Callable[[], SearchResults]) -> SearchResults:
+        results, errors = search()
+
+        if not errors:
+            try:
+                self.backend.put(key, time.time(), results)
+            except Exception as e:
+                logging.warning(f"error writing search cache: {e}")
+
+        return results, errors
+
+    def _refresh_in_background(self, key: str, search: Callable[[], SearchResults]) -> None:
+        with self._lock:
+            # one refresh per key at a time
+            if key in self._refreshing:
+                return
+
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                _, errors = self._search(key, search)
+
+                self._count("refresh_errors" if errors else "refreshes")
+            except Exception as e:
+                logging.warning(f"error refreshing search cache: {e}")
+
+                self._count("refresh_errors")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
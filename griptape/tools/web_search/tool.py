@@ -1,18 +1,39 @@
 from __future__ import annotations
-from attr import define, field
-from griptape.artifacts import TextArtifact, ErrorArtifact
+import threading
+from concurrent import futures
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Optional
+from attr import define, field, Factory
+from griptape.artifacts import BaseArtifact, TextArtifact, ErrorArtifact
 from schema import Schema, Literal
 from griptape.core import BaseTool
 from griptape.core.decorators import activity
+from griptape.tools.web_search.search_cache import SearchCache
+
+from griptape.tools.web_search.drivers import BaseSearchDriver, GoogleSearchDriver
+
+if TYPE_CHECKING:
+    from griptape.tools import WebScraper
 
 
 @define
 class WebSearch(BaseTool):
     results_count: int = field(default=5, kw_only=True)
     google_api_lang: str = field(default="lang_en", kw_only=True)
-    google_api_key: str = field(kw_only=True)
-    google_api_search_id: str = field(kw_only=True)
+    google_api_key: Optional[str] = field(default=None, kw_only=True)
+    google_api_search_id: Optional[str] = field(default=None, kw_only=True)
     google_api_country: str = field(default="us", kw_only=True)
+    search_driver: BaseSearchDriver = field(
+        default=Factory(lambda self: self._default_search_driver(), takes_self=True),
+        kw_only=True
+    )
+    rank_fusion_k: int = field(default=60, kw_only=True)
+    max_concurrency: int = field(default=4, kw_only=True)
+    search_cache: Optional[SearchCache] = field(default=None, kw_only=True)
+    web_scraper: Optional[WebScraper] = field(default=None, kw_only=True)
+    page_fetch_timeout: float = field(default=10, kw_only=True)
+    fetch_results_count: int = field(default=3, kw_only=True)
+    _web_scraper_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()), init=False)
 
     @activity(config={
         "description": "Can be used for searching the web",
@@ -24,40 +45,147 @@ class WebSearch(BaseTool):
             ): str
         })
     })
-    def search(self, props: dict) -> list[TextArtifact] | ErrorArtifact:
+    def search(self, props: dict) -> list[BaseArtifact] | ErrorArtifact:
         query = props["values"]["query"]
 
         try:
+            results, errors = self._search(query)
+        except Exception as e:
+            return ErrorArtifact(f"error searching {self.search_driver.name}: {e}")
+
+        return self._search_artifacts(results, errors)
+
+    @activity(config={
+        "description": "Can be used for searching the web with multiple related queries at once. Results of all "
+                       "queries are merged into a single ranked list",
+        "uses_default_memory": False,
+        "schema": Schema({
+            Literal(
+                "queries",
+                description="List of search engine requests that return lists of pages with titles, descriptions, "
+                            "and URLs"
+            ): list[str]
+        })
+    })
+    def search_many(self, props: dict) -> list[BaseArtifact] | ErrorArtifact:
+        queries = list(dict.fromkeys(props["values"]["queries"]))
+        errors = []
+
+        # the number of queries is up to the LLM, so it doesn't bound the number of concurrent requests
+        with futures.ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(queries)))) as executor:
+            query_futures = [executor.submit(self._search, query) for query in queries]
+            rankings = []
+
+            for query, future in zip(queries, query_futures):
+                try:
+                    results, query_errors = future.result()
+                except Exception as e:
+                    results, query_errors = [], [str(e)]
+
+                rankings.append(results)
+                errors.extend(f"{query}: {error}" for error in query_errors)
+
+        results = self._fuse_rankings(rankings)
+
+        return self._search_artifacts(results, errors)
+
+    @activity(config={
+        "description": "Can be used for searching the web and loading the content of the top result pages at once",
+        "schema": Schema({
+            Literal(
+                "query",
+                description="Search engine request that returns a list of pages with titles, descriptions, and URLs"
+            ): str
+        })
+    })
+    def search_and_fetch(self, props: dict) -> list[BaseArtifact] | ErrorArtifact:
+        query = props["values"]["query"]
+
+        try:
+            results, errors = self._search(query)
+        except Exception as e:
+            return ErrorArtifact(f"error searching {self.search_driver.name}: {e}")
+
+        if errors and not results:
+            return ErrorArtifact(f"error searching {self.search_driver.name}: {'; '.join(errors)}")
+
+        # only the top results are loaded, the others are returned with their search snippet only
+        contents = self._get_web_scraper().load_contents(
+            [result["url"] for result in results[:self.fetch_results_count]], timeout=self.page_fetch_timeout
+        )
+        artifacts = []
+
+        for result, content in zip_longest(results, contents):
+            if isinstance(content, list) and content:
+                artifacts.extend(TextArtifact(a.value, name=result["url"]) for a in content)
+            else:
+                # pages that time out or fail are returned with their search snippet only
+                artifacts.append(TextArtifact(str(result), name=result["url"]))
+
+        return artifacts + [
+            ErrorArtifact(f"error searching {self.search_driver.name}, results are incomplete: {error}")
+            for error in errors
+        ]
+
+    def _get_web_scraper(self) -> WebScraper:
+        from griptape.tools import WebScraper
+
+        with self._web_scraper_lock:
+            if self.web_scraper is None:
+                self.web_scraper = WebScraper(
+                    download_timeout=self.page_fetch_timeout,
+                    install_dependencies_on_init=False
+                )
+
+            return self.web_scraper
+
+    def _search_artifacts(self, results: list[dict], errors: list[str]) -> list[BaseArtifact] | ErrorArtifact:
+        if errors and not results:
+            return ErrorArtifact(f"error searching {self.search_driver.name}: {'; '.join(errors)}")
+        else:
             return [
                 TextArtifact(str(result))
-                for result in self._search_google(query)
+                for result in results
+            ] + [
+                ErrorArtifact(f"error searching {self.search_driver.name}, results are incomplete: {error}")
+                for error in errors
             ]
-        except Exception as e:
-            return ErrorArtifact(f"error searching Google: {e}")
-
-    def _search_google(self, query: str) -> list[dict]:
-        import requests
-
-        url = f"https://www.googleapis.com/customsearch/v1?" \
-              f"key={self.google_api_key}&" \
-              f"cx={self.google_api_search_id}&" \
-              f"q={query}&" \
-              f"start=0&" \
-              f"lr={self.google_api_lang}&" \
-              f"num={self.results_count}&" \
-              f"gl={self.google_api_country}"
-        response = requests.get(url)
-
-        if response.status_code == 200:
-            data = response.json()
-
-            links = [{
-                "url": r["link"],
-                "title": r["title"],
-                "description": r["snippet"],
-            } for r in data["items"]]
-
-            return links
+
+    def _fuse_rankings(self, rankings: list[list[dict]]) -> list[dict]:
+        """Merges ranked result lists with reciprocal rank fusion and returns the top `results_count` results.
+
+        Each result scores 1 / (`rank_fusion_k` + rank) in every list it appears in, so results that rank well for
+        several queries come first. Ties keep the order in which results were first seen.
+        """
+        scores = {}
+        results = {}
+
+        for ranking in rankings:
+            for rank, result in enumerate(ranking, start=1):
+                scores[result["url"]] = scores.get(result["url"], 0) + 1 / (self.rank_fusion_k + rank)
+
+                results.setdefault(result["url"], result)
+
+        return [
+            results[url] for url in sorted(scores, key=lambda url: scores[url], reverse=True)
+        ][:self.results_count]
+
+    def _search(self, query: str) -> tuple[list[dict], list[str]]:
+        if self.search_cache:
+            return self.search_cache.get_or_search(
+                SearchCache.build_key(query, *self.search_driver.cache_key_parameters(), self.results_count),
+                lambda: self.search_driver.search(query, self.results_count)
+            )
         else:
-            raise Exception(f"Google Search API returned an error with status code "
-                            f"{response.status_code} and reason '{response.reason}'")
+            return self.search_driver.search(query, self.results_count)
+
+    def _default_search_driver(self) -> BaseSearchDriver:
+        if self.google_api_key is None or self.google_api_search_id is None:
+            raise ValueError("google_api_key and google_api_search_id are required when search_driver isn't set")
+
+        return GoogleSearchDriver(
+            api_key=self.google_api_key,
+            search_id=self.google_api_search_id,
+            lang=self.google_api_lang,
+            country=self.google_api_country
+        )
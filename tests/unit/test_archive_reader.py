@@ -0,0 +1,79 @@
+import gzip
+import pytest
+from griptape.tools.web_scraper.archive_reader import iter_archive_records, iter_warc_records
+
+
+def warc_record(url: str, block: bytes, record_type: str = "response", content_type: str = None) -> bytes:
+    content_type = content_type or ("application/http; msgtype=response" if record_type == "response" else "text/html")
+
+    return (
+        f"WARC/1.0\r\nWARC-Type: {record_type}\r\nWARC-Target-URI: {url}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(block)}\r\n\r\n"
+    ).encode() + block + b"\r\n\r\n"
+
+
+def http_response(body: bytes, status: str = "200 OK", headers: str = "Content-Type: text/html\r\n") -> bytes:
+    return f"HTTP/1.1 {status}\r\n{headers}\r\n".encode() + body
+
+
+class TestArchiveReader:
+    @pytest.fixture
+    def records(self):
+        return [
+            warc_record("https://foo.com/1", http_response(b"<p>one</p>")),
+            warc_record("https://foo.com/2", http_response(b"<p>missing</p>", status="404 Not Found")),
+            warc_record("https://foo.com/3", http_response(b"{}", headers="Content-Type: application/json\r\n")),
+            warc_record(
+                "https://foo.com/4",
+                http_response(b"5\r\n<p>fo\r\n6\r\nur</p>\r\n0\r\n\r\n", headers="Transfer-Encoding: chunked\r\n")
+            ),
+            warc_record(
+                "https://foo.com/5",
+                http_response(gzip.compress(b"<p>five</p>"), headers="Content-Encoding: gzip\r\n")
+            ),
+            warc_record("https://foo.com/6", b"<p>six</p>", record_type="resource"),
+            warc_record("https://foo.com/7", b"GET / HTTP/1.1\r\n\r\n", record_type="request")
+        ]
+
+    def test_iter_warc_records(self, records, tmp_path):
+        path = tmp_path / "pages.warc"
+
+        path.write_bytes(b"".join(records))
+
+        assert [(r.url, r.content) for r in iter_warc_records(str(path))] == [
+            ("https://foo.com/1", b"<p>one</p>"),
+            ("https://foo.com/4", b"<p>four</p>"),
+            ("https://foo.com/5", b"<p>five</p>"),
+            ("https://foo.com/6", b"<p>six</p>")
+        ]
+
+    def test_iter_warc_records_gzip(self, records, tmp_path):
+        path = tmp_path / "pages.warc.gz"
+
+        # WARC files are usually compressed one record per gzip member
+        path.write_bytes(b"".join(gzip.compress(r) for r in records))
+
+        assert [r.url for r in iter_warc_records(str(path))] == [
+            "https://foo.com/1", "https://foo.com/4", "https://foo.com/5", "https://foo.com/6"
+        ]
+
+    def test_iter_warc_records_invalid(self, tmp_path):
+        path = tmp_path / "pages.warc"
+
+        path.write_bytes(b"not a warc file")
+
+        with pytest.raises(ValueError):
+            list(iter_warc_records(str(path)))
+
+    def test_iter_archive_records_directory(self, records, tmp_path):
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a.html").write_bytes(b"<p>a</p>")
+        (tmp_path / "b" / "c.htm").write_bytes(b"<p>c</p>")
+        (tmp_path / "b" / "pages.warc").write_bytes(records[0])
+        (tmp_path / "notes.txt").write_bytes(b"skipped")
+
+        assert [(r.url, r.content) for r in iter_archive_records(str(tmp_path))] == [
+            ((tmp_path / "a.html").as_uri(), b"<p>a</p>"),
+            ((tmp_path / "b" / "c.htm").as_uri(), b"<p>c</p>"),
+            ("https://foo.com/1", b"<p>one</p>")
+        ]
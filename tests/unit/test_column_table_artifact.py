@@ -0,0 +1,85 @@
+from array import array
+import pytest
+from griptape.artifacts import BaseArtifact
+from griptape.tools.sql_client import ColumnTableArtifact
+
+
+class TestColumnTableArtifact:
+    @pytest.fixture
+    def table(self):
+        return ColumnTableArtifact.from_rows(
+            ["id", "name", "score", "city"],
+            [
+                (1, "Alice", 1.5, "New York"),
+                (2, "Bob", 2.5, None),
+                (3, "Carol, Jr.", 3.0, "Paris")
+            ]
+        )
+
+    def test_from_rows(self, table):
+        assert table.value["id"] == array("q", [1, 2, 3])
+        assert table.value["score"] == array("d", [1.5, 2.5, 3.0])
+        assert table.value["name"] == ["Alice", "Bob", "Carol, Jr."]
+        assert table.value["city"] == ["New York", None, "Paris"]
+        assert table.column_names == ["id", "name", "score", "city"]
+        assert table.row_count == 3
+
+    def test_empty_table_is_truthy(self):
+        table = ColumnTableArtifact.from_rows(["id"], [])
+
+        assert table.row_count == 0
+        assert table
+
+    def test_from_rows_large_ints(self):
+        table = ColumnTableArtifact.from_rows(["id"], [(1,), (2 ** 64,)])
+
+        assert table.value["id"] == [1, 2 ** 64]
+
+    def test_getitem(self, table):
+        assert table[1] == {"id": 2, "name": "Bob", "score": 2.5, "city": None}
+        assert table[-1]["id"] == 3
+
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_slice(self, table):
+        view = table[1:]
+
+        assert view.value is table.value
+        assert view.row_count == 2
+        assert view[0]["name"] == "Bob"
+        assert list(view.iter_rows()) == [(2, "Bob", 2.5, None), (3, "Carol, Jr.", 3.0, "Paris")]
+        assert view[1:][0]["id"] == 3
+        assert table[5:].row_count == 0
+
+    def test_to_text(self, table):
+        assert table.to_text() == 'id,name,score,city\n1,Alice,1.5,New York\n2,Bob,2.5,\n3,"Carol, Jr.",3.0,Paris'
+        assert table[:1].to_text() == "id,name,score,city\n1,Alice,1.5,New York"
+
+    def test_add(self, table):
+        combined = table + table[:1]
+
+        assert combined.row_count == 4
+        assert combined.value["id"] == array("q", [1, 2, 3, 1])
+
+    def test_to_dict(self, table):
+        artifact = BaseArtifact.from_dict(table.to_dict())
+
+        assert artifact.value == table.to_text()
+        assert artifact.name == table.name
+
+    def test_generate_embedding(self, table, mocker):
+        driver = mocker.Mock()
+        driver.embed_string.return_value = [0.1, 0.2]
+
+        assert table.generate_embedding(driver) == [0.1, 0.2]
+        assert table.embedding == [0.1, 0.2]
+        driver.embed_string.assert_called_once_with(table.to_text())
+
+    def test_size(self, table, mocker):
+        to_text = mocker.spy(ColumnTableArtifact, "to_text")
+
+        # the two typed arrays hold three 8-byte values each
+        assert table.size > 48
+        assert table.size < ColumnTableArtifact.from_rows(table.column_names, [*table.iter_rows()] * 10).size
+        assert to_text.call_count == 0
@@ -0,0 +1,35 @@
+import pytest
+from griptape.tools.web_scraper import PageFingerprintStore
+
+
+class TestPageFingerprintStore:
+    @pytest.fixture(params=["memory", "sqlite"])
+    def store(self, request, tmp_path):
+        if request.param == "memory":
+            return PageFingerprintStore(max_urls=2)
+        else:
+            return PageFingerprintStore(path=str(tmp_path / "fingerprints.db"), max_urls=2)
+
+    def test_get_put(self, store):
+        assert store.get("https://foo.com") is None
+
+        store.put("https://foo.com", ["a", "b"])
+
+        assert store.get("https://foo.com") == ["a", "b"]
+
+        store.delete("https://foo.com")
+
+        assert store.get("https://foo.com") is None
+
+    def test_max_urls(self, store):
+        store.put("https://foo.com/1", ["a"])
+        store.put("https://foo.com/2", ["b"])
+        store.put("https://foo.com/3", ["c"])
+
+        assert store.get("https://foo.com/1") is None
+        assert store.get("https://foo.com/3") == ["c"]
+
+    def test_persistence(self, tmp_path):
+        PageFingerprintStore(path=str(tmp_path / "fingerprints.db")).put("https://foo.com", ["a"])
+
+        assert PageFingerprintStore(path=str(tmp_path / "fingerprints.db")).get("https://foo.com") == ["a"]
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+import pytest
+import griptape.tools
+
+
+class TestLazyImports:
+    def test_all_exports_resolve(self):
+        for name in griptape.tools.__all__:
+            assert getattr(griptape.tools, name).__name__ == name
+
+    def test_dir(self):
+        assert set(griptape.tools.__all__).issubset(dir(griptape.tools))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            griptape.tools.Foo
+
+    def test_import_only_loads_requested_tool(self):
+        script = (
+            "import sys\n"
+            "from griptape.tools import Calculator\n"
+            "print('griptape.tools.calculator.tool' in sys.modules)\n"
+            "print('griptape.tools.computer.tool' in sys.modules)\n"
+            "print('docker' in sys.modules)"
+        )
+        output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+
+        assert output.split() == ["True", "False", "False"]
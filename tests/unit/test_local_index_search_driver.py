@@ -0,0 +1,45 @@
+import pytest
+from griptape.tools.web_search import LocalIndexSearchDriver
+
+
+class TestLocalIndexSearchDriver:
+    @pytest.fixture
+    def driver(self, tmp_path):
+        driver = LocalIndexSearchDriver(path=str(tmp_path / "index.db"))
+
+        driver.add_documents([
+            {"url": "https://foo.com/1", "title": "Griptape", "text": "Griptape is a framework for AI agents."},
+            {"url": "https://foo.com/2", "title": "Agents", "text": "Agents use tools. Tools help agents act."},
+            {"url": "https://foo.com/3", "title": "Cooking", "text": "A recipe for bread with flour and water."}
+        ])
+
+        return driver
+
+    def test_search(self, driver):
+        results, errors = driver.search("agents tools", 5)
+
+        assert errors == []
+        assert [r["url"] for r in results] == ["https://foo.com/2", "https://foo.com/1"]
+        assert results[0]["title"] == "Agents"
+        assert results[0]["description"] == "Agents use tools. Tools help agents act."
+
+    def test_search_results_count(self, driver):
+        assert len(driver.search("agents", 1)[0]) == 1
+
+    def test_search_no_match(self, driver):
+        assert driver.search("spaceships", 5) == ([], [])
+        assert driver.search("?!", 5) == ([], [])
+
+    def test_add_documents_replaces_url(self, driver):
+        driver.add_documents([{"url": "https://foo.com/3", "text": "spaceships"}])
+
+        assert driver.search("bread", 5)[0] == []
+        assert [r["url"] for r in driver.search("spaceships", 5)[0]] == ["https://foo.com/3"]
+
+    def test_remove_document(self, driver):
+        driver.remove_document("https://foo.com/1")
+
+        assert [r["url"] for r in driver.search("griptape", 5)[0]] == []
+
+    def test_persistence(self, driver, tmp_path):
+        assert len(LocalIndexSearchDriver(path=str(tmp_path / "index.db")).search("bread", 5)[0]) == 1
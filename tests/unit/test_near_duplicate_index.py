@@ -0,0 +1,40 @@
+import pytest
+from griptape.tools.web_scraper import NearDuplicateIndex
+from griptape.tools.web_scraper.near_duplicate_index import simhash
+
+TEXT = " ".join(f"word{i}" for i in range(200))
+
+
+class TestNearDuplicateIndex:
+    def test_simhash(self):
+        assert simhash(TEXT) == simhash(TEXT.upper())
+        assert bin(simhash(TEXT) ^ simhash(TEXT + " extra")).count("1") <= 6
+        assert bin(simhash(TEXT) ^ simhash(" ".join(f"other{i}" for i in range(200)))).count("1") > 6
+
+    def test_add(self):
+        index = NearDuplicateIndex()
+
+        assert index.add(TEXT, "foo") is None
+        assert index.add(TEXT, "foo") is None
+        assert index.add(TEXT + " extra", "bar") == "foo"
+        assert index.add(" ".join(f"other{i}" for i in range(200)), "baz") is None
+        assert index.add("too short", "foo") is None
+        assert index.add("too short", "bar") is None
+
+    def test_low_threshold(self):
+        index = NearDuplicateIndex(similarity_threshold=0.5)
+
+        assert index.add(TEXT, "foo") is None
+        assert index.add(TEXT + " extra", "bar") == "foo"
+
+    def test_max_entries(self):
+        index = NearDuplicateIndex(max_entries=1)
+
+        index.add(TEXT, "foo")
+        index.add(" ".join(f"other{i}" for i in range(200)), "bar")
+
+        assert index.add(TEXT, "baz") is None
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(similarity_threshold=0)
@@ -0,0 +1,79 @@
+import pytest
+from griptape.tools.web_scraper import PageCache
+from griptape.tools.web_scraper.page_cache import PageDownload
+
+
+class TestPageCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return PageCache(cache_dir=str(tmp_path))
+
+    def test_fetch_page(self, cache, mocker):
+        download = mocker.Mock(return_value=PageDownload(status=200, content=b"foo", headers={"ETag": "1"}))
+
+        assert cache.fetch_page("https://foo.com", download) == b"foo"
+        assert cache.fetch_page("https://foo.com", download) == b"foo"
+        assert download.call_count == 1
+        assert cache.stats["page_misses"] == 1
+        assert cache.stats["page_hits"] == 1
+
+    def test_fetch_page_revalidation(self, tmp_path, mocker):
+        cache = PageCache(cache_dir=str(tmp_path), page_ttl=0)
+        download = mocker.Mock(return_value=PageDownload(
+            status=200, content=b"foo", headers={"ETag": "1", "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        ))
+
+        assert cache.fetch_page("https://foo.com", download) == b"foo"
+
+        download.return_value = PageDownload(status=304)
+
+        assert cache.fetch_page("https://foo.com", download) == b"foo"
+        assert download.call_args.args[1] == {
+            "If-None-Match": "1",
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"
+        }
+        assert cache.stats["page_revalidations"] == 1
+
+    def test_fetch_page_revalidate(self, cache, mocker):
+        download = mocker.Mock(return_value=PageDownload(status=200, content=b"foo"))
+
+        cache.fetch_page("https://foo.com", download)
+        download.return_value = PageDownload(status=200, content=b"bar")
+
+        assert cache.fetch_page("https://foo.com", download) == b"foo"
+        assert cache.fetch_page("https://foo.com", download, revalidate=True) == b"bar"
+        assert cache.fetch_page("https://foo.com", download) == b"bar"
+        assert download.call_count == 2
+
+    def test_fetch_page_error(self, cache, mocker):
+        assert cache.fetch_page("https://foo.com", mocker.Mock(return_value=None)) is None
+        assert cache.fetch_page("https://foo.com", mocker.Mock(return_value=PageDownload(status=404))) is None
+
+    def test_disk_eviction(self, tmp_path):
+        cache = PageCache(cache_dir=str(tmp_path), max_disk_bytes=10)
+
+        cache.fetch_page("https://foo.com", lambda url, headers: PageDownload(status=200, content=b"123456"))
+        cache.fetch_page("https://bar.com", lambda url, headers: PageDownload(status=200, content=b"123456"))
+
+        assert cache.get_page("https://foo.com") is None
+        assert cache.get_page("https://bar.com").content == b"123456"
+
+    def test_extractions(self):
+        cache = PageCache(max_extractions=2)
+
+        cache.put_extraction("foo", {"text": "foo"})
+        cache.put_extraction("bar", {"text": "bar"})
+        cache.get_extraction("foo")
+        cache.put_extraction("baz", {"text": "baz"})
+
+        assert cache.get_extraction("foo") == {"text": "foo"}
+        assert cache.get_extraction("bar") is None
+        assert cache.stats["extraction_hits"] == 2
+        assert cache.stats["extraction_misses"] == 1
+
+    def test_extraction_ttl(self):
+        cache = PageCache(extraction_ttl=-1)
+
+        cache.put_extraction("foo", {"text": "foo"})
+
+        assert cache.get_extraction("foo") is None
@@ -0,0 +1,95 @@
+from griptape.artifacts import CsvRowArtifact, InfoArtifact
+from griptape.tools.sql_client import QueryCache
+from griptape.tools.sql_client.query_cache import normalize_sql
+
+
+class TestQueryCache:
+    def test_normalize_sql(self):
+        assert normalize_sql("SELECT *\n  FROM  foo;") == normalize_sql("select * from foo")
+        assert normalize_sql("SELECT * FROM foo WHERE name = 'Foo  Bar'") == "select * from foo where name = 'Foo  Bar'"
+        assert normalize_sql('SELECT "Name" FROM foo') == 'select "Name" from foo'
+
+    def test_build_key(self):
+        key = QueryCache.build_key("SELECT * FROM foo", ["foo"])
+
+        assert key == QueryCache.build_key("select *  from foo;", ["foo"])
+        assert key != QueryCache.build_key("SELECT * FROM foo", ["bar"])
+
+    def test_get_put(self):
+        cache = QueryCache()
+        rows = [CsvRowArtifact({"id": 1})]
+
+        assert cache.get("a") is None
+
+        cache.put("a", ["foo"], rows)
+
+        assert cache.get("a") == rows
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+        assert cache.stats["hit_rate"] == 0.5
+
+    def test_ttl(self, mocker):
+        cache = QueryCache(ttl=10)
+
+        mocker.patch("time.time", return_value=0)
+        cache.put("a", ["foo"], InfoArtifact("No results found"))
+        mocker.patch("time.time", return_value=11)
+
+        assert cache.get("a") is None
+        assert cache.stats["expirations"] == 1
+        assert cache.stats["entries"] == 0
+
+    def test_version(self):
+        cache = QueryCache()
+
+        cache.put("a", ["foo"], InfoArtifact("No results found"), version="1")
+
+        assert cache.get("a", version="1") is not None
+        assert cache.get("a", version="2") is None
+        assert cache.stats["version_changes"] == 1
+
+    def test_invalidate(self):
+        cache = QueryCache()
+
+        cache.put("a", ["foo"], InfoArtifact("a"))
+        cache.put("b", ["bar"], InfoArtifact("b"))
+        cache.put("c", ["Foo", "bar"], InfoArtifact("c"))
+        cache.invalidate("foo")
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is None
+
+        cache.invalidate()
+
+        assert cache.get("b") is None
+        assert cache.stats["invalidations"] == 3
+        assert cache.stats["bytes"] == 0
+
+    def test_max_bytes(self):
+        size = QueryCache()._estimate_size([CsvRowArtifact({"id": 1})])
+        cache = QueryCache(max_bytes=size * 2)
+
+        cache.put("a", ["foo"], [CsvRowArtifact({"id": 1})])
+        cache.put("b", ["foo"], [CsvRowArtifact({"id": 2})])
+        cache.get("a")
+        cache.put("c", ["foo"], [CsvRowArtifact({"id": 3})])
+        cache.put("d", ["foo"], [CsvRowArtifact({"id": i}) for i in range(10)])
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.get("d") is None
+        assert cache.stats["evictions"] == 1
+
+    def test_column_table_size(self, mocker):
+        from griptape.tools.sql_client import ColumnTableArtifact
+
+        table = ColumnTableArtifact.from_rows(["id", "name"], [(i, f"name {i}") for i in range(1000)])
+        to_text = mocker.spy(ColumnTableArtifact, "to_text")
+        cache = QueryCache()
+
+        cache.put("a", ["foo"], [table])
+
+        assert cache.stats["bytes"] > 8000
+        assert to_text.call_count == 0
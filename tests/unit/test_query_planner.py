@@ -0,0 +1,98 @@
+import pytest
+from griptape.drivers import SqlDriver
+from griptape.tools.sql_client.query_planner import add_limit, estimate_cost, estimate_rows
+
+
+class TestQueryPlanner:
+    @pytest.fixture
+    def driver(self):
+        driver = SqlDriver(engine_url="sqlite:///:memory:")
+
+        driver.execute_query("CREATE TABLE foo (id INTEGER PRIMARY KEY, name TEXT);")
+        driver.execute_query(
+            "INSERT INTO foo (name) VALUES " + ", ".join(f"('name {i}')" for i in range(100)) + ";"
+        )
+
+        return driver
+
+    def test_add_limit(self):
+        assert add_limit("SELECT * FROM foo;", 10, "sqlite") == "SELECT * FROM foo LIMIT 10"
+        assert add_limit("WITH a AS (SELECT 1) SELECT * FROM a", 10, "postgresql").endswith(" LIMIT 10")
+        assert add_limit("SELECT * FROM foo LIMIT 5", 10, "sqlite") == "SELECT * FROM foo LIMIT 5"
+        assert add_limit("SELECT * FROM foo LIMIT 5 OFFSET 10;", 10, "sqlite") == "SELECT * FROM foo LIMIT 5 OFFSET 10;"
+        assert add_limit("SELECT * FROM foo FETCH FIRST 5 ROWS ONLY", 10, "postgresql").endswith("ONLY")
+        assert add_limit("SELECT * FROM foo", 10, "mssql") == "SELECT TOP 10 * FROM foo"
+        assert add_limit("SELECT DISTINCT name FROM foo", 10, "mssql") == "SELECT DISTINCT TOP 10 name FROM foo"
+        assert add_limit("SELECT TOP 5 * FROM foo", 10, "mssql") == "SELECT TOP 5 * FROM foo"
+        assert add_limit("WITH a AS (SELECT 1) SELECT * FROM a", 10, "mssql") == "WITH a AS (SELECT 1) SELECT * FROM a"
+        assert add_limit("SELECT * FROM foo FOR UPDATE", 10, "postgresql") == "SELECT * FROM foo FOR UPDATE"
+        assert add_limit("DELETE FROM foo", 10, "sqlite") == "DELETE FROM foo"
+        # subquery limits don't limit the outer query
+        assert add_limit("SELECT * FROM (SELECT * FROM foo LIMIT 5) a JOIN foo b", 10, "sqlite").endswith(" LIMIT 10")
+
+    def test_add_limit_oracle(self):
+        assert add_limit("SELECT * FROM foo;", 10, "oracle") == "SELECT * FROM foo FETCH FIRST 10 ROWS ONLY"
+        assert add_limit("SELECT * FROM foo FETCH FIRST 5 ROWS ONLY", 10, "oracle").endswith("5 ROWS ONLY")
+
+    def test_add_limit_unsupported_dialect(self):
+        assert add_limit("SELECT * FROM foo", 10, "sybase") == "SELECT * FROM foo"
+
+    def test_add_limit_comments(self):
+        assert add_limit("SELECT * FROM foo -- all rows", 10, "sqlite") == "SELECT * FROM foo LIMIT 10"
+        assert add_limit("SELECT * FROM foo; -- all rows\n", 10, "sqlite") == "SELECT * FROM foo LIMIT 10"
+        assert add_limit("SELECT * FROM foo /* all rows */", 10, "sqlite") == "SELECT * FROM foo LIMIT 10"
+        assert add_limit("SELECT * FROM foo -- LIMIT 5", 10, "sqlite") == "SELECT * FROM foo LIMIT 10"
+        assert add_limit("SELECT '--' FROM foo", 10, "sqlite") == "SELECT '--' FROM foo LIMIT 10"
+        assert add_limit("SELECT /*+ FULL(foo) */ * FROM foo -- all", 10, "oracle") == (
+            "SELECT /*+ FULL(foo) */ * FROM foo FETCH FIRST 10 ROWS ONLY"
+        )
+        assert add_limit("-- all rows\nSELECT * FROM foo", 10, "mssql") == "-- all rows\nSELECT TOP 10 * FROM foo"
+
+    def test_add_limit_executes(self, driver):
+        rows = driver.execute_query(add_limit("SELECT * FROM foo -- all rows", 10, "sqlite"))
+
+        assert len(rows) == 10
+
+    def test_estimate_cost_sqlite(self, driver):
+        with driver.engine.connect() as connection:
+            assert estimate_cost(connection, "SELECT * FROM foo WHERE id = 1", "sqlite") == 10
+            assert estimate_cost(connection, "SELECT * FROM foo", "sqlite") == 100
+            assert estimate_cost(connection, "SELECT * FROM foo a, foo b", "sqlite") == 10_000
+
+    def test_estimate_cost_unsupported(self, driver, mocker):
+        connection = mocker.Mock()
+
+        assert estimate_cost(connection, "SELECT 1", "oracle") is None
+        assert connection.execute.call_count == 0
+
+    def test_estimate_cost_postgresql(self, mocker):
+        connection = mocker.Mock()
+        connection.execute.return_value.fetchone.return_value = (
+            "Seq Scan on foo  (cost=0.00..35.50 rows=2550 width=4)",
+        )
+
+        assert estimate_cost(connection, "SELECT * FROM foo", "postgresql") == 35.5
+
+    def test_estimate_cost_mysql(self, mocker):
+        connection = mocker.Mock()
+        connection.execute.return_value.fetchone.return_value = (
+            '{"query_block": {"cost_info": {"query_cost": "10.5"}}}',
+        )
+
+        assert estimate_cost(connection, "SELECT * FROM foo", "mysql") == 10.5
+
+    def test_estimate_cost_error(self, driver):
+        with driver.engine.connect() as connection:
+            assert estimate_cost(connection, "SELECT * FROM bar", "sqlite") is None
+
+    def test_estimate_rows(self, driver, mocker):
+        connection = mocker.Mock()
+        connection.execute.return_value.fetchone.return_value = (
+            "Seq Scan on foo  (cost=0.00..35.50 rows=2550 width=4)",
+        )
+
+        assert estimate_rows(connection, "SELECT * FROM foo;", "postgresql") == 2550
+        assert str(connection.execute.call_args.args[0]) == "EXPLAIN SELECT * FROM foo"
+
+        with driver.engine.connect() as sqlite_connection:
+            assert estimate_rows(sqlite_connection, "SELECT * FROM foo", "sqlite") is None
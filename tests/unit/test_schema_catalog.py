@@ -0,0 +1,53 @@
+import pytest
+from griptape.drivers import SqlDriver
+from griptape.tools.sql_client.schema_catalog import SchemaCatalog
+
+
+class TestSchemaCatalog:
+    @pytest.fixture
+    def driver(self, tmp_path):
+        driver = SqlDriver(engine_url=f"sqlite:///{tmp_path / 'test.db'}")
+
+        driver.execute_query("CREATE TABLE foo (id INTEGER PRIMARY KEY, name TEXT);")
+        driver.execute_query("CREATE TABLE bar (id INTEGER PRIMARY KEY, foo_id INTEGER, amount REAL);")
+
+        return driver
+
+    def test_get_schemas(self, driver, mocker):
+        catalog = SchemaCatalog(sql_driver=driver)
+        load_schemas = mocker.spy(SchemaCatalog, "_load_schemas")
+
+        assert catalog.get_schemas(["foo", "bar", "baz"]) == {
+            "foo": "foo(id INTEGER, name TEXT)",
+            "bar": "bar(id INTEGER, foo_id INTEGER, amount REAL)",
+            "baz": None
+        }
+        assert catalog.get_schemas(["foo"]) == {"foo": "foo(id INTEGER, name TEXT)"}
+        assert load_schemas.call_count == 1
+
+    def test_get_schemas_batched(self, driver, mocker):
+        from sqlalchemy.engine import Connection
+
+        execute = mocker.spy(Connection, "execute")
+
+        SchemaCatalog(sql_driver=driver).get_schemas(["foo", "bar"])
+
+        assert execute.call_count == 1
+
+    def test_refresh(self, driver):
+        catalog = SchemaCatalog(sql_driver=driver)
+
+        catalog.get_schemas(["baz"])
+        driver.execute_query("CREATE TABLE baz (id INTEGER PRIMARY KEY);")
+
+        assert catalog.get_schemas(["baz"]) == {"baz": None}
+
+        catalog.refresh()
+
+        assert catalog.get_schemas(["baz"]) == {"baz": "baz(id INTEGER)"}
+
+    def test_get_schemas_without_engine(self, mocker):
+        driver = mocker.Mock(spec=["get_table_schema"])
+        driver.get_table_schema.return_value = "[('id', INTEGER())]"
+
+        assert SchemaCatalog(sql_driver=driver).get_schemas(["foo"]) == {"foo": "[('id', INTEGER())]"}
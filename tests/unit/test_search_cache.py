@@ -0,0 +1,89 @@
+import threading
+import time
+import pytest
+from griptape.tools.web_search import SearchCache
+from griptape.tools.web_search.search_cache import (
+    normalize_query, MemorySearchCacheBackend, SqliteSearchCacheBackend
+)
+
+
+class TestSearchCache:
+    @pytest.fixture(params=["memory", "sqlite"])
+    def backend(self, request, tmp_path):
+        if request.param == "memory":
+            return MemorySearchCacheBackend(max_entries=2)
+        else:
+            return SqliteSearchCacheBackend(path=str(tmp_path / "search.db"), max_entries=2)
+
+    def test_normalize_query(self):
+        assert normalize_query("  What is  Griptape? ") == normalize_query("what is griptape")
+        assert normalize_query('"Griptape" site:github.com -jobs') == '"griptape" site:github.com -jobs'
+
+    def test_build_key(self):
+        assert SearchCache.build_key("Foo  Bar!", "lang_en", "us") == SearchCache.build_key("foo bar", "lang_en", "us")
+        assert SearchCache.build_key("foo bar", "lang_en", "us") != SearchCache.build_key("foo bar", "lang_de", "us")
+
+    def test_backend(self, backend):
+        backend.put("a", 1, [{"url": "a"}])
+        backend.put("b", 2, [{"url": "b"}])
+        backend.put("c", 3, [{"url": "c"}])
+
+        assert backend.get("a") is None
+        assert backend.get("c") == (3, [{"url": "c"}])
+
+        backend.clear()
+
+        assert backend.get("c") is None
+
+    def test_get_or_search(self, backend, mocker):
+        cache = SearchCache(backend=backend, ttl=10, stale_ttl=100)
+        search = mocker.Mock(return_value=([{"url": "a"}], []))
+
+        assert cache.get_or_search("foo", search) == ([{"url": "a"}], [])
+        assert cache.get_or_search("foo", search) == ([{"url": "a"}], [])
+        assert search.call_count == 1
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+        assert cache.stats["hit_rate"] == 0.5
+
+    def test_get_or_search_stale(self, mocker):
+        cache = SearchCache(ttl=10, stale_ttl=100)
+        refreshed = threading.Event()
+
+        def search():
+            refreshed.set()
+
+            return [{"url": "new"}], []
+
+        cache.backend.put("foo", 0, [{"url": "old"}])
+        mocker.patch("time.time", return_value=50)
+
+        assert cache.get_or_search("foo", search) == ([{"url": "old"}], [])
+        assert refreshed.wait(5)
+
+        for _ in range(100):
+            if cache.stats["refreshes"] == 1:
+                break
+
+            time.sleep(0.01)
+
+        assert cache.backend.get("foo") == (50, [{"url": "new"}])
+        assert cache.stats["stale_hits"] == 1
+
+    def test_get_or_search_expired(self, mocker):
+        cache = SearchCache(ttl=10, stale_ttl=100)
+        search = mocker.Mock(return_value=([{"url": "new"}], []))
+
+        cache.backend.put("foo", 0, [{"url": "old"}])
+        mocker.patch("time.time", return_value=500)
+
+        assert cache.get_or_search("foo", search) == ([{"url": "new"}], [])
+
+    def test_get_or_search_incomplete(self, mocker):
+        cache = SearchCache()
+        search = mocker.Mock(return_value=([{"url": "a"}], ["results 11-20: error"]))
+
+        cache.get_or_search("foo", search)
+        cache.get_or_search("foo", search)
+
+        assert search.call_count == 2
@@ -1,4 +1,7 @@
+import json
+import time
 import pytest
+from griptape.artifacts import ErrorArtifact, InfoArtifact
 from griptape.drivers import SqlDriver
 from griptape.loaders import SqlLoader
 from griptape.tools import SqlClient
@@ -45,4 +48,413 @@ class TestSqlClient:
 
         assert "Can be used to execute sqlite SQL SELECT queries in table test_table" in description
         assert "test_table schema: [('id', INTEGER()), ('name', TEXT()), ('age', INTEGER()), ('city', TEXT())]" in description
-        assert "test_table description: foobar" in description
\ No newline at end of file
+        assert "test_table description: foobar" in description
+
+    @pytest.fixture
+    def large_driver(self, tmp_path):
+        new_driver = SqlDriver(
+            engine_url=f"sqlite:///{tmp_path / 'test.db'}"
+        )
+
+        new_driver.execute_query("CREATE TABLE test_table (id INTEGER PRIMARY KEY, name TEXT NOT NULL);")
+        new_driver.execute_query(
+            "INSERT INTO test_table (name) VALUES " + ", ".join(f"('name {i}')" for i in range(100)) + ";"
+        )
+
+        return new_driver
+
+    def test_execute_query_max_rows(self, large_driver, mocker):
+        from sqlalchemy.engine import CursorResult
+
+        fetchmany = mocker.spy(CursorResult, "fetchmany")
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_name="test_table",
+            max_rows=10,
+            fetch_batch_size=4
+        )
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})
+
+        assert len(result) == 11
+        assert result[9].value == {"id": 10, "name": "name 9"}
+        assert isinstance(result[-1], InfoArtifact)
+        assert result[-1].value.startswith("result truncated to the first 10 rows")
+        assert fetchmany.call_count == 3
+
+    def test_execute_query_max_bytes(self, large_driver):
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_name="test_table",
+            max_bytes=30
+        )
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})
+
+        # each row is 8 or 9 bytes of CSV
+        assert len(result) == 4
+        assert isinstance(result[-1], InfoArtifact)
+
+    def test_execute_query_without_engine(self, large_driver, mocker):
+        driver = mocker.Mock(spec=["execute_query"])
+        driver.execute_query.side_effect = large_driver.execute_query
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=driver),
+            table_name="test_table",
+            max_rows=5
+        )
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})
+
+        assert len(result) == 6
+        assert result[-1].value.startswith("result truncated to the first 5 of 100 rows")
+
+    def test_execute_query_no_results(self, large_driver):
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table")
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table WHERE id < 0;"}})
+
+        assert result.value == "No results found"
+
+    def test_truncation_notice(self, large_driver):
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table", max_rows=10)
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})
+
+        # SQLite can't report the total without reading every row, so no total is claimed
+        assert result[-1].value == (
+            "result truncated to the first 10 rows to stay within the limit of 10 rows and 1048576 bytes; "
+            "use WHERE, LIMIT, or aggregates to narrow the query"
+        )
+
+    def test_truncation_notice_estimate(self, large_driver, mocker):
+        estimate_rows = mocker.patch("griptape.tools.sql_client.tool.estimate_rows", return_value=100)
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table", max_rows=10)
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})
+
+        assert result[-1].value.startswith("result truncated to the first 10 of about 100 rows")
+        # the estimate is for the query without the automatic LIMIT
+        assert estimate_rows.call_args.args[1:] == ("SELECT * FROM test_table;", "sqlite")
+
+    def test_truncation_notice_row_count(self, large_driver, mocker):
+        from sqlalchemy.engine import CursorResult
+
+        mocker.patch.object(CursorResult, "rowcount", new_callable=mocker.PropertyMock, return_value=100)
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table", max_rows=10)
+
+        # the row count of the automatically limited query isn't the total
+        assert client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})[-1].value.startswith(
+            "result truncated to the first 10 rows"
+        )
+
+        client.auto_limit = False
+
+        assert client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})[-1].value.startswith(
+            "result truncated to the first 10 of 100 rows"
+        )
+
+    def test_execute_query_cache(self, large_driver, mocker):
+        from griptape.tools.sql_client import QueryCache
+
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_name="test_table",
+            query_cache=QueryCache(table_version_query="SELECT COUNT(*) FROM {table_name}")
+        )
+        load_rows = mocker.spy(SqlClient, "_load_rows")
+
+        assert len(client.execute_query({"values": {"sql_query": "SELECT * FROM test_table WHERE id <= 5;"}})) == 5
+        assert len(client.execute_query({"values": {"sql_query": "select *  from test_table where id <= 5"}})) == 5
+        assert load_rows.call_count == 1
+
+        large_driver.execute_query("DELETE FROM test_table WHERE id = 1;")
+
+        assert len(client.execute_query({"values": {"sql_query": "SELECT * FROM test_table WHERE id <= 5;"}})) == 4
+        assert load_rows.call_count == 2
+        assert client.query_cache.stats["version_changes"] == 1
+
+    def test_execute_query_max_query_cost(self, large_driver):
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_name="test_table",
+            max_query_cost=1000
+        )
+
+        assert len(client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})) == 100
+
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table a, test_table b;"}})
+
+        assert isinstance(result, ErrorArtifact)
+        assert result.value.startswith("query rejected: its estimated cost of 10000 exceeds the limit of 1000")
+
+    def test_execute_query_auto_limit(self, large_driver, mocker):
+        from sqlalchemy.engine import Connection
+
+        execute = mocker.spy(Connection, "execute")
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table", max_rows=10)
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})
+
+        assert len(result) == 11
+        assert str(execute.call_args.args[1]) == "SELECT * FROM test_table LIMIT 11"
+
+    def test_execute_query_columns(self, large_driver):
+        from griptape.tools.sql_client import ColumnTableArtifact
+
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_name="test_table",
+            max_rows=50,
+            result_format="columns"
+        )
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})
+
+        assert len(result) == 2
+        assert isinstance(result[0], ColumnTableArtifact)
+        assert result[0].row_count == 50
+        assert result[0][0] == {"id": 1, "name": "name 0"}
+        assert result[1].value.startswith("result truncated to the first 50 rows")
+
+    def test_result_format_validation(self, large_driver):
+        with pytest.raises(ValueError):
+            SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table", result_format="foo")
+
+    def test_execute_queries(self, large_driver):
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table")
+        result = client.execute_queries({"values": {"sql_queries": [
+            "SELECT COUNT(*) AS count FROM test_table;",
+            "SELECT * FROM missing_table;",
+            "SELECT name FROM test_table WHERE id = 2;"
+        ]}})
+
+        assert [a.value for a in result] == [
+            "query 1: SELECT COUNT(*) AS count FROM test_table;",
+            {"count": 100},
+            "query 2: SELECT * FROM missing_table;",
+            result[3].value,
+            "query 3: SELECT name FROM test_table WHERE id = 2;",
+            {"name": "name 1"}
+        ]
+        assert isinstance(result[3], ErrorArtifact)
+        assert result[3].value.startswith("query 2 failed:")
+
+    def test_execute_queries_in_memory(self, driver, mocker):
+        from concurrent import futures
+
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="test_table")
+        thread_pool = mocker.spy(futures, "ThreadPoolExecutor")
+        result = client.execute_queries({"values": {"sql_queries": [
+            "SELECT name FROM test_table;",
+            "SELECT * FROM missing_table;",
+            "SELECT COUNT(*) AS count FROM test_table;"
+        ]}})
+
+        assert [a.value for a in result[::2]] == [
+            "query 1: SELECT name FROM test_table;",
+            "query 2: SELECT * FROM missing_table;",
+            "query 3: SELECT COUNT(*) AS count FROM test_table;"
+        ]
+        assert result[1].value == {"name": "Alice"}
+        assert result[3].value.startswith("query 2 failed:")
+        assert result[5].value == {"count": 1}
+        assert thread_pool.call_count == 0
+
+    def test_execute_queries_in_memory_timeout(self, driver):
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="test_table", queries_timeout=0.5)
+        slow_query = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT COUNT(*) FROM c"
+        start = time.perf_counter()
+        result = client.execute_queries({"values": {"sql_queries": [slow_query, "SELECT name FROM test_table;"]}})
+
+        assert time.perf_counter() - start < 5
+        assert [a.value for a in result[1::2]] == [
+            f"query {i} cancelled: it didn't finish within 0.5s" for i in range(1, 3)
+        ]
+
+    def test_execute_queries_timeout(self, large_driver):
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_name="test_table",
+            queries_timeout=0.5,
+            max_concurrent_queries=2
+        )
+        slow_query = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT COUNT(*) FROM c"
+        start = time.perf_counter()
+        result = client.execute_queries({"values": {"sql_queries": [
+            "SELECT COUNT(*) AS count FROM test_table;",
+            slow_query,
+            slow_query,
+            slow_query
+        ]}})
+
+        assert time.perf_counter() - start < 5
+        assert result[1].value == {"count": 100}
+        assert [a.value for a in result[3::2]] == [
+            f"query {i} cancelled: it didn't finish within 0.5s" for i in range(2, 5)
+        ]
+
+    def test_execute_queries_timeout_before_connecting(self, large_driver, mocker):
+        from sqlalchemy.engine import Connection
+        from griptape.tools.sql_client import tool
+
+        # the query is still running its cost estimate when the deadline passes
+        mocker.patch.object(tool, "estimate_cost", side_effect=lambda *_: time.sleep(0.5))
+        execute = mocker.spy(Connection, "execute")
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_name="test_table",
+            queries_timeout=0.1,
+            max_query_cost=1000
+        )
+        result = client.execute_queries({"values": {"sql_queries": ["SELECT * FROM test_table;"]}})
+
+        assert result[1].value == "query 1 cancelled: it didn't finish within 0.1s"
+
+        time.sleep(1)
+
+        assert execute.call_count == 0
+
+    def test_table_names(self, large_driver, mocker):
+        large_driver.execute_query("CREATE TABLE other_table (id INTEGER PRIMARY KEY, value REAL);")
+
+        get_table_schema = mocker.spy(SqlDriver, "get_table_schema")
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_names=["test_table", "other_table"],
+            engine_name="sqlite"
+        )
+        description = client.activity_description(client.execute_query)
+
+        assert "SQL SELECT queries in tables test_table, other_table" in description
+        assert "get_table_schemas" in description
+        assert get_table_schema.call_count == 0
+
+        result = client.get_table_schemas({"values": {"table_names": ["other_table", "missing_table"]}})
+
+        assert result[0].value == "other_table(id INTEGER, value REAL)"
+        assert isinstance(result[1], ErrorArtifact)
+        assert len(client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})) == 100
+
+    def test_table_names_cache(self, large_driver, mocker):
+        from griptape.tools.sql_client import QueryCache
+
+        large_driver.execute_query("CREATE TABLE other_table (id INTEGER PRIMARY KEY, updated_at INTEGER);")
+        large_driver.execute_query("INSERT INTO other_table (updated_at) VALUES (1);")
+
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_names=["test_table", "other_table"],
+            query_cache=QueryCache(table_version_query="SELECT MAX(id) FROM {table_name}")
+        )
+        load_rows = mocker.spy(SqlClient, "_load_rows")
+        query = "SELECT COUNT(*) AS count FROM test_table, other_table;"
+
+        assert client.execute_query({"values": {"sql_query": query}})[0].value == {"count": 100}
+        assert client.execute_query({"values": {"sql_query": query}})[0].value == {"count": 100}
+        assert load_rows.call_count == 1
+
+        # a change to either table invalidates the result
+        large_driver.execute_query("INSERT INTO other_table (updated_at) VALUES (2);")
+
+        assert client.execute_query({"values": {"sql_query": query}})[0].value == {"count": 200}
+        assert load_rows.call_count == 2
+
+        client.query_cache.invalidate("other_table")
+
+        assert client.query_cache.stats["entries"] == 0
+
+    def test_table_schema_cache(self, driver, mocker):
+        get_table_schema = mocker.spy(SqlDriver, "get_table_schema")
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="test_table")
+
+        client.activity_description(client.execute_query)
+        client.activity_description(client.execute_query)
+
+        assert get_table_schema.call_count == 1
+
+    def test_table_name_validation(self, driver):
+        with pytest.raises(ValueError):
+            SqlClient(sql_loader=SqlLoader(sql_driver=driver))
+
+        with pytest.raises(ValueError):
+            SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="foo", table_names=["foo"])
+
+    def test_profile_table(self, large_driver, mocker):
+        from sqlalchemy.engine import Connection
+
+        large_driver.execute_query("CREATE TABLE other_table (id INTEGER PRIMARY KEY, value REAL, label TEXT);")
+        large_driver.execute_query(
+            "INSERT INTO other_table (value, label) VALUES (1.5, 'a'), (2.5, NULL), (3.5, 'a'), (NULL, 'b');"
+        )
+
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver),
+            table_names=["test_table", "other_table"],
+            profile_sample_size=2
+        )
+        execute = mocker.spy(Connection, "execute")
+        result = client.profile_table({"values": {"table_name": "other_table"}})
+        lines = result.value.splitlines()
+
+        assert lines[:5] == [
+            "table other_table: 4 rows",
+            "column,type,null_rate,distinct,min,max,mean",
+            "id,INTEGER,0,4,1,4,2.5",
+            "value,REAL,0.25,3,1.5,3.5,2.5",
+            "label,TEXT,0.25,2,a,b,"
+        ]
+        assert lines[5] == "random sample of 2 rows:"
+        assert lines[6] == "id,value,label"
+        assert len(lines) == 9
+        # the catalog query, the aggregates, and the sample
+        assert execute.call_count == 3
+
+    def test_profile_table_timeout(self, large_driver):
+        large_driver.execute_query(
+            "CREATE VIEW slow AS WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT x FROM c;"
+        )
+
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="slow", query_timeout=0.2)
+        start = time.perf_counter()
+        result = client.profile_table({"values": {}})
+
+        assert time.perf_counter() - start < 2
+        assert isinstance(result, ErrorArtifact)
+        assert "didn't finish within the timeout of 0.2s" in result.value
+
+    def test_profile_table_description(self, large_driver):
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table")
+
+        assert client.activity_description(client.profile_table).endswith("table_name defaults to test_table")
+        assert "{%" not in json.dumps(client.activity_schema(client.profile_table))
+
+    def test_profile_table_errors(self, large_driver):
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="missing_table")
+
+        assert client.profile_table({"values": {"table_name": "foo"}}).value == "foo: table isn't available"
+        assert client.profile_table({"values": {}}).value == "missing_table: table not found"
+
+    def test_execute_query_timeout(self, large_driver):
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table", query_timeout=5)
+        slow_query = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT COUNT(*) FROM c"
+        start = time.perf_counter()
+        result = client.execute_query({"values": {"sql_query": slow_query, "timeout": 0.2}})
+
+        assert time.perf_counter() - start < 2
+        assert isinstance(result, ErrorArtifact)
+        assert result.value.startswith("query cancelled after 0.")
+        assert "didn't finish within the timeout of 0.2s" in result.value
+
+        # the connection goes back to the pool without the timeout
+        assert len(client.execute_query({"values": {"sql_query": "SELECT * FROM test_table;"}})) == 100
+
+    def test_effective_timeout(self, driver):
+        assert SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="t")._effective_timeout(None) is None
+        client = SqlClient(sql_loader=SqlLoader(sql_driver=driver), table_name="t", query_timeout=10)
+
+        assert client._effective_timeout(None) == 10
+        assert client._effective_timeout(2) == 2
+        assert client._effective_timeout(20) == 10
+
+    def test_report_elapsed_time(self, large_driver):
+        client = SqlClient(
+            sql_loader=SqlLoader(sql_driver=large_driver), table_name="test_table", report_elapsed_time=True
+        )
+        result = client.execute_query({"values": {"sql_query": "SELECT * FROM test_table WHERE id = 1;"}})
+
+        assert len(result) == 2
+        assert result[0].value == {"id": 1, "name": "name 0"}
+        assert result[1].value.startswith("query took ")
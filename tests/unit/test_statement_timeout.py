@@ -0,0 +1,62 @@
+import time
+from griptape.tools.sql_client.statement_timeout import statement_timeout
+
+
+class TestStatementTimeout:
+    def mock_connection(self, mocker, dialect: str):
+        connection = mocker.MagicMock()
+        connection.dialect.name = dialect
+        connection.connection.dbapi_connection = mocker.MagicMock(spec=["cursor", "cancel"])
+
+        return connection
+
+    def executed_statements(self, connection) -> list[str]:
+        return [str(call.args[0]) for call in connection.execute.call_args_list]
+
+    def test_postgresql(self, mocker):
+        connection = self.mock_connection(mocker, "postgresql")
+
+        with statement_timeout(connection, 1.5, mocker.MagicMock()):
+            pass
+
+        assert self.executed_statements(connection) == ["SET LOCAL statement_timeout = 1500"]
+
+    def test_mysql(self, mocker):
+        connection = self.mock_connection(mocker, "mysql")
+
+        with statement_timeout(connection, 2, mocker.MagicMock()):
+            pass
+
+        assert self.executed_statements(connection) == [
+            "SET SESSION max_execution_time = 2000",
+            "SET SESSION max_execution_time = DEFAULT"
+        ]
+
+    def test_cancel_fallback(self, mocker):
+        connection = self.mock_connection(mocker, "oracle")
+        cancel = mocker.MagicMock()
+
+        with statement_timeout(connection, 0.05, cancel):
+            time.sleep(0.3)
+
+        cancel.assert_called_once_with(connection.connection.dbapi_connection)
+
+    def test_cancel_fallback_on_error(self, mocker):
+        connection = self.mock_connection(mocker, "postgresql")
+        connection.execute.side_effect = Exception("permission denied")
+        cancel = mocker.MagicMock()
+
+        with statement_timeout(connection, 0.05, cancel):
+            time.sleep(0.3)
+
+        assert cancel.call_count == 1
+
+    def test_no_timeout(self, mocker):
+        connection = self.mock_connection(mocker, "postgresql")
+        cancel = mocker.MagicMock()
+
+        with statement_timeout(connection, None, cancel):
+            time.sleep(0.1)
+
+        assert connection.execute.call_count == 0
+        assert cancel.call_count == 0
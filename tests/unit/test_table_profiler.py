@@ -0,0 +1,121 @@
+import pytest
+from griptape.drivers import SqlDriver
+from griptape.tools.sql_client.table_profiler import profile_table, _column_aggregates, _sample
+
+
+class TestTableProfiler:
+    @pytest.fixture
+    def driver(self, tmp_path):
+        driver = SqlDriver(engine_url=f"sqlite:///{tmp_path / 'test.db'}")
+
+        driver.execute_query('CREATE TABLE "my table" (id INTEGER PRIMARY KEY, "long text" TEXT);')
+        driver.execute_query(f"""INSERT INTO "my table" ("long text") VALUES ('{"x" * 100}'), (NULL);""")
+
+        return driver
+
+    def test_profile_table(self, driver):
+        profile = profile_table(driver.engine, "my table", [("id", "INTEGER"), ("long text", "TEXT")], sample_size=1)
+
+        assert profile.splitlines() == [
+            "table my table: 2 rows",
+            "column,type,null_rate,distinct,min,max,mean",
+            "id,INTEGER,0,2,1,2,1.5",
+            f"long text,TEXT,0.5,1,{'x' * 37}...,{'x' * 37}...,",
+            "random sample of 1 rows:",
+            "id,long text",
+            profile.splitlines()[-1]
+        ]
+
+    def test_profile_table_options(self, driver):
+        profile = profile_table(
+            driver.engine, "my table", [("id", "INTEGER")], sample_size=0, distinct_counts=False
+        )
+
+        assert profile.splitlines() == [
+            "table my table: 2 rows",
+            "column,type,null_rate,distinct,min,max,mean",
+            "id,INTEGER,0,,1,2,1.5"
+        ]
+
+    def test_column_aggregates(self):
+        assert _column_aggregates('"flag"', "boolean", "postgresql", True) == [
+            'COUNT("flag")', 'COUNT(DISTINCT "flag")', "NULL", "NULL", "NULL"
+        ]
+        assert _column_aggregates('"data"', "json", "postgresql", True) == [
+            'COUNT("data")', "NULL", "NULL", "NULL", "NULL"
+        ]
+        assert _column_aggregates('"tags"', "ARRAY", "postgresql", True)[1:4] == ["NULL", "NULL", "NULL"]
+        assert _column_aggregates('"created"', "timestamp without time zone", "postgresql", True)[2] == 'MIN("created")'
+        assert _column_aggregates('"data"', "", "sqlite", True)[1:4] == [
+            'COUNT(DISTINCT "data")', 'MIN("data")', 'MAX("data")'
+        ]
+
+    def test_sample(self, mocker):
+        connection = mocker.MagicMock()
+        connection.execute.return_value.fetchall.return_value = [(1,), (2,)]
+
+        _sample(connection, '"foo"', "postgresql", 2, 1000)
+
+        assert [str(c.args[0]) for c in connection.execute.call_args_list] == [
+            'SELECT * FROM "foo" TABLESAMPLE SYSTEM (2.000000) LIMIT 2'
+        ]
+
+        # samples that come up short fall back to a random row filter and then to the first rows
+        connection.execute.reset_mock()
+        connection.execute.return_value.fetchall.return_value = [(1,)]
+
+        _, _, random_sample = _sample(connection, '"foo"', "postgresql", 2, 1000)
+
+        assert [str(c.args[0]) for c in connection.execute.call_args_list][1:] == [
+            'SELECT * FROM "foo" WHERE RANDOM() < 0.004000 LIMIT 2',
+            'SELECT * FROM "foo" LIMIT 2'
+        ]
+        assert not random_sample
+
+    def test_sample_dialects(self, mocker):
+        connection = mocker.MagicMock()
+        connection.execute.return_value.fetchall.return_value = [(1,), (2,)]
+
+        def first_query(dialect: str, row_count: int = 1000) -> str:
+            connection.execute.reset_mock()
+
+            _sample(connection, '"foo"', dialect, 2, row_count)
+
+            return str(connection.execute.call_args_list[0].args[0])
+
+        assert first_query("mysql") == 'SELECT * FROM "foo" WHERE RAND() < 0.004000 LIMIT 2'
+        assert first_query("snowflake") == 'SELECT * FROM "foo" SAMPLE (2 ROWS)'
+        assert first_query("oracle").startswith('SELECT * FROM "foo" SAMPLE BLOCK (2.000000)')
+        assert first_query("mssql", 10) == 'SELECT TOP 2 * FROM "foo" ORDER BY NEWID()'
+        assert first_query("foo") == 'SELECT * FROM "foo" LIMIT 2'
+
+    def test_sample_sqlite(self, tmp_path):
+        driver = SqlDriver(engine_url=f"sqlite:///{tmp_path / 'large.db'}")
+
+        driver.execute_query("CREATE TABLE foo (id INTEGER PRIMARY KEY);")
+        driver.execute_query("INSERT INTO foo (id) VALUES " + ", ".join(f"({i})" for i in range(1, 1001)) + ";")
+
+        with driver.engine.connect() as connection:
+            samples = [_sample(connection, "foo", "sqlite", 5, 1000) for _ in range(3)]
+
+        assert all(random_sample and len(rows) == 5 for _, rows, random_sample in samples)
+        # the first rows would be the same every time
+        assert len({tuple(rows) for _, rows, _ in samples}) > 1
+
+    def test_profile_table_first_rows(self, driver, mocker):
+        mocker.patch("griptape.tools.sql_client.table_profiler.RANDOM_FUNCTIONS", {})
+
+        profile = profile_table(driver.engine, "my table", [("id", "INTEGER")], sample_size=1)
+
+        assert profile.splitlines()[3:] == ["first 1 rows:", "id,long text", f"1,{'x' * 37}..."]
+
+    def test_profile_table_timeout(self, driver, mocker):
+        from sqlalchemy.exc import OperationalError
+
+        # a huge table is stood in for by a view that never ends
+        driver.execute_query(
+            "CREATE VIEW slow AS WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT x FROM c;"
+        )
+
+        with pytest.raises(OperationalError):
+            profile_table(driver.engine, "slow", [("x", "")], timeout=0.2)
@@ -0,0 +1,53 @@
+import json
+import subprocess
+import sys
+import pytest
+from griptape.tools import ToolRegistry, Calculator
+
+
+class TestToolRegistry:
+    @pytest.fixture
+    def registry(self, tmp_path):
+        return ToolRegistry(cache_path=str(tmp_path / "registry.json"))
+
+    def test_list_tools(self, registry):
+        manifests = {m.class_name: m for m in registry.list_tools()}
+
+        assert len(manifests) == 16
+        assert manifests["WebScraper"].name == "Web Scraper"
+        assert manifests["WebScraper"].module_path == "griptape.tools.web_scraper.tool"
+        assert manifests["WebScraper"].requirements == ["trafilatura>=1.6"]
+        assert manifests["Calculator"].requirements == []
+
+    def test_get_manifest(self, registry):
+        assert registry.get_manifest("SqlClient").description == "Tool for executing SQL queries."
+
+        with pytest.raises(ValueError):
+            registry.get_manifest("Foo")
+
+    def test_create_tool(self, registry):
+        assert registry.load_tool_class("Calculator") is Calculator
+        assert isinstance(registry.create_tool("Calculator", install_dependencies_on_init=False), Calculator)
+
+    def test_cache(self, registry, mocker):
+        registry.list_tools()
+
+        with open(registry.cache_path, "r") as cache_file:
+            assert len(json.load(cache_file)["tools"]) == 16
+
+        new_registry = ToolRegistry(cache_path=registry.cache_path)
+        parse_spy = mocker.spy(ToolRegistry, "_parse_tool_dir")
+
+        assert {m.class_name for m in new_registry.list_tools()} == {m.class_name for m in registry.list_tools()}
+        assert parse_spy.call_count == 0
+
+    def test_list_tools_without_importing(self):
+        script = (
+            "import sys\n"
+            "from griptape.tools import ToolRegistry\n"
+            "ToolRegistry().list_tools()\n"
+            "print(any(m.startswith('griptape.tools.') and m.endswith('.tool') for m in sys.modules))"
+        )
+        output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+
+        assert output.strip() == "False"
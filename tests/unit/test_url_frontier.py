@@ -0,0 +1,44 @@
+import time
+from griptape.tools.web_scraper.url_frontier import normalize_url, BloomFilter, UrlFrontier
+
+
+class TestUrlFrontier:
+    def test_normalize_url(self):
+        assert normalize_url("HTTPS://Foo.com:443/a/./b/../c?b=2&a=1&utm_source=x#frag") == "https://foo.com/a/c?a=1&b=2"
+        assert normalize_url("http://foo.com") == "http://foo.com/"
+        assert normalize_url("http://foo.com:8080/bar/") == "http://foo.com:8080/bar/"
+        assert normalize_url("../baz", "https://foo.com/a/b/c") == "https://foo.com/a/baz"
+        assert normalize_url("mailto:foo@bar.com") is None
+        assert normalize_url("javascript:void(0)") is None
+
+    def test_bloom_filter(self):
+        bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+
+        assert bloom_filter.add("foo")
+        assert not bloom_filter.add("foo")
+        assert "foo" in bloom_filter
+        assert sum(f"bar{i}" in bloom_filter for i in range(1000)) < 50
+
+    def test_add(self):
+        frontier = UrlFrontier(max_size=2, allowed_hosts={"foo.com"})
+
+        assert frontier.add("https://foo.com/a", 0) == "https://foo.com/a"
+        assert frontier.add("https://foo.com/a#bar", 1) is None
+        assert frontier.add("https://bar.com/a", 1) is None
+        assert frontier.add("/b", 1, base_url="https://foo.com/a") == "https://foo.com/b"
+        assert frontier.add("https://foo.com/c", 1) is None
+        assert frontier.pop(5) == [("https://foo.com/a", 0), ("https://foo.com/b", 1)]
+        assert len(frontier) == 0
+
+    def test_wait_for_host(self):
+        frontier = UrlFrontier(politeness_delay=0.1)
+        start = time.monotonic()
+
+        frontier.wait_for_host("https://foo.com/a")
+        frontier.wait_for_host("https://bar.com/a")
+
+        assert time.monotonic() - start < 0.1
+
+        frontier.wait_for_host("https://foo.com/b")
+
+        assert time.monotonic() - start >= 0.1
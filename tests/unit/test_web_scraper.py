@@ -1,5 +1,8 @@
+import json
+import threading
+import time
 import pytest
-from griptape.artifacts import BaseArtifact
+from griptape.artifacts import BaseArtifact, TextArtifact, ErrorArtifact
 
 
 class TestWebScraper:
@@ -18,3 +21,441 @@ class TestWebScraper:
         assert isinstance(scraper.get_author({
             "values": {"url": "https://github.com/griptape-ai/griptape-tools"}
         }), BaseArtifact)
+
+    def test_get_contents(self, scraper, mocker):
+        def load_content(url, deadline=None):
+            if "bad" in url:
+                return ErrorArtifact("error: can't access URL")
+            else:
+                return [TextArtifact(f"{url} 1"), TextArtifact(f"{url} 2")]
+
+        mocker.patch.object(scraper.__class__, "_load_content", side_effect=load_content)
+
+        result = scraper.get_contents({
+            "values": {"urls": ["https://foo.com/1", "https://bad.com", "https://bar.com/1"]}
+        })
+
+        assert [a.value for a in result] == [
+            "https://foo.com/1 1",
+            "https://foo.com/1 2",
+            "https://bad.com: error: can't access URL",
+            "https://bar.com/1 1",
+            "https://bar.com/1 2"
+        ]
+        assert isinstance(result[2], ErrorArtifact)
+        assert result[0].name == "https://foo.com/1"
+
+    def test_get_contents_concurrency(self, mocker):
+        from griptape.tools import WebScraper
+
+        scraper = WebScraper(max_concurrency=4, max_concurrency_per_host=1, install_dependencies_on_init=False)
+        lock = threading.Lock()
+        active = {"total": 0, "max_total": 0, "foo.com": 0, "max_foo.com": 0}
+
+        def load_content(url, deadline=None):
+            with lock:
+                active["total"] += 1
+                active["max_total"] = max(active["max_total"], active["total"])
+
+                if "foo.com" in url:
+                    active["foo.com"] += 1
+                    active["max_foo.com"] = max(active["max_foo.com"], active["foo.com"])
+
+            time.sleep(0.05)
+
+            with lock:
+                active["total"] -= 1
+
+                if "foo.com" in url:
+                    active["foo.com"] -= 1
+
+            return [TextArtifact(url)]
+
+        mocker.patch.object(WebScraper, "_load_content", side_effect=load_content)
+
+        urls = [f"https://foo.com/{i}" for i in range(3)] + [f"https://bar{i}.com" for i in range(6)]
+        result = scraper.get_contents({"values": {"urls": urls}})
+
+        assert [a.value for a in result] == urls
+        assert active["max_foo.com"] == 1
+        assert 1 < active["max_total"] <= 4
+
+    def test_page_cache(self, mocker, tmp_path):
+        from griptape.tools import WebScraper
+        from griptape.tools.web_scraper import PageCache
+        from griptape.tools.web_scraper.page_cache import PageDownload
+
+        scraper = WebScraper(page_cache=PageCache(cache_dir=str(tmp_path)), install_dependencies_on_init=False)
+        download = mocker.patch.object(WebScraper, "_download_page", return_value=PageDownload(
+            status=200,
+            content=b"<html><head><meta name='author' content='Foo Bar'></head>"
+                    b"<body><article><p>" + b"foo bar " * 50 + b"</p></article></body></html>"
+        ))
+        extract = mocker.spy(WebScraper, "_extract_page")
+
+        assert scraper.get_author({"values": {"url": "https://foo.com"}}).value == "Foo Bar"
+        assert scraper.get_author({"values": {"url": "https://foo.com"}}).value == "Foo Bar"
+        assert download.call_count == 1
+        assert extract.call_count == 1
+        assert scraper.page_cache.stats["extraction_hits"] == 1
+
+    def test_page_cache_expired_page(self, mocker, tmp_path):
+        from griptape.tools import WebScraper
+        from griptape.tools.web_scraper import PageCache
+        from griptape.tools.web_scraper.page_cache import PageDownload
+
+        scraper = WebScraper(
+            page_cache=PageCache(cache_dir=str(tmp_path), page_ttl=0), install_dependencies_on_init=False
+        )
+        download = mocker.patch.object(
+            WebScraper, "_download_page", return_value=PageDownload(status=200, content=b"price: 10")
+        )
+        extract = mocker.patch.object(
+            WebScraper, "_extract_page", side_effect=lambda page: json.dumps({"text": page.decode()})
+        )
+
+        assert scraper._load_page("https://foo.com") == {"text": "price: 10"}
+
+        download.return_value = PageDownload(status=304)
+
+        # the page is revalidated once it expires, while its unchanged extraction is reused
+        assert scraper._load_page("https://foo.com") == {"text": "price: 10"}
+        assert extract.call_count == 1
+
+        download.return_value = PageDownload(status=200, content=b"price: 12")
+
+        assert scraper._load_page("https://foo.com") == {"text": "price: 12"}
+        assert download.call_count == 3
+        assert extract.call_count == 2
+
+    def test_extraction_processes(self, mocker):
+        from griptape.tools import WebScraper
+
+        mocker.patch.object(
+            WebScraper,
+            "_fetch_page",
+            return_value=b"<html><head><meta name='author' content='Foo Bar'></head>"
+                         b"<body><article><p>" + b"foo bar " * 50 + b"</p></article></body></html>"
+        )
+
+        with WebScraper(extraction_processes=1, install_dependencies_on_init=False) as scraper:
+            assert scraper.get_author({"values": {"url": "https://foo.com"}}).value == "Foo Bar"
+
+            processes = list(scraper._extraction_executor._processes.values())
+
+        # the worker processes are shut down when the scraper is closed
+        assert scraper._extraction_executor is None
+        assert processes and not any(process.is_alive() for process in processes)
+
+    def test_extraction_processes_crash(self, mocker):
+        from concurrent import futures
+        from concurrent.futures.process import BrokenProcessPool
+        from griptape.tools import WebScraper
+
+        scraper = WebScraper(extraction_processes=1, install_dependencies_on_init=False)
+        broken_future = futures.Future()
+        broken_executor = mocker.Mock()
+
+        broken_future.set_exception(BrokenProcessPool())
+        broken_executor.submit.return_value = broken_future
+
+        mocker.patch.object(WebScraper, "_fetch_page", return_value=b"<html></html>")
+        mocker.patch.object(WebScraper, "_get_extraction_executor", return_value=broken_executor)
+
+        result = scraper.get_author({"values": {"url": "https://foo.com"}})
+
+        scraper.close()
+
+        assert isinstance(result, ErrorArtifact)
+        assert result.value == "error: web page extraction worker crashed"
+        broken_executor.shutdown.assert_called_once()
+
+    def test_max_download_size(self):
+        import http.server
+        import threading
+        from griptape.tools import WebScraper
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.end_headers()
+                self.wfile.write(b"<html><body><article><p>" + b"foo bar " * 100000 + b"</p></article></body></html>")
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        try:
+            scraper = WebScraper(max_download_size=1000, install_dependencies_on_init=False)
+            response = scraper._download_page(f"http://127.0.0.1:{server.server_port}", {})
+
+            assert response.status == 200
+            assert len(response.content) == 1001
+        finally:
+            server.shutdown()
+
+    def test_default_max_download_size(self):
+        from griptape.tools import WebScraper
+
+        assert WebScraper(install_dependencies_on_init=False).max_download_size == 20 * 1024 * 1024
+
+    def test_http_pool_shared_across_threads(self, mocker):
+        from concurrent import futures
+        from griptape.tools import WebScraper
+
+        pool_manager = mocker.patch("urllib3.PoolManager", side_effect=lambda **kwargs: time.sleep(0.05) or object())
+        scraper = WebScraper(install_dependencies_on_init=False)
+
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            pools = list(executor.map(lambda _: scraper._get_http_pool(), range(4)))
+
+        assert pool_manager.call_count == 1
+        assert all(pool is pools[0] for pool in pools)
+
+    def test_iter_content_streaming(self, mocker):
+        from griptape.loaders import TextLoader
+        from griptape.tools import WebScraper
+
+        scraper = WebScraper(streaming=True, max_download_size=10, install_dependencies_on_init=False)
+        text = "\n".join(f"paragraph {i}" for i in range(5000))
+
+        mocker.patch.object(WebScraper, "_load_page", return_value={"text": text, "truncated": True})
+        mocker.patch.object(
+            TextLoader,
+            "text_to_artifacts",
+            side_effect=lambda t: [TextArtifact(t[i:i + 1000]) for i in range(0, len(t), 1000)]
+        )
+
+        content = scraper.iter_content("https://foo.com")
+        artifacts = list(content)
+
+        assert not isinstance(content, list)
+        assert "".join(a.value for a in artifacts[:-1]) == text
+        assert artifacts[-1].value == "[content truncated: page exceeds the 10 byte download limit]"
+
+    def test_iter_content_streaming_matches_get_content(self, mocker):
+        from griptape.tokenizers import TiktokenTokenizer
+        from griptape.tools import WebScraper
+
+        # one token per word, so that the real chunker runs without downloading an encoding
+        mocker.patch.object(TiktokenTokenizer, "token_count", lambda self, text: len(text.split()))
+
+        text = "\n".join(" ".join(f"word{i}x{j}" for j in range(i % 13 + 1)) for i in range(4000))
+        page = {"text": text}
+        chunks = list(WebScraper(install_dependencies_on_init=False)._iter_text_chunks(page))
+        streamed_chunks = list(WebScraper(streaming=True, install_dependencies_on_init=False)._iter_text_chunks(page))
+
+        assert len(streamed_chunks) > 1
+        assert " ".join(c.value for c in streamed_chunks).split() == " ".join(c.value for c in chunks).split()
+
+    def test_crawl(self, mocker):
+        from griptape.loaders import TextLoader
+        from griptape.tools import WebScraper
+
+        scraper = WebScraper(crawl_politeness_delay=0, crawl_max_depth=2, install_dependencies_on_init=False)
+        site = {
+            "https://foo.com/": "home [a](/a) [b](https://foo.com/b#top) [ext](https://bar.com/)",
+            "https://foo.com/a": "a [b](/b) [c](c)",
+            "https://foo.com/b": "b [d](/d)",
+            "https://foo.com/c": "c [home](/)",
+        }
+
+        mocker.patch.object(
+            WebScraper,
+            "_load_page",
+            side_effect=lambda url: {"text": site[url]} if url in site else ErrorArtifact("error: can't access URL")
+        )
+        mocker.patch.object(TextLoader, "text_to_artifacts", side_effect=lambda t: [TextArtifact(t)])
+
+        result = scraper.crawl({"values": {"url": "https://FOO.com"}})
+
+        assert [a.name for a in result] == ["https://foo.com/", "https://foo.com/a", "https://foo.com/b",
+                                           "https://foo.com/c", "https://foo.com/d"]
+        assert isinstance(result[-1], ErrorArtifact)
+
+        result = scraper.crawl({"values": {"url": "https://foo.com", "max_depth": 1, "max_pages": 2}})
+
+        assert [a.name for a in result] == ["https://foo.com/", "https://foo.com/a"]
+
+    def test_near_duplicate_index(self, mocker):
+        from griptape.loaders import TextLoader
+        from griptape.tools import WebScraper
+        from griptape.tools.web_scraper import NearDuplicateIndex
+        from griptape.artifacts import InfoArtifact
+
+        scraper = WebScraper(near_duplicate_index=NearDuplicateIndex(), install_dependencies_on_init=False)
+        text = " ".join(f"word{i}" for i in range(200))
+        pages = {
+            "https://foo.com": {"text": text},
+            "https://mirror.foo.com": {"text": text + " mirrored"},
+            "https://bar.com": {"text": " ".join(f"other{i}" for i in range(100)) + "\n" + text}
+        }
+
+        mocker.patch.object(WebScraper, "_load_page", side_effect=lambda url, **_: pages[url])
+        mocker.patch.object(
+            TextLoader, "text_to_artifacts", side_effect=lambda t: [TextArtifact(p) for p in t.split("\n")]
+        )
+
+        assert len(scraper.get_content({"values": {"url": "https://foo.com"}})) == 1
+        assert len(scraper.get_content({"values": {"url": "https://foo.com"}})) == 1
+        assert isinstance(scraper.get_content({"values": {"url": "https://mirror.foo.com"}}), InfoArtifact)
+        assert [a.value for a in scraper.get_content({"values": {"url": "https://bar.com"}})] == [
+            " ".join(f"other{i}" for i in range(100))
+        ]
+
+    def test_ingest(self, mocker):
+        from griptape.drivers import LocalVectorStoreDriver
+        from griptape.engines import VectorQueryEngine
+        from griptape.loaders import TextLoader
+        from griptape.memory.tool import TextToolMemory
+        from griptape.tools import WebScraper
+        from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+        memory = TextToolMemory(
+            query_engine=VectorQueryEngine(
+                vector_store_driver=LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+            )
+        )
+        scraper = WebScraper(input_memory=[memory], install_dependencies_on_init=False)
+
+        mocker.patch.object(
+            WebScraper, "_fetch_page", side_effect=lambda url: None if "bad" in url else f"<html>{url}</html>".encode()
+        )
+        mocker.patch.object(WebScraper, "_extract_page", side_effect=lambda page: '{"text": "foo\\nbar"}')
+        mocker.patch.object(
+            TextLoader, "text_to_artifacts", side_effect=lambda t: [TextArtifact(p) for p in t.split("\n")]
+        )
+
+        urls = [f"https://foo.com/{i}" for i in range(20)] + ["https://bad.com"]
+        result = scraper.ingest({"values": {"memory_id": memory.id, "artifact_namespace": "foo", "urls": urls}})
+        entries = memory.query_engine.vector_store_driver.load_entries("foo")
+
+        assert len(entries) == 40
+        assert result.value.startswith("ingested 40 chunks from 20 pages into namespace foo")
+        assert "fetch: 21 items" in result.value
+        assert "https://bad.com: error: can't access URL" in result.value
+
+    def test_ingest_memory_not_found(self):
+        from griptape.tools import WebScraper
+
+        scraper = WebScraper(install_dependencies_on_init=False)
+
+        assert isinstance(
+            scraper.ingest({"values": {"memory_id": "foo", "artifact_namespace": "foo", "urls": []}}), ErrorArtifact
+        )
+
+    def test_get_content_changes(self, mocker):
+        from griptape.artifacts import InfoArtifact
+        from griptape.loaders import TextLoader
+        from griptape.tools import WebScraper
+
+        scraper = WebScraper(install_dependencies_on_init=False)
+        page = {"text": "price: 10\nchangelog v1"}
+
+        mocker.patch.object(WebScraper, "_fetch_page", return_value=b"<html></html>")
+        mocker.patch.object(WebScraper, "_parse_page", side_effect=lambda url, _: dict(page))
+        mocker.patch.object(TextLoader, "text_to_artifacts", side_effect=lambda t: [TextArtifact(t)])
+
+        assert scraper.get_content_changes({"values": {"url": "https://foo.com"}})[0].value == "price: 10\nchangelog v1"
+        assert scraper.get_content_changes({"values": {"url": "https://foo.com"}}).value == \
+               "page is unchanged since the last visit"
+
+        page["text"] = "price: 12\nchangelog v1\nchangelog v2"
+
+        assert scraper.get_content_changes({"values": {"url": "https://foo.com"}})[0].value == "price: 12\nchangelog v2"
+
+        page["text"] = "price: 12"
+
+        result = scraper.get_content_changes({"values": {"url": "https://foo.com"}})
+
+        assert isinstance(result, InfoArtifact)
+        assert result.value == "no new content; 2 paragraphs were removed since the last visit"
+
+    def test_get_content_changes_page_cache(self, mocker, tmp_path):
+        from griptape.loaders import TextLoader
+        from griptape.tools import WebScraper
+        from griptape.tools.web_scraper import PageCache
+        from griptape.tools.web_scraper.page_cache import PageDownload
+
+        scraper = WebScraper(page_cache=PageCache(cache_dir=str(tmp_path)), install_dependencies_on_init=False)
+        download = mocker.patch.object(
+            WebScraper, "_download_page", return_value=PageDownload(status=200, content=b"price: 10")
+        )
+
+        mocker.patch.object(WebScraper, "_extract_page", side_effect=lambda page: json.dumps({"text": page.decode()}))
+        mocker.patch.object(TextLoader, "text_to_artifacts", side_effect=lambda t: [TextArtifact(t)])
+
+        # warms the page cache
+        scraper.get_content({"values": {"url": "https://foo.com"}})
+        scraper.get_content_changes({"values": {"url": "https://foo.com"}})
+
+        download.return_value = PageDownload(status=200, content=b"price: 12")
+
+        assert scraper.get_content_changes({"values": {"url": "https://foo.com"}})[0].value == "price: 12"
+        # the cached page and extraction are refreshed too
+        assert scraper.get_content({"values": {"url": "https://foo.com"}})[0].value == "price: 12"
+        assert download.call_count == 3
+
+    def test_iter_archive_content(self, mocker, tmp_path):
+        from griptape.loaders import TextLoader
+        from griptape.tools import WebScraper
+
+        scraper = WebScraper(archive_queue_size=2, install_dependencies_on_init=False)
+
+        for i in range(5):
+            (tmp_path / f"{i}.html").write_bytes(b"" if i == 3 else f"page {i}".encode())
+
+        mocker.patch(
+            "griptape.tools.web_scraper.tool.extract_page",
+            side_effect=lambda page, _: json.dumps({"text": page.decode()}) if page else None
+        )
+        chunking_threads = []
+
+        def text_to_artifacts(text):
+            chunking_threads.append(threading.current_thread())
+
+            return [TextArtifact(text)]
+
+        mocker.patch.object(TextLoader, "text_to_artifacts", side_effect=text_to_artifacts)
+        fetch_page = mocker.spy(WebScraper, "_fetch_page")
+
+        artifacts = list(scraper.iter_archive_content(str(tmp_path)))
+
+        assert [a.value for a in artifacts] == [
+            "page 0",
+            "page 1",
+            "page 2",
+            f"{(tmp_path / '3.html').as_uri()}: error: can't load web page content",
+            "page 4"
+        ]
+        assert artifacts[0].name == (tmp_path / "0.html").as_uri()
+        assert fetch_page.call_count == 0
+        # pages are chunked on the workers together with their extraction
+        assert len(chunking_threads) == 4
+        assert threading.main_thread() not in chunking_threads
+
+    def test_iter_archive_content_extraction_processes(self, mocker, tmp_path):
+        from concurrent import futures
+        from griptape.tools import WebScraper
+
+        (tmp_path / "0.html").write_bytes(b"page 0")
+
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        submit = mocker.spy(executor, "submit")
+
+        mocker.patch.object(WebScraper, "_get_extraction_executor", return_value=executor)
+        extract_and_chunk_page = mocker.patch(
+            "griptape.tools.web_scraper.tool.extract_and_chunk_page", return_value=('{"text": "page 0"}', ["page 0"])
+        )
+
+        with WebScraper(extraction_processes=2, install_dependencies_on_init=False) as scraper:
+            artifacts = list(scraper.iter_archive_content(str(tmp_path)))
+
+        executor.shutdown()
+
+        assert [a.value for a in artifacts] == ["page 0"]
+        # extraction and chunking run in the worker processes
+        assert submit.call_args.args == (extract_and_chunk_page, b"page 0", True)
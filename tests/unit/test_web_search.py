@@ -1,10 +1,224 @@
-from griptape.artifacts import BaseArtifact
+import time
+import pytest
+from griptape.artifacts import BaseArtifact, ErrorArtifact, TextArtifact
 from griptape.tools import WebSearch
+from griptape.tools.web_search import GoogleSearchDriver, LocalIndexSearchDriver
 
 
 class TestWebSearch:
+    @pytest.fixture
+    def session(self, mocker):
+        def get(url, params, headers):
+            start = params["start"]
+            response = mocker.Mock(status_code=200)
+
+            if start == 21:
+                response.status_code = 500
+                response.reason = "Internal Server Error"
+
+            # later pages repeat the last result of the page before them
+            first = start - 1 if start > 1 else start
+            response.json.return_value = {
+                "items": [
+                    {"link": f"https://foo.com/{i}", "title": f"foo {i}", "snippet": "bar"}
+                    for i in range(first, first + int(params["num"]))
+                ]
+            }
+
+            return response
+
+        session = mocker.Mock()
+        session.get.side_effect = get
+
+        mocker.patch.object(GoogleSearchDriver, "_get_session", return_value=session)
+
+        return session
+
     def test_search(self):
         tool = WebSearch(google_api_key="foo", google_api_search_id="bar")
 
         assert isinstance(tool.search({"values": {"query": "foo bar"}}), BaseArtifact)
-        
\ No newline at end of file
+
+    def test_search_single_page(self, session):
+        tool = WebSearch(results_count=3, google_api_key="foo", google_api_search_id="bar")
+        result = tool.search({"values": {"query": "foo bar"}})
+
+        assert len(result) == 3
+        assert session.get.call_count == 1
+
+    def test_search_multiple_pages(self, session):
+        tool = WebSearch(results_count=15, google_api_key="foo", google_api_search_id="bar")
+        result = tool.search({"values": {"query": "foo bar"}})
+
+        assert session.get.call_count == 2
+        assert all(isinstance(a, TextArtifact) for a in result)
+        assert [eval(a.value)["url"] for a in result] == [f"https://foo.com/{i}" for i in range(1, 16)]
+
+    def test_search_partial_results(self, session):
+        tool = WebSearch(results_count=30, google_api_key="foo", google_api_search_id="bar")
+        result = tool.search({"values": {"query": "foo bar"}})
+
+        assert session.get.call_count == 3
+        assert len([a for a in result if isinstance(a, TextArtifact)]) == 19
+        assert isinstance(result[-1], ErrorArtifact)
+        assert result[-1].value.startswith("error searching Google, results are incomplete: results 21-30")
+
+    def test_search_results_count_cap(self, session):
+        tool = WebSearch(results_count=500, google_api_key="foo", google_api_search_id="bar")
+
+        tool.search({"values": {"query": "foo bar"}})
+
+        assert session.get.call_count == 10
+
+    def test_search_request(self, session):
+        tool = WebSearch(google_api_key="foo", google_api_search_id="bar")
+
+        tool.search({"values": {"query": "foo & bar?"}})
+
+        kwargs = session.get.call_args.kwargs
+
+        assert kwargs["params"]["q"] == "foo & bar?"
+        assert kwargs["params"]["fields"] == "items(link,title,snippet)"
+        assert "gzip" in kwargs["headers"]["Accept-Encoding"]
+
+    def test_search_many(self, mocker):
+        tool = WebSearch(results_count=3, google_api_key="foo", google_api_search_id="bar")
+        results = {
+            "a": [{"url": "https://foo.com/1"}, {"url": "https://foo.com/2"}, {"url": "https://foo.com/3"}],
+            "b": [{"url": "https://foo.com/4"}, {"url": "https://foo.com/3"}, {"url": "https://foo.com/2"}],
+            "c": [{"url": "https://foo.com/5"}]
+        }
+
+        mocker.patch.object(WebSearch, "_search", side_effect=lambda query: (results[query], []))
+
+        result = tool.search_many({"values": {"queries": ["a", "b", "c", "a"]}})
+
+        assert [eval(a.value)["url"] for a in result] == ["https://foo.com/2", "https://foo.com/3", "https://foo.com/1"]
+
+    def test_search_many_max_concurrency(self, mocker):
+        import threading
+
+        tool = WebSearch(max_concurrency=2, google_api_key="foo", google_api_search_id="bar")
+        lock = threading.Lock()
+        active = {"current": 0, "max": 0}
+
+        def search(query):
+            with lock:
+                active["current"] += 1
+                active["max"] = max(active["max"], active["current"])
+
+            time.sleep(0.05)
+
+            with lock:
+                active["current"] -= 1
+
+            return [{"url": f"https://foo.com/{query}"}], []
+
+        mocker.patch.object(WebSearch, "_search", side_effect=search)
+
+        result = tool.search_many({"values": {"queries": [str(i) for i in range(10)]}})
+
+        assert len(result) == 5
+        assert active["max"] == 2
+
+    def test_search_many_partial_results(self, mocker):
+        tool = WebSearch(google_api_key="foo", google_api_search_id="bar")
+
+        def search_google(query):
+            if query == "b":
+                raise Exception("timeout")
+            else:
+                return [{"url": "https://foo.com/1"}], []
+
+        mocker.patch.object(WebSearch, "_search", side_effect=search_google)
+
+        result = tool.search_many({"values": {"queries": ["a", "b"]}})
+
+        assert isinstance(result[0], TextArtifact)
+        assert result[1].value == "error searching Google, results are incomplete: b: timeout"
+
+        mocker.patch.object(WebSearch, "_search", side_effect=Exception("timeout"))
+
+        assert isinstance(tool.search_many({"values": {"queries": ["a", "b"]}}), ErrorArtifact)
+
+    def test_search_cache(self, session):
+        from griptape.tools.web_search import SearchCache
+
+        tool = WebSearch(search_cache=SearchCache(), google_api_key="foo", google_api_search_id="bar")
+
+        tool.search({"values": {"query": "Foo bar"}})
+        tool.search({"values": {"query": "foo  bar?"}})
+
+        assert session.get.call_count == 1
+        assert tool.search_cache.stats["hits"] == 1
+
+    def test_search_and_fetch(self, mocker):
+        import http.server
+        import json
+        import threading
+        from griptape.loaders import TextLoader
+        from griptape.tools import WebScraper
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/3":
+                    self.send_response(404)
+                    self.end_headers()
+
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.end_headers()
+
+                if self.path == "/2":
+                    # the body arrives after the fetch timeout
+                    time.sleep(1)
+
+                self.wfile.write(f"content of {self.path}".encode())
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+        scraper = WebScraper(max_concurrency=2, install_dependencies_on_init=False)
+        tool = WebSearch(
+            web_scraper=scraper, page_fetch_timeout=0.3, google_api_key="foo", google_api_search_id="bar"
+        )
+        results = [{"url": f"{base_url}/{i}", "title": "foo", "description": "bar"} for i in range(1, 5)]
+
+        mocker.patch.object(WebSearch, "_search", return_value=(results, []))
+        mocker.patch.object(WebScraper, "_extract_page", side_effect=lambda page: json.dumps({"text": page.decode()}))
+        mocker.patch.object(TextLoader, "text_to_artifacts", side_effect=lambda t: [TextArtifact(t)])
+        load_content = mocker.spy(WebScraper, "_load_content")
+
+        try:
+            start = time.perf_counter()
+            result = tool.search_and_fetch({"values": {"query": "foo"}})
+
+            assert time.perf_counter() - start < 1
+        finally:
+            server.shutdown()
+
+        assert [a.name for a in result] == [f"{base_url}/{i}" for i in range(1, 5)]
+        assert result[0].value == "content of /1"
+        # the slow page, the missing page, and the page past fetch_results_count only have their snippets
+        assert [eval(a.value)["description"] for a in result[1:]] == ["bar", "bar", "bar"]
+        assert load_content.call_count == 3
+
+    def test_search_driver(self, tmp_path):
+        driver = LocalIndexSearchDriver(path=str(tmp_path / "index.db"))
+        tool = WebSearch(search_driver=driver)
+
+        driver.add_documents([{"url": "https://foo.com/1", "title": "foo", "text": "foo bar baz"}])
+
+        result = tool.search({"values": {"query": "bar"}})
+
+        assert eval(result[0].value)["url"] == "https://foo.com/1"
+
+    def test_search_driver_required(self):
+        with pytest.raises(ValueError):
+            WebSearch()